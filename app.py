@@ -1,34 +1,89 @@
-import os
-from dotenv import load_dotenv
 import streamlit as st
-import zipfile
-import io
-import json
+import logging
+import os
+import tempfile
+import time
+import uuid
 from datetime import datetime
-from openai import AzureOpenAI
-
-# 환경 변수 로드
-load_dotenv()
-
-# 설정
-CONFIG = {
-    "endpoint": os.getenv("AZURE_ENDPOINT"),
-    "model_name": "gpt-4.1",
-    "deployment_name": os.getenv("DEPLOYMENT_NAME"),
-    "api_key": os.getenv("OPENAI_API_KEY"),
-    "api_version": os.getenv("OPENAI_API_VERSION", "2024-12-01-preview"),
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import conversion_core
+from conversion_core import (
+    STATUS_ERROR,
+    STATUS_OK,
+    STATUS_PARSE_FAILED,
+    STATUS_RATE_LIMITED,
+    STATUS_SYNTAX_ERROR,
+    STATUS_TRUNCATED,
+    CONFIG,
+    analysis_cache_key,
+    analyze_csharp_code,
+    convert_csharp_to_java,
+    extract_streaming_field,
+    get_analysis_cache,
+    get_conversion_cache,
+    get_http_pool_stats,
+    get_parse_stats,
+    get_prompt_cache_stats,
+    get_syntax_stats,
+    get_telemetry,
+    test_connection,
+)
+from conversion_engine import set_call_tags
+from conversion_jobs import ACTIVE_STATUSES, JOB_COMPLETED, get_job_manager
+from llm_cache import make_cache_key
+from project_archive import ProjectArchive, write_java_only_zip, write_project_zip
+
+# 다운로드 ZIP 을 메모리에 둘 최대 크기 (넘으면 임시 파일로 전환)
+PACKAGE_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+# 변환 작업 진행 상황 갱신 주기 (초)
+JOB_POLL_INTERVAL_SECONDS = 0.5
+
+JOB_STATUS_LABELS = {
+    "queued": "대기 중",
+    "running": "변환 중",
+    "completed": "완료",
+    "failed": "실패",
+    "interrupted": "중단됨",
 }
 
-# Azure OpenAI 클라이언트 설정
-client = AzureOpenAI(
-    api_version=CONFIG["api_version"],
-    azure_endpoint=CONFIG["endpoint"],
-    api_key=CONFIG["api_key"],
-)
+# 파일별 변환 결과 상태
+RESULT_STATUS_LABELS = {
+    STATUS_OK: "✅ 성공",
+    STATUS_TRUNCATED: "✂️ 응답 잘림",
+    STATUS_SYNTAX_ERROR: "🧩 구문 오류",
+    STATUS_PARSE_FAILED: "⚠️ 파싱 실패",
+    STATUS_RATE_LIMITED: "⏳ 요청 한도 초과",
+    STATUS_ERROR: "❌ 오류",
+}
+
+# 상세 변환 결과 페이지당 파일 수
+RESULT_PAGE_SIZES = [20, 50, 100]
 
 # 페이지 설정
 st.set_page_config(page_title="C# to Java 코드 전환 Agent", layout="wide")
 
+# AI 호출 오류는 현재 세션 화면에 표시 (세션이 없는 백그라운드 작업 스레드는 로그로 기록)
+def report_error(message):
+    if get_script_run_ctx() is None:
+        logging.getLogger(__name__).error(message)
+    else:
+        st.error(message)
+
+
+conversion_core.set_error_reporter(report_error)
+
+
+# Azure OpenAI 클라이언트 (프로세스당 한 번만 생성하여 모든 세션/재실행과 백그라운드 작업이 공유)
+@st.cache_resource(show_spinner=False)
+def get_shared_client():
+    return conversion_core.create_client()
+
+
+# 첫 AI 호출 때 이 함수로 생성하도록 등록 (openai import 는 그때까지 미뤄짐)
+conversion_core.set_client_factory(get_shared_client)
+
 
 # CSS 스타일링
 def apply_styles():
@@ -55,197 +110,16 @@ def apply_styles():
     )
 
 
-# Azure OpenAI 연결 테스트
-def test_connection():
-    try:
-        response = client.chat.completions.create(
-            model=CONFIG["deployment_name"],
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant."},
-                {
-                    "role": "user",
-                    "content": "Hello! Please respond with 'Connection successful!'",
-                },
-            ],
-            max_tokens=50,
-            temperature=0.1,
-        )
-        return True, response.choices[0].message.content
-    except Exception as e:
-        return False, str(e)
-
-
-# AI 호출 공통 함수
-def call_ai(system_prompt, user_prompt, max_tokens=4000):
-    try:
-        response = client.chat.completions.create(
-            model=CONFIG["deployment_name"],
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=max_tokens,
-            temperature=0.1,
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        st.error(f"AI 호출 오류: {e}")
-        return None
-
-
-# JSON 파싱 유틸리티
-def parse_json_response(response_text, default_response):
-    try:
-        if "```json" in response_text:
-            json_start = response_text.find("```json") + 7
-            json_end = response_text.find("```", json_start)
-            json_text = response_text[json_start:json_end].strip()
-        else:
-            json_text = response_text
-        return json.loads(json_text)
-    except json.JSONDecodeError:
-        return default_response
-
-
-# 변환 옵션을 시스템 프롬프트에 포함하는 함수
-def create_conversion_system_prompt(include_comments=True, generate_getters_setters=True, use_java_conventions=True):
-    base_prompt = "당신은 C# to Java 코드 변환 전문가입니다."
-    
-    options = []
-    if include_comments:
-        options.append("- 원본 C# 코드의 주석을 Java 스타일로 변환하여 포함하세요")
-    else:
-        options.append("- 주석은 제거하고 코드만 변환하세요")
-    
-    if generate_getters_setters:
-        options.append("- C# Properties는 private 필드와 public getter/setter 메서드로 변환하세요")
-    else:
-        options.append("- C# Properties는 public 필드로 간단히 변환하세요")
-    
-    if use_java_conventions:
-        options.append("- Java 네이밍 컨벤션을 적용하세요 (camelCase, 패키지명 소문자 등)")
-    else:
-        options.append("- 원본 C# 네이밍을 최대한 유지하세요")
-    
-    if options:
-        base_prompt += "\n\n변환 옵션:\n" + "\n".join(options)
-    
-    return base_prompt
-
-
-# C# 코드 분석
-def analyze_csharp_code(csharp_code, filename=""):
-    system_prompt = "당신은 20년 경력의 시니어 C# 개발자이자 코드 리뷰 전문가입니다. 정확하고 실용적인 분석을 제공해주세요."
-
-    user_prompt = f"""
-다음 C# 코드를 분석해주세요.
-
-파일명: {filename}
-C# 코드:
-```csharp
-{csharp_code}
-```
-
-다음 JSON 형식으로 응답해주세요:
-{{
-    "complexity_score": 숫자(1-10),
-    "quality_score": 숫자(1-100),
-    "code_patterns": ["패턴1", "패턴2"],
-    "potential_issues": [
-        {{"type": "성능|보안|가독성|유지보수", "description": "문제점 설명", "severity": "low|medium|high", "line_info": "해당 라인 정보"}}
-    ],
-    "refactoring_suggestions": [
-        {{"category": "성능|구조|네이밍|보안", "suggestion": "구체적인 개선 방안", "benefit": "개선시 얻을 수 있는 효과", "priority": "low|medium|high"}}
-    ],
-    "java_conversion_notes": ["Java 변환시 주의사항1", "Java 변환시 주의사항2"],
-    "code_metrics": {{"lines_of_code": 숫자, "methods_count": 숫자, "classes_count": 숫자, "estimated_maintainability": "low|medium|high"}},
-    "summary": "코드에 대한 전반적인 평가와 요약"
-}}
-"""
-
-    response_text = call_ai(system_prompt, user_prompt)
-    if not response_text:
-        return None
-
-    default_response = {
-        "complexity_score": 5,
-        "quality_score": 70,
-        "code_patterns": [],
-        "potential_issues": [],
-        "refactoring_suggestions": [],
-        "java_conversion_notes": [],
-        "code_metrics": {},
-        "summary": "분석 중 오류가 발생했습니다.",
-    }
-
-    result = parse_json_response(response_text, default_response)
-
-    # 분석 히스토리 저장
-    if "analysis_history" not in st.session_state:
-        st.session_state.analysis_history = []
-
-    analysis_record = {
-        **result,
-        "filename": filename,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "code_length": len(csharp_code),
-    }
-    st.session_state.analysis_history.append(analysis_record)
-    st.session_state.analysis_history = st.session_state.analysis_history[
-        -10:
-    ]  # 최근 10개만 유지
-
-    return result
-
-
-# C# to Java 변환 (옵션 적용)
-def convert_csharp_to_java(csharp_code, filename="", include_comments=True, generate_getters_setters=True, use_java_conventions=True):
-    system_prompt = create_conversion_system_prompt(include_comments, generate_getters_setters, use_java_conventions)
-
-    user_prompt = f"""
-다음 C# 코드를 Java로 변환해주세요.
-
-파일명: {filename}
-C# 코드:
-```csharp
-{csharp_code}
-```
-
-JSON 형식으로 응답해주세요:
-{{
-    "java_code": "변환된 Java 코드",
-    "imports": ["필요한 import 문들"],
-    "conversion_notes": "주요 변환 사항 설명",
-    "warnings": ["주의가 필요한 부분들"],
-    "applied_options": {{"include_comments": {include_comments}, "generate_getters_setters": {generate_getters_setters}, "use_java_conventions": {use_java_conventions}}}
-}}
-"""
-
-    response_text = call_ai(system_prompt, user_prompt)
-    if not response_text:
-        return {
-            "java_code": f"// 변환 오류 발생",
-            "imports": [],
-            "conversion_notes": "변환 실패",
-            "warnings": ["변환 실패"],
-            "applied_options": {"include_comments": include_comments, "generate_getters_setters": generate_getters_setters, "use_java_conventions": use_java_conventions}
-        }
-
-    default_response = {
-        "java_code": response_text,
-        "imports": [],
-        "conversion_notes": "AI가 생성한 변환 결과입니다.",
-        "warnings": ["JSON 파싱 실패로 인해 상세 정보가 제한됩니다."],
-        "applied_options": {"include_comments": include_comments, "generate_getters_setters": generate_getters_setters, "use_java_conventions": use_java_conventions}
-    }
-
-    return parse_json_response(response_text, default_response)
-
-
 # 파일에서 C# 코드 추출 및 전체 프로젝트 구조 보존
 def extract_csharp_files(uploaded_files):
     extracted_files = []
-    project_structure = {}  # 전체 프로젝트 구조 저장
+    project_structure = {}  # ZIP 이름 -> ProjectArchive (디스크의 ZIP + 항목 인덱스)
+
+    # 이전 업로드의 임시 파일 정리 (이 세션이 업로드한 ZIP 중 저장된 작업이 참조하지 않는 것만 삭제)
+    job_archive_paths = get_job_manager().store.archive_paths()
+    for archive in st.session_state.get("project_structure", {}).values():
+        if archive.path not in job_archive_paths:
+            archive.cleanup()
 
     for uploaded_file in uploaded_files:
         try:
@@ -255,55 +129,25 @@ def extract_csharp_files(uploaded_files):
                     {"filename": uploaded_file.name, "content": content}
                 )
             elif uploaded_file.name.endswith(".zip"):
-                # ZIP 파일의 전체 구조를 메모리에 저장
-                with zipfile.ZipFile(uploaded_file, "r") as zip_ref:
-                    project_structure[uploaded_file.name] = {}
-
-                    for file_info in zip_ref.filelist:
-                        if not file_info.is_dir():
-                            try:
-                                file_content = zip_ref.read(file_info)
-
-                                # CS 파일인 경우 텍스트로 디코딩하여 변환 대상에 추가
-                                if file_info.filename.endswith(".cs"):
-                                    try:
-                                        content = file_content.decode("utf-8")
-                                        extracted_files.append(
-                                            {
-                                                "filename": file_info.filename,
-                                                "content": content,
-                                                "zip_source": uploaded_file.name,
-                                            }
-                                        )
-                                    except UnicodeDecodeError:
-                                        st.warning(
-                                            f"파일 인코딩 오류: {file_info.filename}"
-                                        )
-
-                                # 모든 파일을 프로젝트 구조에 저장 (바이너리 형태로)
-                                project_structure[uploaded_file.name][
-                                    file_info.filename
-                                ] = {
-                                    "content": file_content,
-                                    "is_text": file_info.filename.endswith(
-                                        (
-                                            ".cs",
-                                            ".txt",
-                                            ".md",
-                                            ".json",
-                                            ".xml",
-                                            ".config",
-                                            ".yml",
-                                            ".yaml",
-                                        )
-                                    ),
-                                    "file_info": file_info,
-                                }
-
-                            except Exception as e:
-                                st.warning(
-                                    f"파일 읽기 오류 ({file_info.filename}): {str(e)}"
-                                )
+                # ZIP 은 임시 파일로 한 번 저장하고 항목 인덱스만 보관 (CS 외 파일은 패키징 시 읽음)
+                archive = ProjectArchive.from_upload(uploaded_file, keep_paths=job_archive_paths)
+                project_structure[uploaded_file.name] = archive
+
+                cs_entries = archive.iter_contents(lambda entry: entry["path"].endswith(".cs"))
+                for entry, file_content in cs_entries:
+                    try:
+                        content = file_content.decode("utf-8")
+                        extracted_files.append(
+                            {
+                                "filename": entry["path"],
+                                "content": content,
+                                "zip_source": uploaded_file.name,
+                            }
+                        )
+                    except UnicodeDecodeError:
+                        st.warning(
+                            f"파일 인코딩 오류: {entry['path']}"
+                        )
         except Exception as e:
             st.error(f"파일 처리 오류 ({uploaded_file.name}): {str(e)}")
 
@@ -312,167 +156,78 @@ def extract_csharp_files(uploaded_files):
     return extracted_files
 
 
-# 프로젝트 단위의 코드 변환
-def analyze_project_context(extracted_files):
-    """프로젝트 전체 컨텍스트 분석"""
-    if len(extracted_files) <= 1:
-        return ""
-    
-    system_prompt = """
-    다음 C# 프로젝트를 분석하여 Java 변환에 필요한 정보를 JSON으로 제공해주세요:
-    
-    {
-        "namespaces": ["네임스페이스 목록"],
-        "interfaces": [{"name": "인터페이스명", "methods": ["메서드들"]}],
-        "base_classes": [{"name": "클래스명", "properties": ["속성들"]}],
-        "custom_types": ["커스텀 타입들"],
-        "dependencies": [{"from": "클래스A", "to": "클래스B", "type": "상속|구현|의존"}]
-    }
-    """
-    
-    # 파일 요약 (토큰 제한 고려)
-    file_summaries = []
-    for file_info in extracted_files[:10]:  # 최대 10개 파일만
-        summary = f"// {file_info['filename']}\n"
-        lines = file_info['content'].split('\n')
-        
-        # 클래스/인터페이스 선언부만 추출
-        for line in lines:
-            if any(keyword in line for keyword in ['class ', 'interface ', 'public ', 'private ', 'protected ']):
-                summary += line.strip() + '\n'
-        
-        file_summaries.append(summary)
-    
-    project_summary = '\n\n'.join(file_summaries)
-    
-    try:
-        response = call_ai(system_prompt, project_summary, max_tokens=3000)
-        return parse_json_response(response, {"namespaces": [], "interfaces": [], "base_classes": [], "custom_types": [], "dependencies": []})
-    except:
-        return ""
-
-def convert_csharp_to_java_with_context(csharp_code, filename="", project_context="", include_comments=True, generate_getters_setters=True, use_java_conventions=True):
-    """프로젝트 컨텍스트를 고려한 C# to Java 변환"""
-    
-    context_info = ""
-    if project_context:
-        context_info = f"""
-프로젝트 컨텍스트 정보:
-{json.dumps(project_context, ensure_ascii=False, indent=2)}
-
-이 정보를 활용하여 타입 변환 시 일관성을 유지해주세요.
-"""
-    
-    system_prompt = create_conversion_system_prompt(include_comments, generate_getters_setters, use_java_conventions)
-    system_prompt += f"""
-
-{context_info}
-
-다음 규칙을 준수해주세요:
-1. 클래스명은 일관되게 변환
-2. 인터페이스 구현 관계 유지
-3. 커스텀 타입은 적절한 Java 타입으로 매핑
-4. 네임스페이스는 package로 변환
-"""
-
-    user_prompt = f"""
-다음 C# 코드를 Java로 변환해주세요.
-
-파일명: {filename}
-C# 코드:
-```csharp
-{csharp_code}
-```
-
-JSON 형식으로 응답해주세요:
-{{
-    "java_code": "변환된 Java 코드",
-    "package_declaration": "package 선언",
-    "imports": ["필요한 import 문들"],
-    "conversion_notes": "주요 변환 사항 설명",
-    "warnings": ["주의가 필요한 부분들"],
-    "type_mappings": {{"C#타입": "Java타입"}},
-    "applied_options": {{"include_comments": {include_comments}, "generate_getters_setters": {generate_getters_setters}, "use_java_conventions": {use_java_conventions}}}
-}}
-"""
-
-    response_text = call_ai(system_prompt, user_prompt, max_tokens=5000)
-    if not response_text:
-        return {
-            "java_code": f"// 변환 오류 발생",
-            "package_declaration": "",
-            "imports": [],
-            "conversion_notes": "변환 실패",
-            "warnings": ["변환 실패"],
-            "type_mappings": {},
-            "applied_options": {"include_comments": include_comments, "generate_getters_setters": generate_getters_setters, "use_java_conventions": use_java_conventions}
-        }
+# 패키징 대상 식별값 (원본 ZIP, 작업, 파일별 완료 시각)
+def package_fingerprint(kind, job_id, result_index):
+    archives = list(st.session_state.get("project_structure", {}).values())
+    return make_cache_key(
+        kind,
+        [archive.path for archive in archives],
+        job_id,
+        [(item["index"], item["completed_at"]) for item in result_index],
+    )
 
-    default_response = {
-        "java_code": response_text,
-        "package_declaration": "",
-        "imports": [],
-        "conversion_notes": "AI가 생성한 변환 결과입니다.",
-        "warnings": ["JSON 파싱 실패로 인해 상세 정보가 제한됩니다."],
-        "type_mappings": {},
-        "applied_options": {"include_comments": include_comments, "generate_getters_setters": generate_getters_setters, "use_java_conventions": use_java_conventions}
-    }
 
-    return parse_json_response(response_text, default_response)
+# 현재 결과로 만든 ZIP 이 이미 있는지 (없으면 사용자가 요청할 때만 생성)
+def package_is_ready(kind, job_id, result_index):
+    cached = st.session_state.get("package_cache", {}).get(kind)
+    return cached is not None and cached["fingerprint"] == package_fingerprint(kind, job_id, result_index)
+
+
+# 패키징 결과 재사용 (작업과 파일별 완료 시각이 같으면 이전에 만든 ZIP 을 다시 읽기만 함)
+def get_packaged_zip(kind, job_id, result_index, build):
+    archives = list(st.session_state.get("project_structure", {}).values())
+    fingerprint = package_fingerprint(kind, job_id, result_index)
+
+    if "package_cache" not in st.session_state:
+        st.session_state.package_cache = {}
+    cached = st.session_state.package_cache.get(kind)
+    if cached is None or cached["fingerprint"] != fingerprint:
+        if cached is not None:
+            cached["file"].close()
+        # 작은 결과는 메모리, 큰 결과는 디스크 임시 파일에 보관
+        output = tempfile.SpooledTemporaryFile(max_size=PACKAGE_SPOOL_MAX_BYTES)
+        try:
+            build(output, archives)
+        except Exception:
+            output.close()
+            raise
+        cached = {"fingerprint": fingerprint, "file": output}
+        st.session_state.package_cache[kind] = cached
+
+    cached["file"].seek(0)
+    return cached["file"].read()
 
 
 # 전체 프로젝트 ZIP 파일 생성 (CS 파일을 Java로 변환하고 나머지 파일 유지)
-def create_complete_project_zip(conversion_results):
-    """변환 결과와 원본 프로젝트 구조를 결합하여 완전한 프로젝트 ZIP 생성"""
-    zip_buffer = io.BytesIO()
-
-    # 변환된 Java 파일들의 매핑 생성
-    java_files = {}
-    for result in conversion_results:
-        original_path = result["original_filename"]
-        java_path = original_path.replace(".cs", ".java")
-        java_files[original_path] = {
-            "java_path": java_path,
-            "java_content": result["java_code"],
-        }
+def create_complete_project_zip(job_id, result_index):
+    """변환 결과와 원본 프로젝트 구조를 결합하여 완전한 프로젝트 ZIP 생성 (결과는 작업 저장소에서 하나씩 읽음)"""
+    store = get_job_manager().store
 
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+    def build(output, archives):
         # 프로젝트 구조가 있는 경우 (ZIP 파일에서 추출된 경우)
-        if (
-            "project_structure" in st.session_state
-            and st.session_state.project_structure
-        ):
-            original_name = list(st.session_state.project_structure.keys())[0].replace(
-                ".zip", ""
-            )
-            for zip_name, files in st.session_state.project_structure.items():
-                for file_path, file_data in files.items():
-                    # CS 파일인 경우 Java로 변환된 파일 추가
-                    if file_path.endswith(".cs") and file_path in java_files:
-                        java_path = java_files[file_path]["java_path"]
-                        java_content = java_files[file_path]["java_content"]
-                        zip_file.writestr(java_path, java_content.encode("utf-8"))
-                    else:
-                        # 다른 모든 파일들은 원본 그대로 유지
-                        zip_file.writestr(file_path, file_data["content"])
+        if archives:
+            # 변환된 Java 파일들의 매핑 생성
+            java_files = {}
+            for result in store.iter_results(job_id):
+                original_path = result["original_filename"]
+                java_files[original_path] = (original_path.replace(".cs", ".java"), result.get("java_code", ""))
+            write_project_zip(output, archives, java_files)
         else:
             # 개별 CS 파일들만 업로드된 경우 (기존 방식)
-            for result in conversion_results:
-                zip_file.writestr(result["java_filename"], result["java_code"])
+            write_java_only_zip(output, store.iter_results(job_id))
 
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+    return get_packaged_zip("complete", job_id, result_index, build)
 
 
 # Java 파일만 포함된 ZIP 생성
-def create_java_only_zip(conversion_results):
+def create_java_only_zip(job_id, result_index):
     """Java 파일만 포함된 ZIP 파일 생성"""
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for result in conversion_results:
-            zip_file.writestr(result["java_filename"], result["java_code"])
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+    return get_packaged_zip(
+        "java_only",
+        job_id,
+        result_index,
+        lambda output, archives: write_java_only_zip(output, get_job_manager().store.iter_results(job_id)),
+    )
 
 
 # 분석 결과 시각화
@@ -580,6 +335,113 @@ def setup_sidebar():
         st.text(f"모델: {CONFIG['deployment_name']}")
         st.text(f"API 버전: {CONFIG['api_version']}")
 
+        st.markdown("### 변환 캐시")
+        cache_stats = get_conversion_cache().stats
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("적중", cache_stats["memory_hits"] + cache_stats["disk_hits"])
+        with col2:
+            st.metric("미적중", cache_stats["misses"])
+        st.caption(f"적중률: {get_conversion_cache().hit_rate():.1f}%")
+
+        st.markdown("### 프롬프트 캐시")
+        prompt_cache = get_prompt_cache_stats()
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("캐시된 토큰", f"{prompt_cache['cached_tokens']:,}")
+        with col2:
+            st.metric("적중률", f"{prompt_cache['hit_rate']:.1f}%")
+        if prompt_cache["avg_cached_latency"] is not None and prompt_cache["avg_uncached_latency"] is not None:
+            st.caption(
+                f"평균 응답 시간: 적중 {prompt_cache['avg_cached_latency']:.2f}초 / "
+                f"미적중 {prompt_cache['avg_uncached_latency']:.2f}초"
+            )
+
+        st.markdown("### 응답 파싱")
+        parse_stats = get_parse_stats()
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("파싱 실패율", f"{parse_stats['failure_rate']:.1f}%")
+        with col2:
+            st.metric("보정 후 파싱", parse_stats["repaired"] + parse_stats["truncated"])
+        st.caption(f"전체 응답 {parse_stats['responses']}건 중 잘린 응답 {parse_stats['truncated']}건")
+        syntax_stats = get_syntax_stats()
+        st.caption(
+            f"Java 구문 검사 {syntax_stats['checked']}건 중 오류 {syntax_stats['failed']}건 · "
+            f"부분 수정 {syntax_stats['repaired']}건 (수정 요청 {syntax_stats['repair_requests']}회)"
+        )
+
+        st.markdown("### 결과 메모리")
+        result_usage = get_job_manager().result_cache.usage(current_session_id())
+        st.caption(
+            f"이 세션 {result_usage['session_bytes'] / 1024 / 1024:.1f} MB / "
+            f"전체 {result_usage['total_bytes'] / 1024 / 1024:.1f} MB ({result_usage['sessions']}개 세션) · "
+            f"한도 세션당 {CONFIG['result_session_quota_mb']} MB, 전체 {CONFIG['result_cache_mb']} MB"
+        )
+
+        pool_stats = get_http_pool_stats()
+        if pool_stats is not None:
+            st.markdown("### HTTP 연결 풀")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("연결 재사용률", f"{pool_stats['connection_reuse_rate']:.1f}%")
+            with col2:
+                st.metric("열린 연결", f"{pool_stats['open_connections']} / {CONFIG['http_max_connections']}")
+            st.caption(
+                f"요청 {pool_stats['requests']}건 · 새 연결 {pool_stats['connections_opened']}개 · "
+                f"최대 동시 요청 {pool_stats['peak_in_flight']}건 · 풀 대기 시간 초과 {pool_stats['pool_timeouts']}건"
+            )
+
+        show_llm_telemetry()
+
+
+# 현재 세션 ID (AI 호출 기록 집계용)
+def current_session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+# AI 호출 통계 (현재 세션 또는 선택한 작업 기준) 및 CSV/JSONL 내보내기
+def show_llm_telemetry():
+    st.markdown("### AI 호출 통계")
+    telemetry = get_telemetry()
+    job_id = st.session_state.get("active_job_id")
+    session_job_ids = st.session_state.get("session_job_ids", []) + ([job_id] if job_id else [])
+    scopes = {"현재 세션": telemetry.records(current_session_id(), session_job_ids)}
+    if job_id:
+        scopes[f"작업 {job_id}"] = telemetry.records(job_ids=[job_id])
+    scopes["전체"] = telemetry.records()
+    scope = st.selectbox("집계 범위", list(scopes), key="telemetry_scope")
+    records = scopes[scope]
+    if not records:
+        st.caption("아직 AI 호출 기록이 없습니다.")
+        return
+
+    summary = telemetry.summarize(records)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("호출 수", summary["calls"])
+        st.metric("지연 p50", f"{summary['latency_p50']:.2f}초" if summary["latency_p50"] is not None else "-")
+    with col2:
+        st.metric("tokens/sec", f"{summary['tokens_per_second']:.0f}" if summary["tokens_per_second"] is not None else "-")
+        st.metric("지연 p95", f"{summary['latency_p95']:.2f}초" if summary["latency_p95"] is not None else "-")
+    st.caption(
+        f"입력 {summary['prompt_tokens']:,} / 출력 {summary['completion_tokens']:,} 토큰 "
+        f"(캐시 {summary['cached_tokens']:,}) · 실패 {summary['failed_calls']}건 · 잘림 {summary['truncated_calls']}건"
+    )
+    if summary["time_to_first_token_p50"] is not None:
+        st.caption(f"첫 토큰까지 p50: {summary['time_to_first_token_p50']:.2f}초")
+    if summary["slowest_files"]:
+        st.markdown("**가장 오래 걸린 파일**")
+        for filename, seconds in summary["slowest_files"]:
+            st.text(f"{seconds:6.2f}초  {filename}")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("CSV", telemetry.to_csv(records), file_name="llm_calls.csv", mime="text/csv", key="telemetry_csv")
+    with col2:
+        st.download_button("JSONL", telemetry.to_jsonl(records), file_name="llm_calls.jsonl", mime="application/json", key="telemetry_jsonl")
+
 
 # 파일 변환 탭
 def file_conversion_tab():
@@ -605,6 +467,21 @@ def file_conversion_tab():
     with col2:
         use_java_conventions = st.checkbox("Java 네이밍 컨벤션 적용", value=True, help="PascalCase → camelCase 등 Java 스타일로 변환합니다")
         use_project_context = st.checkbox("프로젝트 단위로 변환 (다중 파일시 권장)", value=False, help="다중 파일 간의 의존성을 분석하여 더 정확한 변환을 수행합니다")
+        use_chunking = st.checkbox("대용량 파일 분할 변환", value=True, help="큰 C# 파일을 클래스/메서드 단위로 나누어 병렬 변환 후 하나의 Java 파일로 합칩니다")
+        use_packing = st.checkbox("작은 파일 묶어서 변환", value=True, help="DTO/enum/interface 처럼 짧은 파일 여러 개를 한 번의 요청으로 변환하여 요청 수를 줄입니다")
+        use_fast_path = st.checkbox("단순 파일 규칙 기반 변환", value=True, help="자동 속성/상수만 있는 클래스, enum, 메서드 시그니처만 있는 interface 는 AI 호출 없이 바로 변환합니다")
+        use_batch_api = st.checkbox("Batch API 모드 (대량 오프라인 변환)", value=False, help="요청을 Batch API 로 제출하여 비용을 줄입니다. 결과는 최대 24시간 후에 반영됩니다")
+
+    conversion_options = {
+        "include_comments": include_comments,
+        "generate_getters_setters": generate_getters_setters,
+        "use_java_conventions": use_java_conventions,
+        "use_project_context": use_project_context,
+        "use_chunking": use_chunking,
+        "use_packing": use_packing,
+        "use_fast_path": use_fast_path,
+        "use_batch_api": use_batch_api,
+    }
 
     if uploaded_files:
         st.success(f"{len(uploaded_files)}개 파일이 업로드되었습니다.")
@@ -619,88 +496,243 @@ def file_conversion_tab():
 
             st.success(f"{len(extracted_files)}개의 C# 파일이 추출되었습니다.")
 
-            # 프로젝트 컨텍스트 분석 (다중 파일인 경우)
-            project_context = ""
-            if use_project_context and len(extracted_files) > 1:
-                with st.spinner("프로젝트 구조 분석 중..."):
-                    project_context = analyze_project_context(extracted_files)
-                    if project_context:
-                        st.info("프로젝트 분석 완료!")
-
-            conversion_results = []
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-
-            for i, file_info in enumerate(extracted_files):
-                progress = (i + 1) / len(extracted_files)
-                progress_bar.progress(progress)
-                status_text.text(
-                    f"변환 중: {file_info['filename']} ({i+1}/{len(extracted_files)})"
+            # 변환은 백그라운드 작업으로 실행 (화면 조작/재연결로 스크립트가 다시 실행되어도 계속 진행)
+            archives = [
+                {"name": name, "path": archive.path}
+                for name, archive in st.session_state.project_structure.items()
+            ]
+            job_id = get_job_manager().submit(
+                ", ".join(uploaded_file.name for uploaded_file in uploaded_files),
+                extracted_files,
+                conversion_options,
+                archives,
+                session_key=current_session_key(),
+            )
+            set_active_job(job_id)
+
+    show_recent_jobs()
+
+    active_job_id = get_active_job_id()
+    if active_job_id:
+        show_conversion_job(active_job_id)
+
+
+# 작업 소유 확인용 세션 키 (URL 에도 기록하여 새로고침/재연결 후에도 같은 브라우저의 작업만 조회)
+def current_session_key():
+    if "session_key" not in st.session_state:
+        session_key = st.experimental_get_query_params().get("key", [None])[0]
+        st.session_state.session_key = session_key or uuid.uuid4().hex
+    return st.session_state.session_key
+
+
+# 현재 세션이 만든 작업인지 (다른 세션의 작업 ID 로 원본 코드/결과를 열지 못하도록)
+def is_own_job(job):
+    return job is not None and job["session_key"] == current_session_key()
+
+
+# 현재 세션에서 보고 있는 변환 작업 (URL 에도 기록하여 새로고침/재연결 후 복원)
+def get_active_job_id():
+    if "active_job_id" not in st.session_state:
+        st.session_state.active_job_id = st.experimental_get_query_params().get("job", [None])[0]
+    return st.session_state.active_job_id
+
+
+def set_active_job(job_id):
+    st.session_state.active_job_id = job_id
+    # 이 세션에서 시작/조회한 작업의 AI 호출도 세션 통계에 포함
+    session_job_ids = st.session_state.setdefault("session_job_ids", [])
+    if job_id not in session_job_ids:
+        session_job_ids.append(job_id)
+    st.experimental_set_query_params(job=job_id, key=current_session_key())
+
+
+# 변환 작업 진행 상황 표시 (실행 중이면 끝날 때까지 주기적으로 갱신)
+def show_conversion_job(job_id):
+    manager = get_job_manager()
+    job = manager.store.get_job(job_id)
+    if not is_own_job(job):
+        return
+
+    st.markdown("---")
+    st.markdown(f"#### 변환 작업 `{job_id}`")
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    # 위젯 조작으로 스크립트가 다시 실행되면 이 루프만 중단되고 작업은 계속 진행됨
+    while job["status"] in ACTIVE_STATUSES and manager.is_running(job_id):
+        progress_bar.progress(job["done"] / job["total"] if job["total"] else 0.0)
+        if job["batch_id"]:
+            status_text.text(f"배치 처리 대기 중: {job['name']} (배치 상태: {job['batch_status'] or '제출됨'})")
+        else:
+            status_text.text(f"변환 중: {job['name']} ({job['done']}/{job['total']})")
+        time.sleep(JOB_POLL_INTERVAL_SECONDS)
+        job = manager.store.get_job(job_id)
+
+    job = manager.store.get_job(job_id)
+    progress_bar.progress(job["done"] / job["total"] if job["total"] else 1.0)
+
+    if job["status"] == JOB_COMPLETED:
+        status_text.text("변환 완료!")
+        if st.session_state.get("loaded_job_id") != job_id:
+            load_job_results(job)
+
+        if job["project_context"]:
+            st.success(f"🎉 프로젝트단위로 {job['total']}개 파일 변환 완료!")
+        else:
+            st.success(f"✅ {job['total']}개 파일 변환 완료!")
+        return
+
+    status_text.text(f"변환 중단: {job['done']}/{job['total']}개 완료")
+    if job["error"]:
+        st.error(f"변환 작업 오류: {job['error']}")
+    else:
+        st.warning("변환 작업이 중단되었습니다. 완료된 파일은 저장되어 있어 이어서 변환할 수 있습니다.")
+    if st.button("이어서 변환", key=f"resume_job_{job_id}"):
+        manager.resume(job_id)
+        st.rerun()
+
+
+# 완료된 작업의 결과 목록을 세션에 불러옴 (본문은 작업 저장소에 두고 표시할 때 세션 캐시로 읽음)
+def load_job_results(job):
+    if not is_own_job(job):
+        return
+    manager = get_job_manager()
+    result_index = manager.store.load_result_index(job["job_id"])
+    st.session_state.result_index = result_index
+    st.session_state.loaded_job_id = job["job_id"]
+    st.session_state.open_result = None
+    # 이전에 보던 작업의 결과 본문은 세션 캐시에서 비움
+    manager.result_cache.drop_session(current_session_id())
+
+    success_count = len([item for item in result_index if item["status"] == STATUS_OK])
+    st.session_state.conversion_stats = {
+        "total_files": len(result_index),
+        "success_rate": ((success_count / len(result_index)) * 100 if result_index else 0),
+        "last_conversion": datetime.fromtimestamp(job["updated_at"]).strftime("%Y-%m-%d %H:%M:%S"),
+        "used_project_context": bool(job["project_context"]),
+        "conversion_options": job["options"],
+    }
+
+    # 다른 세션에서 시작한 작업이면 원본 ZIP 이 남아 있는 경우에만 프로젝트 구조 복원
+    current_paths = [archive.path for archive in st.session_state.get("project_structure", {}).values()]
+    if current_paths != [archive["path"] for archive in job["archives"]]:
+        st.session_state.project_structure = {
+            archive["name"]: ProjectArchive(archive["name"], archive["path"], [], owned=False)
+            for archive in job["archives"]
+            if os.path.exists(archive["path"])
+        }
+
+
+# 실패한 파일만 다시 변환 (같은 작업에서 실패 파일의 결과만 지우고 재실행, 완료 후 결과를 다시 불러옴)
+def show_retry_failed_button(failed_count):
+    job_id = st.session_state.get("loaded_job_id")
+    if not job_id:
+        return
+    if st.button(f"실패한 파일만 다시 변환 ({failed_count}개)", key=f"retry_failed_{job_id}"):
+        if get_job_manager().retry_failed(job_id):
+            st.session_state.loaded_job_id = None
+            set_active_job(job_id)
+            st.rerun()
+        else:
+            st.warning("다시 변환할 파일이 없거나 작업이 이미 실행 중입니다.")
+
+
+# 최근 변환 작업 목록 (이전 작업 결과 불러오기 / 중단된 작업 이어서 변환)
+def show_recent_jobs():
+    jobs = get_job_manager().store.list_jobs(current_session_key(), limit=5)
+    if not jobs:
+        return
+
+    with st.expander("최근 변환 작업", expanded=False):
+        for job in jobs:
+            col1, col2 = st.columns([5, 1])
+            with col1:
+                created_at = datetime.fromtimestamp(job["created_at"]).strftime("%Y-%m-%d %H:%M")
+                st.markdown(
+                    f"`{job['job_id']}` {job['name']} · {JOB_STATUS_LABELS.get(job['status'], job['status'])} "
+                    f"({job['done']}/{job['total']}) · {created_at}"
                 )
+            with col2:
+                if st.button("보기", key=f"open_job_{job['job_id']}"):
+                    set_active_job(job["job_id"])
+                    st.rerun()
 
-                # 컨텍스트 정보 포함 변환
-                if project_context:
-                    result = convert_csharp_to_java_with_context(
-                        file_info["content"], 
-                        file_info["filename"],
-                        project_context,
-                        include_comments,
-                        generate_getters_setters,
-                        use_java_conventions
-                    )
-                else:
-                    result = convert_csharp_to_java(
-                        file_info["content"], 
-                        file_info["filename"],
-                        include_comments,
-                        generate_getters_setters,
-                        use_java_conventions
-                    )
-                
-                result.update({
-                    "original_filename": file_info["filename"],
-                    "java_filename": file_info["filename"].replace(".cs", ".java"),
-                    "original_content": file_info["content"],
-                    "zip_source": file_info.get("zip_source", None),
-                })
-                conversion_results.append(result)
-
-            progress_bar.progress(1.0)
-            status_text.text("변환 완료!")
-
-            st.session_state.conversion_results = conversion_results
-            success_count = len([r for r in conversion_results if "오류" not in r["java_code"]])
-            st.session_state.conversion_stats = {
-                "total_files": len(conversion_results),
-                "success_rate": ((success_count / len(conversion_results)) * 100 if conversion_results else 0),
-                "last_conversion": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "used_project_context": bool(project_context),
-                "conversion_options": {
-                    "include_comments": include_comments,
-                    "generate_getters_setters": generate_getters_setters,
-                    "use_java_conventions": use_java_conventions,
-                    "use_project_context": use_project_context
-                }
-            }
-            
-            if project_context:
-                st.success(f"🎉 프로젝트단위로 {len(extracted_files)}개 파일 변환 완료!")
-            else:
-                st.success(f"✅ {len(extracted_files)}개 파일 변환 완료!")
+
+# 파일 하나의 변환 결과 상세 (원본/Java 코드, 옵션, import, 경고, 타입 매핑, 개별 다운로드)
+def show_result_detail(result, item):
+    status = item["status"]
+    if status != STATUS_OK:
+        st.error(f"**{RESULT_STATUS_LABELS.get(status, status)}:** {result.get('status_detail') or '원인 정보 없음'}")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("**원본 C# 코드**")
+        st.code(
+            result.get("original_content", "// 원본 코드 없음"),
+            language="csharp",
+        )
+
+    with col2:
+        st.markdown("**변환된 Java 코드**")
+        st.code(result.get("java_code", ""), language="java")
+
+    # 적용된 옵션 표시
+    if result.get("applied_options"):
+        st.markdown("**적용된 변환 옵션:**")
+        options = result["applied_options"]
+        option_items = []
+        if options.get("include_comments"):
+            option_items.append("주석 포함")
+        if options.get("generate_getters_setters"):
+            option_items.append("Getter/Setter 생성")
+        if options.get("use_java_conventions"):
+            option_items.append("Java 네이밍 컨벤션")
+        if option_items:
+            st.info(" | ".join(option_items))
+
+    if result.get("imports"):
+        st.markdown("**필요한 Import:**")
+        for imp in result["imports"]:
+            st.code(imp, language="java")
+
+    if result.get("conversion_notes"):
+        st.info(f"**변환 노트:** {result['conversion_notes']}")
+
+    if result.get("warnings"):
+        st.markdown("**⚠️ 주의사항:**")
+        for warning in result["warnings"]:
+            st.warning(warning)
+
+    if result.get("type_mappings"):
+        st.markdown("**타입 매핑:**")
+        for cs_type, java_type in result["type_mappings"].items():
+            st.text(f"{cs_type} → {java_type}")
+
+    st.download_button(
+        label=f"{result['java_filename']} 다운로드",
+        data=result.get("java_code", ""),
+        file_name=result["java_filename"],
+        mime="text/plain",
+        key=f"download_{item['index']}",
+    )
+
+
+# 상세 결과를 열 파일 지정 (한 번에 한 파일만 열림)
+def toggle_result(index):
+    st.session_state.open_result = index
 
 
 # 변환 결과 탭
 def conversion_results_tab():
     st.markdown("### 변환 결과 및 분석")
 
-    if (
-        "conversion_results" not in st.session_state
-        or not st.session_state.conversion_results
-    ):
+    if not st.session_state.get("result_index"):
         st.info("변환할 파일을 업로드하고 변환을 진행해주세요.")
         return
 
-    results = st.session_state.conversion_results
+    job_id = st.session_state.loaded_job_id
+    result_index = st.session_state.result_index
 
     # 원본 파일명 추출
     original_name = "converted_files"
@@ -708,8 +740,8 @@ def conversion_results_tab():
         original_name = list(st.session_state.project_structure.keys())[0].replace(
             ".zip", ""
         )
-    elif results:
-        original_name = results[0]["original_filename"].replace(".cs", "")
+    else:
+        original_name = result_index[0]["original_filename"].replace(".cs", "")
 
     # 변환 옵션 표시
     if "conversion_stats" in st.session_state and "conversion_options" in st.session_state.conversion_stats:
@@ -732,13 +764,16 @@ def conversion_results_tab():
 
     # 변환 통계
     st.markdown("#### 변환 통계")
-    success_count = len([r for r in results if "오류" not in r["java_code"]])
-    success_rate = (success_count / len(results)) * 100 if results else 0
-    total_warnings = sum(len(r.get("warnings", [])) for r in results)
+    status_counts = {}
+    for item in result_index:
+        status_counts[item["status"]] = status_counts.get(item["status"], 0) + 1
+    success_count = status_counts.get(STATUS_OK, 0)
+    success_rate = (success_count / len(result_index)) * 100
+    total_warnings = sum(item["warning_count"] for item in result_index)
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("총 파일 수", len(results))
+        st.metric("총 파일 수", len(result_index))
     with col2:
         st.metric("성공한 변환", success_count)
     with col3:
@@ -746,67 +781,84 @@ def conversion_results_tab():
     with col4:
         st.metric("총 경고", total_warnings)
 
-    # 상세 변환 결과
+    failed_count = len(result_index) - success_count
+    if failed_count:
+        st.caption(" · ".join(
+            f"{RESULT_STATUS_LABELS.get(status, status)} {count}개"
+            for status, count in status_counts.items()
+            if status != STATUS_OK
+        ))
+        show_retry_failed_button(failed_count)
+
+    # 상세 변환 결과 (필터/페이지 단위로 목록만 표시하고, 코드 본문은 연 파일만 불러옴)
     st.markdown("#### 상세 변환 결과")
-    for i, result in enumerate(results):
-        with st.expander(
-            f"📄 {result['original_filename']} → {result['java_filename']}",
-            expanded=False,
-        ):
-            col1, col2 = st.columns([1, 1])
+    col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
+    with col1:
+        status_filter = st.multiselect(
+            "상태",
+            options=list(status_counts),
+            format_func=lambda status: RESULT_STATUS_LABELS.get(status, status),
+            key="result_status_filter",
+        )
+    with col2:
+        path_filter = st.text_input("경로 검색", key="result_path_filter").strip().lower()
+    with col3:
+        page_size = st.selectbox("페이지당 파일 수", RESULT_PAGE_SIZES, key="result_page_size")
+    with col4:
+        st.write("")
+        warnings_only = st.checkbox("경고 있는 파일만", key="result_warnings_only")
+
+    filtered = [
+        item for item in result_index
+        if (not status_filter or item["status"] in status_filter)
+        and (not warnings_only or item["warning_count"])
+        and (
+            not path_filter
+            or path_filter in item["original_filename"].lower()
+            or path_filter in item["java_filename"].lower()
+        )
+    ]
+    if not filtered:
+        st.info("조건에 맞는 파일이 없습니다.")
+    else:
+        page_count = (len(filtered) + page_size - 1) // page_size
+        page = 1
+        if page_count > 1:
+            # 필터가 바뀌어 페이지 수가 달라지면 첫 페이지부터 다시 표시
+            page = st.number_input("페이지", min_value=1, max_value=page_count, value=1, key=f"result_page_{page_count}")
+        page_items = filtered[(page - 1) * page_size:page * page_size]
+        st.caption(
+            f"{len(result_index)}개 중 {len(filtered)}개 · "
+            f"{(page - 1) * page_size + 1}-{(page - 1) * page_size + len(page_items)}번째 표시"
+        )
 
+        manager = get_job_manager()
+        session_id = current_session_id()
+        open_index = st.session_state.get("open_result")
+        for item in page_items:
+            status = item["status"]
+            is_open = item["index"] == open_index
+            col1, col2 = st.columns([6, 1])
             with col1:
-                st.markdown("**원본 C# 코드**")
-                st.code(
-                    result.get("original_content", "// 원본 코드 없음"),
-                    language="csharp",
-                )
-
+                label = f"📄 {item['original_filename']} → {item['java_filename']} · {RESULT_STATUS_LABELS.get(status, status)}"
+                if item["warning_count"]:
+                    label += f" · 경고 {item['warning_count']}개"
+                st.markdown(label)
             with col2:
-                st.markdown("**변환된 Java 코드**")
-                st.code(result["java_code"], language="java")
-
-            # 적용된 옵션 표시
-            if result.get("applied_options"):
-                st.markdown("**적용된 변환 옵션:**")
-                options = result["applied_options"]
-                option_items = []
-                if options.get("include_comments"):
-                    option_items.append("주석 포함")
-                if options.get("generate_getters_setters"):
-                    option_items.append("Getter/Setter 생성")
-                if options.get("use_java_conventions"):
-                    option_items.append("Java 네이밍 컨벤션")
-                if option_items:
-                    st.info(" | ".join(option_items))
-
-            if result.get("imports"):
-                st.markdown("**필요한 Import:**")
-                for imp in result["imports"]:
-                    st.code(imp, language="java")
-
-            if result.get("conversion_notes"):
-                st.info(f"**변환 노트:** {result['conversion_notes']}")
-
-            if result.get("warnings"):
-                st.markdown("**⚠️ 주의사항:**")
-                for warning in result["warnings"]:
-                    st.warning(warning)
-
-            if result.get("type_mappings"):
-                st.markdown("**타입 매핑:**")
-                for cs_type, java_type in result["type_mappings"].items():
-                    st.text(f"{cs_type} → {java_type}")
-
-            st.download_button(
-                label=f"{result['java_filename']} 다운로드",
-                data=result["java_code"],
-                file_name=result["java_filename"],
-                mime="text/plain",
-                key=f"download_{i}",
-            )
+                st.button(
+                    "닫기" if is_open else "열기",
+                    key=f"toggle_result_{item['index']}",
+                    on_click=toggle_result,
+                    args=(None if is_open else item["index"],),
+                )
+            if is_open:
+                result = manager.get_result(session_id, job_id, item)
+                if result is None:
+                    st.warning("저장된 결과를 찾을 수 없습니다. 작업을 다시 불러와 주세요.")
+                else:
+                    show_result_detail(result, item)
 
-    # 전체 다운로드
+    # 전체 다운로드 (ZIP 은 요청할 때만 만들고, 결과가 바뀌지 않으면 다시 만들지 않음)
     st.markdown("#### 전체 결과 다운로드")
 
     # 프로젝트 구조가 있는 경우와 없는 경우 구분
@@ -815,35 +867,47 @@ def conversion_results_tab():
         col1, col2 = st.columns(2)
 
         with col1:
-            complete_zip_data = create_complete_project_zip(results)
-            st.download_button(
-                label="완전한 프로젝트 다운로드",
-                data=complete_zip_data,
-                file_name=f"{original_name}_project.zip",
-                mime="application/zip",
-                type="primary",
-                help="원본 프로젝트 구조를 유지하면서 CS 파일만 Java로 변환",
-            )
+            if package_is_ready("complete", job_id, result_index) or st.button(
+                "완전한 프로젝트 ZIP 만들기", key="build_complete_zip"
+            ):
+                try:
+                    project_zip = create_complete_project_zip(job_id, result_index)
+                except FileNotFoundError:
+                    # 보존 시간이 지나 원본 업로드 ZIP 이 정리된 경우
+                    st.error("원본 ZIP 파일이 더 이상 남아 있지 않습니다. ZIP 파일을 다시 업로드해 주세요.")
+                else:
+                    st.download_button(
+                        label="완전한 프로젝트 다운로드",
+                        data=project_zip,
+                        file_name=f"{original_name}_project.zip",
+                        mime="application/zip",
+                        type="primary",
+                        help="원본 프로젝트 구조를 유지하면서 CS 파일만 Java로 변환",
+                    )
 
         with col2:
-            java_only_zip_data = create_java_only_zip(results)
+            if package_is_ready("java_only", job_id, result_index) or st.button(
+                "Java 파일 ZIP 만들기", key="build_java_only_zip"
+            ):
+                st.download_button(
+                    label="Java 파일만 다운로드",
+                    data=create_java_only_zip(job_id, result_index),
+                    file_name=f"{original_name}_java.zip",
+                    mime="application/zip",
+                    help="변환된 Java 파일들만 포함",
+                )
+    else:
+        # 개별 CS 파일만 업로드된 경우 (기존 방식)
+        if package_is_ready("java_only", job_id, result_index) or st.button(
+            "Java 파일 ZIP 만들기", key="build_java_only_zip"
+        ):
             st.download_button(
-                label="Java 파일만 다운로드",
-                data=java_only_zip_data,
+                label="모든 Java 파일을 ZIP으로 다운로드",
+                data=create_java_only_zip(job_id, result_index),
                 file_name=f"{original_name}_java.zip",
                 mime="application/zip",
-                help="변환된 Java 파일들만 포함",
+                type="primary",
             )
-    else:
-        # 개별 CS 파일만 업로드된 경우 (기존 방식)
-        java_only_zip_data = create_java_only_zip(results)
-        st.download_button(
-            label="모든 Java 파일을 ZIP으로 다운로드",
-            data=java_only_zip_data,
-            file_name=f"{original_name}_java.zip",
-            mime="application/zip",
-            type="primary",
-        )
 
     # 변환 통계
     if "conversion_stats" in st.session_state:
@@ -858,12 +922,57 @@ def conversion_results_tab():
             st.metric("마지막 변환", stats.get("last_conversion", "없음"))
 
 
+# 스트리밍 응답을 플레이스홀더에 표시하는 콜백 생성 (첫 출력까지 걸린 시간 기록)
+def stream_to_placeholder(placeholder, operation, field=None, language="java"):
+    started_at = time.perf_counter()
+    state = {"first_output": None, "last_render": 0.0}
+
+    def on_token(response_text):
+        visible = extract_streaming_field(response_text, field) if field else response_text
+        if not visible:
+            return
+        now = time.perf_counter()
+        if state["first_output"] is None:
+            state["first_output"] = now - started_at
+            record_first_output_time(operation, state["first_output"])
+        # 토큰마다 다시 그리지 않도록 0.1초 간격으로 갱신
+        elif now - state["last_render"] < 0.1:
+            return
+        state["last_render"] = now
+        placeholder.code(visible, language=language)
+
+    return on_token
+
+
+def record_first_output_time(operation, seconds):
+    if "first_output_times" not in st.session_state:
+        st.session_state.first_output_times = []
+    st.session_state.first_output_times.append({
+        "operation": operation,
+        "seconds": round(seconds, 3),
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    })
+    st.session_state.first_output_times = st.session_state.first_output_times[-50:]
+
+
+def last_first_output_time(operation):
+    for record in reversed(st.session_state.get("first_output_times", [])):
+        if record["operation"] == operation:
+            return record["seconds"]
+    return None
+
+
 # 단일 코드 변환 탭
 def instant_conversion_tab():
     st.markdown("### C# to Java 변환")
 
     col1, col2 = st.columns(2)
 
+    # 변환 중 토큰이 도착하는 대로 오른쪽 패널에 Java 코드 표시
+    with col2:
+        st.markdown("**Java 변환 결과**")
+        stream_placeholder = st.empty()
+
     with col1:
         if "instant_input_text" not in st.session_state:
             st.session_state.instant_input_text = ""
@@ -891,9 +1000,11 @@ def instant_conversion_tab():
                 with st.spinner("변환 중..."):
                     result = convert_csharp_to_java(
                         csharp_input, 
-                        "InstantConversion.cs"
+                        "InstantConversion.cs",
+                        on_token=stream_to_placeholder(stream_placeholder, "instant_conversion", field="java_code"),
                     )
                     st.session_state.instant_result = result
+                    stream_placeholder.empty()
             else:
                 st.warning("C# 코드를 입력해주세요.")
 
@@ -909,21 +1020,24 @@ def instant_conversion_tab():
             st.rerun()
 
     with col2:
-        st.markdown("**Java 변환 결과**")
         if "instant_result" in st.session_state:
             result = st.session_state.instant_result
-            st.code(result["java_code"], language="java")
+            st.code(result.get("java_code", ""), language="java")
 
-            if result["conversion_notes"]:
+            first_output = last_first_output_time("instant_conversion")
+            if first_output is not None:
+                st.caption(f"첫 출력까지 {first_output:.2f}초")
+
+            if result.get("conversion_notes"):
                 st.info(f"**변환 노트:** {result['conversion_notes']}")
 
-            if result["warnings"]:
+            if result.get("warnings"):
                 for warning in result["warnings"]:
                     st.warning(f"⚠️ {warning}")
 
             st.download_button(
                 label="Java 파일 다운로드",
-                data=result["java_code"],
+                data=result.get("java_code", ""),
                 file_name="ConvertedCode.java",
                 mime="text/plain",
             )
@@ -931,12 +1045,36 @@ def instant_conversion_tab():
             st.info("왼쪽에 C# 코드를 입력하고 '단일 코드 변환' 버튼을 클릭하세요.")
 
 
+# 분석 히스토리 저장 (결과 본문은 분석 캐시에서 조회)
+def record_analysis_history(csharp_code, filename, result):
+    if "analysis_history" not in st.session_state:
+        st.session_state.analysis_history = []
+
+    analysis_record = {
+        "cache_key": analysis_cache_key(csharp_code),
+        "filename": filename,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "code_length": len(csharp_code),
+        "summary": result.get("summary", ""),
+        "issues_count": len(result.get("potential_issues", [])),
+    }
+    st.session_state.analysis_history.append(analysis_record)
+    st.session_state.analysis_history = st.session_state.analysis_history[
+        -10:
+    ]  # 최근 10개만 유지
+
+
 # 코드 분석 탭
 def code_analysis_tab():
     st.markdown("### C# 코드 분석 도구")
 
     col1, col2 = st.columns([1, 1])
 
+    # 분석 중 도착하는 응답을 오른쪽 패널에 그대로 표시
+    with col2:
+        st.markdown("**분석 결과**")
+        stream_placeholder = st.empty()
+
     with col1:
         st.markdown("**분석할 C# 코드 입력**")
 
@@ -975,9 +1113,13 @@ def code_analysis_tab():
             if analysis_input.strip():
                 with st.spinner("코드 분석 중..."):
                     analysis_result = analyze_csharp_code(
-                        analysis_input, "CodeAnalysis.cs"
+                        analysis_input,
+                        "CodeAnalysis.cs",
+                        on_token=stream_to_placeholder(stream_placeholder, "code_analysis", language="json"),
                     )
+                    stream_placeholder.empty()
                     if analysis_result:
+                        record_analysis_history(analysis_input, "CodeAnalysis.cs", analysis_result)
                         st.session_state.current_analysis = analysis_result
                         st.success("분석 완료!")
                     else:
@@ -997,8 +1139,10 @@ def code_analysis_tab():
             st.rerun()
 
     with col2:
-        st.markdown("**분석 결과**")
         if "current_analysis" in st.session_state and st.session_state.current_analysis:
+            first_output = last_first_output_time("code_analysis")
+            if first_output is not None:
+                st.caption(f"첫 출력까지 {first_output:.2f}초")
             display_analysis_results(st.session_state.current_analysis)
         else:
             st.markdown(
@@ -1019,7 +1163,7 @@ def code_analysis_tab():
         for i, analysis in enumerate(reversed(recent_analyses)):
             timestamp = analysis.get("timestamp", "Unknown")
             filename = analysis.get("filename", "Unknown")
-            issues_count = len(analysis.get("potential_issues", []))
+            issues_count = analysis.get("issues_count", 0)
 
             with st.expander(
                 f"분석 #{len(recent_analyses)-i} - {filename} ({timestamp})"
@@ -1028,8 +1172,12 @@ def code_analysis_tab():
                 if analysis.get("summary"):
                     st.markdown(f"**요약:** {analysis['summary']}")
                 if st.button(f"다시 분석", key=f"reanalyze_{i}"):
-                    st.session_state.current_analysis = analysis
-                    st.rerun()
+                    cached_analysis = get_analysis_cache().get(analysis["cache_key"])
+                    if cached_analysis:
+                        st.session_state.current_analysis = cached_analysis
+                        st.rerun()
+                    else:
+                        st.warning("캐시에서 만료된 분석입니다. 코드를 다시 분석해주세요.")
     else:
         st.info("아직 분석 기록이 없습니다. 첫 번째 코드 분석을 시작해보세요!")
 
@@ -1048,6 +1196,9 @@ def main():
         unsafe_allow_html=True,
     )
 
+    # 이 스크립트 실행에서 일어나는 AI 호출(단일 변환/분석)을 세션 단위로 집계
+    set_call_tags(session_id=current_session_id())
+
     setup_sidebar()
 
     # 탭 생성
@@ -6,12 +6,19 @@ import json
 from datetime import datetime
 from openai import AzureOpenAI
 
-# 환경 변수 및 클라이언트 설정
-client = AzureOpenAI(
-    api_version=os.getenv("OPENAI_API_VERSION", "2024-12-01-preview"),
-    azure_endpoint=os.getenv("AZURE_ENDPOINT"),
-    api_key=os.getenv("OPENAI_API_KEY"),
-)
+from conversion_core import get_http_client
+
+# 환경 변수 및 클라이언트 설정 (재실행마다 다시 만들지 않도록 프로세스당 한 번만 생성, HTTP 연결 풀은 공용)
+@st.cache_resource(show_spinner=False)
+def get_client():
+    return AzureOpenAI(
+        api_version=os.getenv("OPENAI_API_VERSION", "2024-12-01-preview"),
+        azure_endpoint=os.getenv("AZURE_ENDPOINT"),
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=get_http_client(),
+    )
+
+
 DEPLOYMENT_NAME = os.getenv("DEPLOYMENT_NAME")
 
 # 페이지 설정
@@ -51,7 +58,7 @@ st.markdown("""
 def test_connection():
     """Azure OpenAI 연결 테스트"""
     try:
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model=DEPLOYMENT_NAME,
             messages=[{"role": "user", "content": "Hello"}],
             max_tokens=50,
@@ -77,7 +84,7 @@ JSON 형식으로 응답:
 }}"""
     
     try:
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model=DEPLOYMENT_NAME,
             messages=[
                 {"role": "system", "content": "C# to Java 변환 전문가입니다."},
@@ -135,7 +142,7 @@ JSON 형식으로 응답:
 }}"""
     
     try:
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model=DEPLOYMENT_NAME,
             messages=[
                 {"role": "system", "content": "C# 코드 분석 전문가입니다."},
@@ -0,0 +1,220 @@
+"""Batch API 를 이용한 오프라인 대량 변환
+
+대화형 응답 속도가 필요 없는 대규모 마이그레이션(야간 작업 등)에서 사용합니다.
+
+1. 변환 캐시에 없는 요청을 OpenAI Batch 형식 JSONL 로 작성
+2. 파일 업로드 후 배치 제출 (/batches)
+3. 완료될 때까지 상태 조회
+4. 결과를 일반 변환과 같은 파싱 경로로 반영 (conversion_results 형식, 변환 캐시에도 저장)
+
+요청 수집과 결과 반영은 call_ai 를 스레드별 핸들러로 대체하여 수행하므로
+프롬프트 구성/파싱/대용량 파일 분할 로직이 실시간 변환과 동일하게 적용됩니다.
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+
+from conversion_core import CONFIG, convert_file_pack, get_client, json_mode_params, set_call_handler
+from conversion_engine import (
+    OUTCOME_FAILED,
+    OUTCOME_OK,
+    current_outcome,
+    current_usage,
+    report_outcome,
+    report_usage,
+    reset_call_state,
+)
+from llm_cache import make_cache_key
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+BATCH_POLL_INTERVAL_SECONDS = 30
+
+
+def batch_request_id(messages, max_tokens):
+    """요청 내용으로 만든 custom_id (수집/반영 단계에서 같은 요청을 찾는 키)"""
+    return make_cache_key("batch", CONFIG["batch_deployment_name"], messages, max_tokens)
+
+
+def _run_with_handler(files, project_context, options, handler):
+    """call_ai 를 handler 로 대체한 상태에서 파일들을 변환하고 files 순서대로 [(결과, 호출 결과, 사용량)] 반환
+
+    파일마다 따로 변환하며 묶음 변환은 사용하지 않습니다. 묶음 응답에서 빠진 파일의 개별 요청은
+    수집 단계에서 만들어지지 않아 반영 단계에서 배치 결과를 찾을 수 없기 때문입니다.
+    """
+
+    def attach_handler():
+        set_call_handler(handler)
+
+    outputs = []
+    attach_handler()
+    try:
+        for file_info in files:
+            reset_call_state()
+            # 분할 변환의 청크 워커 스레드에도 같은 핸들러 적용
+            results = convert_file_pack([file_info], project_context, options, initializer=attach_handler)
+            outputs.append((results[0], current_outcome(), dict(current_usage())))
+    finally:
+        set_call_handler(None)
+    return outputs
+
+
+def collect_batch_requests(files, project_context="", options=None):
+    """변환 캐시에 없는 AI 요청을 모아 {custom_id: Batch 요청} 반환"""
+    requests = {}
+
+    def handler(messages, max_tokens):
+        custom_id = batch_request_id(messages, max_tokens)
+        requests[custom_id] = {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": CONFIG["batch_deployment_name"],
+                "messages": messages,
+                "max_tokens": max_tokens,
+                "temperature": 0.1,
+                **json_mode_params(),
+            },
+        }
+        return None
+
+    _run_with_handler(files, project_context, options, handler)
+    return requests
+
+
+def write_batch_file(requests, path):
+    with open(path, "w", encoding="utf-8") as f:
+        for request in requests.values():
+            f.write(json.dumps(request, ensure_ascii=False) + "\n")
+
+
+def submit_batch(path):
+    """요청 파일을 업로드하고 배치 작업을 생성하여 배치 객체(dict) 반환"""
+    # httpx 는 openai 와 함께 실제로 호출할 때 import (모듈 로드 시간 단축)
+    import httpx
+
+    client = get_client()
+    with open(path, "rb") as f:
+        uploaded = client.files.create(file=f, purpose="batch")
+    response = client.post(
+        "/batches",
+        cast_to=httpx.Response,
+        body={
+            "input_file_id": uploaded.id,
+            "endpoint": BATCH_ENDPOINT,
+            "completion_window": BATCH_COMPLETION_WINDOW,
+        },
+    )
+    return response.json()
+
+
+def get_batch(batch_id):
+    import httpx
+
+    return get_client().get(f"/batches/{batch_id}", cast_to=httpx.Response).json()
+
+
+def wait_for_batch(batch_id, poll_interval=BATCH_POLL_INTERVAL_SECONDS, on_status=None):
+    """배치가 종료 상태가 될 때까지 조회 (on_status(batch) 는 조회할 때마다 호출)"""
+    while True:
+        batch = get_batch(batch_id)
+        if on_status:
+            on_status(batch)
+        if batch["status"] in BATCH_TERMINAL_STATUSES:
+            return batch
+        time.sleep(poll_interval)
+
+
+def download_batch_results(batch):
+    """{custom_id: 응답 body} (실패한 요청은 None)"""
+    responses = {}
+    for key in ("output_file_id", "error_file_id"):
+        file_id = batch.get(key)
+        if not file_id:
+            continue
+        for line in get_client().files.content(file_id).text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get("response") or {}
+            responses[item["custom_id"]] = response.get("body") if response.get("status_code") == 200 else None
+    return responses
+
+
+def ingest_batch_results(files, project_context="", options=None, responses=None):
+    """배치 응답을 일반 변환과 같은 경로로 파싱하여 [(결과, 호출 결과, 사용량)] 반환
+
+    결과는 conversion_results 형식(original_filename, java_filename 등 포함)이며 변환 캐시에도 저장됩니다.
+    """
+    responses = responses or {}
+
+    def handler(messages, max_tokens):
+        custom_id = batch_request_id(messages, max_tokens)
+        body = responses.get(custom_id)
+        if not body:
+            if custom_id in responses:
+                error = "배치 요청 실패"
+            else:
+                error = "배치 결과에 없는 요청입니다"
+            report_outcome(OUTCOME_FAILED, error)
+            logger.error("%s (%s)", error, custom_id)
+            return None
+        usage = body.get("usage") or {}
+        report_usage(
+            usage.get("prompt_tokens"),
+            usage.get("completion_tokens"),
+            (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0,
+        )
+        report_outcome(OUTCOME_OK)
+        return body["choices"][0]["message"]["content"]
+
+    outputs = _run_with_handler(files, project_context, options, handler)
+    for file_info, (result, _, _) in zip(files, outputs):
+        result["original_content"] = file_info["content"]
+    return outputs
+
+
+def run_batch_conversion(
+    files,
+    project_context="",
+    options=None,
+    batch_id=None,
+    requests_path=None,
+    poll_interval=BATCH_POLL_INTERVAL_SECONDS,
+    on_submitted=None,
+    on_status=None,
+):
+    """요청 작성 → 제출 → 완료 대기 → 결과 반영을 한 번에 수행하고 [(결과, 호출 결과, 사용량)] 반환
+
+    batch_id 를 주면 새로 제출하지 않고 기존 배치를 이어서 기다립니다 (재시작 후 재개).
+    on_submitted(batch_id) 로 배치 ID 를 저장해 두면 중단되어도 다시 제출하지 않습니다.
+    requests_path 를 주면 요청 JSONL 을 그 위치에 남깁니다.
+    """
+    if batch_id is None:
+        requests = collect_batch_requests(files, project_context, options)
+        if requests:
+            path = requests_path or os.path.join(tempfile.mkdtemp(prefix="csharp2java_batch_"), "batch_requests.jsonl")
+            write_batch_file(requests, path)
+            try:
+                batch_id = submit_batch(path)["id"]
+            finally:
+                if requests_path is None:
+                    os.remove(path)
+                    os.rmdir(os.path.dirname(path))
+            logger.info("배치 제출: %s (%d개 요청)", batch_id, len(requests))
+            if on_submitted:
+                on_submitted(batch_id)
+
+    responses = {}
+    if batch_id:
+        batch = wait_for_batch(batch_id, poll_interval, on_status)
+        if batch["status"] != "completed":
+            raise RuntimeError(f"배치 작업이 '{batch['status']}' 상태로 종료되었습니다 ({batch_id})")
+        responses = download_batch_results(batch)
+    return ingest_batch_results(files, project_context, options, responses)
@@ -0,0 +1,559 @@
+"""오프라인 변환 파이프라인 벤치마크 (실제 토큰 사용 없음)
+
+conversion_core 의 공유 클라이언트를 지연 시간/오류율/응답 크기를 조절할 수 있는
+프로세스 내 fake 클라이언트로 바꾼 뒤, 업로드 ZIP 추출 → 프로젝트 컨텍스트 → 변환 → 패키징
+단계를 실행하여 단계별 시간, 처리량(files/sec), 메모리 최고치를 보고합니다.
+
+    python benchmark.py --files 200 --latency 0.8 --latency-dist lognormal
+    python benchmark.py --files 500 --rate-limit-ratio 0.05 --json bench.json
+    python benchmark.py --baseline bench.json --max-regression 0.2
+
+--baseline 과 비교하여 처리량이 떨어지거나 메모리/단계 시간이 허용치 이상 늘어나면 종료 코드 1 을 반환합니다.
+"""
+import argparse
+import io
+import json
+import math
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+from conversion_core import (
+    CONFIG,
+    analyze_project_context,
+    convert_file_pack,
+    failed_file_pack,
+    get_parse_stats,
+    get_prompt_cache_stats,
+    get_syntax_stats,
+    get_request_scheduler,
+    get_telemetry,
+    pack_small_files,
+    result_status,
+    set_client,
+)
+from conversion_engine import AdaptiveConcurrencyLimiter, run_concurrent
+from fake_openai import FakeSettings, _completion_body
+from project_archive import ProjectArchive, write_java_only_zip, write_project_zip
+
+# 저장소에 포함된 예제 C# 파일 (합성 프로젝트에도 함께 포함)
+SAMPLE_FILES = ("GameLoop.cs", "MoviesController.cs")
+STAGES = ("extract", "context", "conversion", "packaging")
+
+# 기준 결과와 비교할 지표 (지표 이름, 값이 클수록 좋은지)
+REGRESSION_METRICS = [
+    ("files_per_second", True),
+    ("peak_memory_mb", False),
+    ("stage_seconds.extract", False),
+    ("stage_seconds.context", False),
+    ("stage_seconds.packaging", False),
+    ("startup.core_import_seconds", False),
+    ("startup.app_first_run_seconds", False),
+    ("startup.app_rerun_seconds", False),
+]
+
+# 새 인터프리터에서 실행할 시작 시간 측정 코드
+_CORE_IMPORT_SCRIPT = """
+import time
+started_at = time.perf_counter()
+import conversion_core, conversion_jobs
+print(time.perf_counter() - started_at)
+"""
+_APP_RUN_SCRIPT = """
+import json, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout=120)
+started_at = time.perf_counter()
+at.run()
+first_run = time.perf_counter() - started_at
+reruns = []
+for _ in range({reruns}):
+    started_at = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - started_at)
+print(json.dumps({{"first_run": first_run, "reruns": reruns, "exception": bool(at.exception)}}))
+"""
+
+
+# 지연 시간 분포 (fixed / uniform / lognormal, 평균이 mean 이 되도록 설정)
+class LatencyModel:
+    def __init__(self, mean=0.0, distribution="fixed", spread=0.5, output_tokens_per_second=0.0):
+        self.mean = mean
+        self.distribution = distribution
+        self.spread = spread  # uniform: 평균 대비 ±비율, lognormal: sigma
+        self.output_tokens_per_second = output_tokens_per_second
+
+    def sample(self, completion_tokens=0):
+        if self.distribution == "uniform":
+            delay = random.uniform(self.mean * (1 - self.spread), self.mean * (1 + self.spread))
+        elif self.distribution == "lognormal" and self.mean > 0:
+            mu = _lognormal_mu(self.mean, self.spread)
+            delay = random.lognormvariate(mu, self.spread)
+        else:
+            delay = self.mean
+        # 응답이 길수록 생성 시간이 늘어나도록 출력 토큰 속도 반영
+        if self.output_tokens_per_second > 0:
+            delay += completion_tokens / self.output_tokens_per_second
+        return max(0.0, delay)
+
+
+def _lognormal_mu(mean, sigma):
+    # E[X] = exp(mu + sigma^2 / 2) 이므로 평균이 mean 이 되는 mu
+    return math.log(mean) - sigma ** 2 / 2
+
+
+# openai 클라이언트의 chat.completions.create 만 흉내 내는 프로세스 내 fake 클라이언트
+class FakeAzureClient:
+    def __init__(self, latency=None, rate_limit_ratio=0.0, error_ratio=0.0, retry_after=0.2, **settings_kwargs):
+        """settings_kwargs 는 fake_openai.FakeSettings 로 전달 (malformed_ratio, pack_drop_ratio, response_chars, broken_java_ratio)"""
+        self.latency = latency or LatencyModel()
+        self.rate_limit_ratio = rate_limit_ratio
+        self.error_ratio = error_ratio
+        self.retry_after = retry_after
+        self.settings = FakeSettings(retry_after=retry_after, **settings_kwargs)
+        self.settings.stats["errors"] = 0
+        self.chat = self
+        self.completions = self
+
+    def _count(self, name):
+        with self.settings.lock:
+            self.settings.stats[name] += 1
+
+    def create(self, **request):
+        # httpx/openai 는 실제로 호출할 때 import (benchmark import 시 openai 를 불러오지 않도록)
+        import httpx
+        from openai import APIConnectionError, RateLimitError
+        from openai.types.chat import ChatCompletion
+
+        self._count("requests")
+        http_request = httpx.Request("POST", "http://fake-azure-openai/chat/completions")
+        roll = random.random()
+        if roll < self.rate_limit_ratio:
+            self._count("rate_limited")
+            response = httpx.Response(429, headers={"retry-after": str(self.retry_after)}, request=http_request)
+            raise RateLimitError("Rate limit reached (fake)", response=response, body=None)
+        if roll < self.rate_limit_ratio + self.error_ratio:
+            self._count("errors")
+            time.sleep(self.latency.sample())
+            raise APIConnectionError(request=http_request)
+
+        body = _completion_body(self.settings, request)
+        time.sleep(self.latency.sample(body["usage"]["completion_tokens"]))
+        if not request.get("stream"):
+            return ChatCompletion.construct(**body)
+        return self._stream(body)
+
+    @staticmethod
+    def _stream(body, chunk_chars=200):
+        from openai.types.chat import ChatCompletionChunk
+
+        content = body["choices"][0]["message"]["content"]
+        base = {"id": body["id"], "object": "chat.completion.chunk", "created": body["created"], "model": body["model"]}
+        for start in range(0, len(content), chunk_chars):
+            yield ChatCompletionChunk.construct(
+                **base,
+                choices=[{"index": 0, "delta": {"content": content[start:start + chunk_chars]}, "finish_reason": None}],
+            )
+        yield ChatCompletionChunk.construct(**base, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}])
+
+
+# 합성 프로젝트 생성 (DTO 같은 작은 파일, 서비스 파일, 분할 변환 대상인 대용량 파일)
+def _dto_source(namespace, index):
+    properties = "\n".join(
+        f"        public string Field{n} {{ get; set; }}" for n in range(6 + index % 10)
+    )
+    return f"""using System;
+
+namespace {namespace}.Models
+{{
+    public class Dto{index}
+    {{
+        public int Id {{ get; set; }}
+{properties}
+    }}
+}}
+"""
+
+
+def _service_source(namespace, index, dto_count):
+    methods = "\n\n".join(
+        f"""        public async Task<Dto{(index + n) % dto_count}> GetItem{n}Async(int id)
+        {{
+            var item = await _repository.FindAsync<Dto{(index + n) % dto_count}>(id);
+            if (item == null)
+            {{
+                throw new KeyNotFoundException($"Item {{id}} not found");
+            }}
+            return item;
+        }}"""
+        for n in range(8)
+    )
+    return f"""using System;
+using System.Collections.Generic;
+using System.Threading.Tasks;
+using {namespace}.Models;
+
+namespace {namespace}.Services
+{{
+    public class Service{index}
+    {{
+        private readonly IRepository _repository;
+
+        public Service{index}(IRepository repository)
+        {{
+            _repository = repository;
+        }}
+
+{methods}
+    }}
+}}
+"""
+
+
+def _large_source(namespace, index, target_chars=60000):
+    methods = []
+    size = 0
+    n = 0
+    while size < target_chars:
+        method = f"""        public List<int> Calculate{n}(List<int> values)
+        {{
+            var result = new List<int>();
+            foreach (var value in values)
+            {{
+                // 단계 {n} 의 계산
+                result.Add(value * {n + 1} + _offset);
+            }}
+            return result;
+        }}
+"""
+        methods.append(method)
+        size += len(method)
+        n += 1
+    body = "\n".join(methods)
+    return f"""using System;
+using System.Collections.Generic;
+
+namespace {namespace}.Engine
+{{
+    public class LargeProcessor{index}
+    {{
+        private int _offset = {index};
+
+{body}    }}
+}}
+"""
+
+
+def build_project(files=200, large_files=2, service_ratio=0.3, seed=0, include_samples=True):
+    """합성 C# 프로젝트 [{"filename", "content"}] (+ 저장소 예제 파일)"""
+    rng = random.Random(seed)
+    namespace = "Benchmark"
+    sources = []
+    if include_samples:
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        for name in SAMPLE_FILES:
+            path = os.path.join(base_dir, name)
+            if os.path.exists(path):
+                with open(path, encoding="utf-8-sig") as f:
+                    sources.append({"filename": f"Samples/{name}", "content": f.read()})
+
+    generated = max(0, files - len(sources) - large_files)
+    service_count = int(generated * service_ratio)
+    dto_count = max(1, generated - service_count)
+    for index in range(dto_count):
+        sources.append({"filename": f"Models/Dto{index}.cs", "content": _dto_source(namespace, index)})
+    for index in range(service_count):
+        sources.append({"filename": f"Services/Service{index}.cs", "content": _service_source(namespace, index, dto_count)})
+    for index in range(large_files):
+        sources.append({
+            "filename": f"Engine/LargeProcessor{index}.cs",
+            "content": _large_source(namespace, index, rng.randint(40000, 80000)),
+        })
+    return sources
+
+
+def build_project_zip(sources, name="BenchmarkProject.zip"):
+    """업로드 ZIP 과 같은 형태의 파일 객체 (CS 외 프로젝트 파일도 포함)"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr("Benchmark.csproj", '<Project Sdk="Microsoft.NET.Sdk.Web">\n</Project>\n')
+        zip_file.writestr("appsettings.json", json.dumps({"Logging": {"LogLevel": {"Default": "Information"}}}))
+        zip_file.writestr("wwwroot/logo.png", os.urandom(64 * 1024))
+        for source in sources:
+            zip_file.writestr(source["filename"], source["content"])
+    buffer.name = name
+    buffer.seek(0)
+    return buffer
+
+
+# 단계별 경과 시간/메모리 측정
+class StageTimer:
+    def __init__(self):
+        self.seconds = {}
+        self.peak_memory = {}
+
+    def run(self, stage, fn):
+        tracemalloc.reset_peak()
+        started_at = time.perf_counter()
+        result = fn()
+        self.seconds[stage] = time.perf_counter() - started_at
+        self.peak_memory[stage] = tracemalloc.get_traced_memory()[1]
+        return result
+
+
+def extract_files(upload):
+    """app.extract_csharp_files 와 같은 방식으로 ZIP 을 디스크에 저장하고 CS 파일만 읽음"""
+    archive = ProjectArchive.from_upload(upload)
+    extracted = []
+    for entry, content in archive.iter_contents(lambda entry: entry["path"].endswith(".cs")):
+        extracted.append({"filename": entry["path"], "content": content.decode("utf-8"), "zip_source": upload.name})
+    return archive, extracted
+
+
+def package_results(archive, conversion_results):
+    """create_complete_project_zip / create_java_only_zip 과 같은 ZIP 작성 (크기 반환)"""
+    java_files = {
+        result["original_filename"]: (result["original_filename"].replace(".cs", ".java"), result["java_code"])
+        for result in conversion_results
+    }
+    sizes = {}
+    with tempfile.SpooledTemporaryFile(max_size=50 * 1024 * 1024) as output:
+        write_project_zip(output, [archive], java_files)
+        sizes["complete_zip_bytes"] = output.tell()
+    with tempfile.SpooledTemporaryFile(max_size=50 * 1024 * 1024) as output:
+        write_java_only_zip(output, conversion_results)
+        sizes["java_only_zip_bytes"] = output.tell()
+    return sizes
+
+
+def run_benchmark(fake_client, sources, options=None, workers=8, use_project_context=True):
+    """fake 클라이언트로 전체 파이프라인을 실행하고 결과 지표 dict 반환"""
+    options = dict(options or {})
+    upload = build_project_zip(sources)
+    timer = StageTimer()
+
+    original_client = set_client(fake_client)
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    archive = None
+    try:
+        archive, extracted = timer.run("extract", lambda: extract_files(upload))
+        project_context = timer.run(
+            "context",
+            lambda: analyze_project_context(extracted) if use_project_context else "",
+        )
+
+        def convert():
+            units = pack_small_files(extracted, options)
+            outputs = run_concurrent(
+                units,
+                lambda unit: convert_file_pack(unit, project_context, options),
+                limiter=AdaptiveConcurrencyLimiter(initial=min(4, workers), max_limit=workers),
+                on_error=failed_file_pack,
+            )
+            return units, [result for unit_results in outputs for result in unit_results]
+
+        units, results = timer.run("conversion", convert)
+        package_sizes = timer.run("packaging", lambda: package_results(archive, results))
+        total_seconds = time.perf_counter() - started_at
+    finally:
+        tracemalloc.stop()
+        set_client(original_client)
+        if archive is not None:
+            archive.cleanup()
+
+    statuses = {}
+    for result in results:
+        status = result_status(result)
+        statuses[status] = statuses.get(status, 0) + 1
+
+    telemetry = get_telemetry()
+    summary = telemetry.summarize(telemetry.records())
+    return {
+        "files": len(extracted),
+        "source_chars": sum(len(f["content"]) for f in extracted),
+        "conversion_units": len(units),
+        "total_seconds": total_seconds,
+        "files_per_second": len(extracted) / total_seconds if total_seconds else None,
+        "conversion_files_per_second": len(extracted) / timer.seconds["conversion"] if timer.seconds["conversion"] else None,
+        "stage_seconds": timer.seconds,
+        "stage_peak_memory_mb": {stage: peak / 1024 / 1024 for stage, peak in timer.peak_memory.items()},
+        "peak_memory_mb": max(timer.peak_memory.values()) / 1024 / 1024,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "statuses": statuses,
+        "rule_based_files": sum(1 for result in results if result.get("converter") == "rules"),
+        "llm_calls": summary["calls"],
+        "llm_failed_calls": summary["failed_calls"],
+        "latency_p50": summary["latency_p50"],
+        "latency_p95": summary["latency_p95"],
+        "prompt_tokens": summary["prompt_tokens"],
+        "completion_tokens": summary["completion_tokens"],
+        "cached_tokens": summary["cached_tokens"],
+        "prompt_cache_hit_rate": get_prompt_cache_stats()["hit_rate"],
+        "scheduler": dict(get_request_scheduler().stats),
+        "fake_client": dict(fake_client.settings.stats),
+        "parse": get_parse_stats(),
+        "syntax": get_syntax_stats(),
+        **package_sizes,
+    }
+
+
+def _run_script(script, env):
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=base_dir, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return output.strip().splitlines()[-1]
+
+
+def measure_startup(work_dir, runs=3):
+    """새 프로세스 기준 핵심 모듈 import 시간과 Streamlit 앱 첫 실행/재실행 시간 (초, 중앙값)
+
+    Streamlit 이 재실행마다 app.py 최상위 코드를 다시 실행하므로 재실행 시간도 함께 측정합니다.
+    """
+    env = dict(
+        os.environ,
+        LLM_CACHE_PATH=os.path.join(work_dir, "startup_cache.sqlite3"),
+        JOB_STORE_PATH=os.path.join(work_dir, "startup_jobs.sqlite3"),
+    )
+    core_import = [float(_run_script(_CORE_IMPORT_SCRIPT, env)) for _ in range(runs)]
+    startup = {"core_import_seconds": statistics.median(core_import)}
+    try:
+        app_run = json.loads(_run_script(_APP_RUN_SCRIPT.format(reruns=runs), env))
+    except (subprocess.CalledProcessError, ValueError, IndexError):
+        return startup  # streamlit 이 없는 환경 등
+    startup["app_first_run_seconds"] = app_run["first_run"]
+    startup["app_rerun_seconds"] = statistics.median(app_run["reruns"])
+    startup["app_exception"] = app_run["exception"]
+    return startup
+
+
+def _metric(report, name):
+    value = report
+    for part in name.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def compare_to_baseline(report, baseline, max_regression):
+    """허용치(max_regression, 비율)를 넘는 악화 지표 목록 [(지표, 기준값, 현재값)]"""
+    regressions = []
+    for name, higher_is_better in REGRESSION_METRICS:
+        current = _metric(report, name)
+        previous = _metric(baseline, name)
+        if not current or not previous:
+            continue
+        if higher_is_better:
+            worse = current < previous * (1 - max_regression)
+        else:
+            worse = current > previous * (1 + max_regression)
+        if worse:
+            regressions.append((name, previous, current))
+    return regressions
+
+
+def print_report(report):
+    print(f"파일 {report['files']}개 ({report['source_chars']:,}자), 변환 단위 {report['conversion_units']}개")
+    print(f"전체 {report['total_seconds']:.2f}초, {report['files_per_second']:.1f} files/sec "
+          f"(변환 단계 {report['conversion_files_per_second']:.1f} files/sec)")
+    for stage in STAGES:
+        print(f"  {stage:<10} {report['stage_seconds'][stage]:8.3f}초  최고 {report['stage_peak_memory_mb'][stage]:8.1f} MB")
+    print(f"메모리 최고치 {report['peak_memory_mb']:.1f} MB (tracemalloc), 최대 RSS {report['max_rss_mb']:.1f} MB")
+    print(f"규칙 기반 로컬 변환 {report['rule_based_files']}개 파일, "
+          f"AI 호출 {report['llm_calls']}건 (실패 {report['llm_failed_calls']}건), "
+          f"지연 p50 {report['latency_p50'] or 0:.3f}초 / p95 {report['latency_p95'] or 0:.3f}초")
+    print(f"프롬프트 캐시: 입력 {report['prompt_tokens']:,} 토큰 중 {report['cached_tokens']:,} 토큰 적중 "
+          f"({report['prompt_cache_hit_rate']:.1f}%)")
+    print(f"재시도 {report['scheduler']['retries']}회, 429 {report['scheduler']['throttled']}회, "
+          f"결과 상태 {report['statuses']}")
+    print(f"Java 구문 오류 {report['syntax']['failed']}개 파일 중 부분 수정 {report['syntax']['repaired']}개 "
+          f"(수정 요청 {report['syntax']['repair_requests']}건)")
+    print(f"ZIP 크기: 전체 {report['complete_zip_bytes']:,} / Java {report['java_only_zip_bytes']:,} bytes")
+    startup = report.get("startup")
+    if startup:
+        line = f"시작 시간: 핵심 모듈 import {startup['core_import_seconds']:.3f}초"
+        if "app_first_run_seconds" in startup:
+            line += f", 앱 첫 실행 {startup['app_first_run_seconds']:.3f}초 / 재실행 {startup['app_rerun_seconds']:.3f}초"
+        print(line)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="fake Azure OpenAI 클라이언트로 변환 파이프라인 성능을 측정합니다")
+    parser.add_argument("--files", type=int, default=200, help="합성 프로젝트의 C# 파일 수 (예제 파일 포함)")
+    parser.add_argument("--large-files", type=int, default=2, help="분할 변환 대상인 대용량 파일 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드 (지연/오류 재현용)")
+    parser.add_argument("--workers", type=int, default=8, help="최대 동시 변환 수")
+    parser.add_argument("--latency", type=float, default=0.5, help="응답 지연 평균 (초)")
+    parser.add_argument("--latency-dist", choices=["fixed", "uniform", "lognormal"], default="lognormal", help="응답 지연 분포")
+    parser.add_argument("--latency-spread", type=float, default=0.5, help="uniform: 평균 대비 ±비율, lognormal: sigma")
+    parser.add_argument("--output-tps", type=float, default=0.0, help="출력 토큰 생성 속도 (tokens/sec, 0 이면 미반영)")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="429 로 응답할 요청 비율 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=0.2, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--error-ratio", type=float, default=0.0, help="연결 오류로 실패할 요청 비율 (0~1)")
+    parser.add_argument("--malformed-ratio", type=float, default=0.0, help="형식이 깨진 JSON 을 돌려줄 비율 (0~1)")
+    parser.add_argument("--response-chars", type=int, default=0, help="변환 결과 java_code 의 최소 길이")
+    parser.add_argument("--broken-java-ratio", type=float, default=0.0, help="구문 오류가 있는 Java 코드를 돌려줄 비율 (0~1)")
+    parser.add_argument("--no-packing", action="store_true", help="작은 파일을 묶어서 변환하지 않음")
+    parser.add_argument("--no-chunking", action="store_true", help="대용량 파일 분할 변환을 사용하지 않음")
+    parser.add_argument("--no-fast-path", action="store_true", help="단순 파일도 규칙 기반 로컬 변환 없이 AI 로 변환")
+    parser.add_argument("--no-project-context", action="store_true", help="프로젝트 컨텍스트 분석 단계를 건너뜀")
+    parser.add_argument("--startup", action="store_true", help="모듈 import 시간과 Streamlit 앱 첫 실행/재실행 시간도 측정")
+    parser.add_argument("--json", help="결과를 저장할 JSON 경로 (다음 실행의 --baseline 으로 사용)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="허용하는 악화 비율 (기본 0.2 = 20%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    random.seed(args.seed)
+
+    # 이전 실행의 캐시가 결과를 왜곡하지 않도록 임시 캐시/넉넉한 호출 한도 사용
+    work_dir = tempfile.mkdtemp(prefix="csharp2java_bench_")
+    CONFIG["cache_path"] = os.path.join(work_dir, "llm_cache.sqlite3")
+    CONFIG["telemetry_path"] = None
+    CONFIG["rpm_limit"] = max(CONFIG["rpm_limit"], 1000000)
+    CONFIG["tpm_limit"] = max(CONFIG["tpm_limit"], 1000000000)
+
+    fake_client = FakeAzureClient(
+        latency=LatencyModel(args.latency, args.latency_dist, args.latency_spread, args.output_tps),
+        rate_limit_ratio=args.rate_limit_ratio,
+        error_ratio=args.error_ratio,
+        retry_after=args.retry_after,
+        malformed_ratio=args.malformed_ratio,
+        response_chars=args.response_chars,
+        broken_java_ratio=args.broken_java_ratio,
+    )
+    sources = build_project(args.files, args.large_files, seed=args.seed)
+    options = {"use_packing": not args.no_packing, "use_chunking": not args.no_chunking, "use_fast_path": not args.no_fast_path}
+    report = run_benchmark(fake_client, sources, options, args.workers, not args.no_project_context)
+    if args.startup:
+        report["startup"] = measure_startup(work_dir)
+    report["settings"] = {key: value for key, value in vars(args).items() if key not in ("json", "baseline")}
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.max_regression)
+        for name, previous, current in regressions:
+            print(f"성능 저하: {name} {previous:.3f} → {current:.3f}")
+        if regressions:
+            return 1
+        print(f"기준 결과 대비 {args.max_regression:.0%} 이상 악화된 지표가 없습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1440 @@
+"""C# to Java 변환/분석 핵심 로직 (Streamlit 비의존)
+
+app.py (Streamlit UI) 와 convert_cli.py (배치 CLI) 가 함께 사용합니다.
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+from dotenv import load_dotenv
+
+from conversion_engine import (
+    OUTCOME_FAILED,
+    OUTCOME_OK,
+    OUTCOME_THROTTLED,
+    current_call_tags,
+    current_error,
+    current_outcome,
+    report_outcome,
+    report_throttle,
+    report_usage,
+    run_subtasks,
+)
+from csharp_chunker import split_csharp_file, stitch_java
+from csharp_index import build_symbol_index, project_context_from_index, select_file_context
+from csharp_rules import convert_simple_csharp
+from java_syntax import check_java_syntax, close_open_blocks, find_broken_members, fragment_errors, replace_members
+from llm_cache import (
+    LLMResultCache,
+    content_hash,
+    make_cache_key,
+    normalize_csharp_source,
+)
+from llm_json import PARSE_FAILED, PARSE_OK, PARSE_TRUNCATED, extract_json_object
+from llm_telemetry import LLMTelemetry
+from rate_limiter import RequestScheduler, estimate_request_tokens
+
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 설정
+CONFIG = {
+    "endpoint": os.getenv("AZURE_ENDPOINT"),
+    "model_name": "gpt-4.1",
+    "deployment_name": os.getenv("DEPLOYMENT_NAME"),
+    # Batch API 는 별도의 GlobalBatch 배포를 사용 (없으면 기본 배포)
+    "batch_deployment_name": os.getenv("BATCH_DEPLOYMENT_NAME", os.getenv("DEPLOYMENT_NAME")),
+    "api_key": os.getenv("OPENAI_API_KEY"),
+    "api_version": os.getenv("OPENAI_API_VERSION", "2024-12-01-preview"),
+    "cache_path": os.getenv("LLM_CACHE_PATH", ".cache/llm_cache.sqlite3"),
+    "job_store_path": os.getenv("JOB_STORE_PATH", ".cache/conversion_jobs.sqlite3"),
+    # 끝난 변환 작업 보존 기간(일)과 최대 보관 개수 (넘으면 원본/결과/업로드 ZIP 을 함께 삭제)
+    "job_retention_days": float(os.getenv("JOB_RETENTION_DAYS", "7")),
+    "job_max_count": int(os.getenv("JOB_MAX_COUNT", "200")),
+    # 화면에 표시 중인 변환 결과 메모리 캐시 (전체 / 세션별 한도 MB, 이 시간 동안 사용이 없는 세션은 비움)
+    "result_cache_mb": int(os.getenv("RESULT_CACHE_MB", "64")),
+    "result_session_quota_mb": int(os.getenv("RESULT_SESSION_QUOTA_MB", "8")),
+    "result_idle_seconds": int(os.getenv("RESULT_IDLE_SECONDS", "1800")),
+    "rpm_limit": int(os.getenv("AZURE_RPM_LIMIT", "60")),
+    "tpm_limit": int(os.getenv("AZURE_TPM_LIMIT", "60000")),
+    # JSON 모드 (response_format=json_object) 지원 배포/API 버전에서만 사용
+    "json_mode": os.getenv("AZURE_JSON_MODE", "true").lower() != "false",
+    # 설정하면 AI 호출 기록을 JSONL 로도 추가 저장
+    "telemetry_path": os.getenv("LLM_TELEMETRY_PATH"),
+    # 프로세스 공용 HTTP 연결 풀 (동시 변환 수보다 넉넉하게, keep-alive 는 유휴 연결이 끊기기 전까지 유지)
+    "http_max_connections": int(os.getenv("AZURE_HTTP_MAX_CONNECTIONS", "50")),
+    "http_max_keepalive": int(os.getenv("AZURE_HTTP_MAX_KEEPALIVE", "20")),
+    "http_keepalive_expiry": float(os.getenv("AZURE_HTTP_KEEPALIVE_EXPIRY", "120")),
+    "http_connect_timeout": float(os.getenv("AZURE_HTTP_CONNECT_TIMEOUT", "10")),
+    "http_read_timeout": float(os.getenv("AZURE_HTTP_READ_TIMEOUT", "120")),
+    "http2": os.getenv("AZURE_HTTP2", "false").lower() == "true",
+}
+
+# 프롬프트 템플릿 버전 (프롬프트 변경 시 올려서 이전 캐시 무효화)
+PROMPT_TEMPLATE_VERSION = "3"
+
+# 프로세스 공용 자원 (모든 세션/워커 스레드가 공유, 클라이언트는 생성 중 HTTP 연결 풀을 만들므로 RLock)
+_shared = {}
+_shared_lock = threading.RLock()
+
+
+def _get_shared(name, factory):
+    with _shared_lock:
+        if name not in _shared:
+            _shared[name] = factory()
+        return _shared[name]
+
+
+# 프로세스 공용 HTTP 클라이언트와 전송 계층 (모든 Azure OpenAI 클라이언트가 같은 연결 풀 사용)
+def get_http_client():
+    return _get_http()[0]
+
+
+def _get_http():
+    def create():
+        # httpx 도 openai 와 함께 처음 사용할 때 import
+        from http_transport import create_http_client
+
+        return create_http_client(
+            max_connections=CONFIG["http_max_connections"],
+            max_keepalive_connections=CONFIG["http_max_keepalive"],
+            keepalive_expiry=CONFIG["http_keepalive_expiry"],
+            connect_timeout=CONFIG["http_connect_timeout"],
+            read_timeout=CONFIG["http_read_timeout"],
+            http2=CONFIG["http2"],
+        )
+
+    return _get_shared("http", create)
+
+
+def get_http_pool_stats():
+    """연결 풀 사용 현황 (아직 AI 호출 전이면 None)"""
+    with _shared_lock:
+        http = _shared.get("http")
+    if http is None:
+        return None
+    transport = http[1]
+    return dict(transport.stats.snapshot(), **transport.pool_state())
+
+
+# Azure OpenAI 클라이언트 생성
+def create_client():
+    # openai 패키지는 불러오는 데 오래 걸리므로 (약 0.7초) 첫 AI 호출 시점에 import
+    from openai import AzureOpenAI
+
+    return AzureOpenAI(
+        api_version=CONFIG["api_version"],
+        azure_endpoint=CONFIG["endpoint"],
+        api_key=CONFIG["api_key"],
+        max_retries=0,  # 재시도는 RequestScheduler 에서 처리
+        http_client=get_http_client(),
+    )
+
+
+# 클라이언트 생성 함수 (Streamlit 앱은 import 시점에 st.cache_resource 함수를 등록)
+_client_factory = create_client
+
+
+def set_client_factory(factory):
+    global _client_factory
+    _client_factory = factory
+
+
+# 공유 Azure OpenAI 클라이언트 (처음 사용할 때 프로세스당 한 번만 생성)
+def get_client():
+    return _get_shared("client", lambda: _client_factory())
+
+
+def set_client(new_client):
+    """공유 클라이언트 교체 (Streamlit 의 st.cache_resource 클라이언트, 벤치마크의 fake 클라이언트 등) 후 이전 값 반환
+
+    None 을 주면 다음 get_client 호출 때 새로 생성합니다.
+    """
+    with _shared_lock:
+        previous = _shared.pop("client", None)
+        if new_client is not None:
+            _shared["client"] = new_client
+    return previous
+
+
+# 변환 결과 캐시
+def get_conversion_cache():
+    return _get_shared("conversion_cache", lambda: LLMResultCache(CONFIG["cache_path"], namespace="conversion"))
+
+
+# RPM/TPM 한도를 지키는 요청 스케줄러
+def get_request_scheduler():
+    return _get_shared("request_scheduler", lambda: RequestScheduler(CONFIG["rpm_limit"], CONFIG["tpm_limit"]))
+
+
+# 코드 분석 결과 캐시 (주석/공백을 제거한 정규화 소스 기준)
+def get_analysis_cache():
+    return _get_shared("analysis_cache", lambda: LLMResultCache(CONFIG["cache_path"], namespace="analysis", max_disk_items=2000))
+
+
+# AI 호출별 토큰/지연 시간 기록
+def get_telemetry():
+    return _get_shared("telemetry", lambda: LLMTelemetry(path=CONFIG["telemetry_path"]))
+
+
+# 프롬프트 캐시(Azure OpenAI 접두부 캐시) 사용 현황 (프로세스 전체)
+_prompt_cache_stats = {
+    "calls": 0,
+    "prompt_tokens": 0,
+    "cached_tokens": 0,
+    "cached_calls": 0,
+    "cached_latency": 0.0,
+    "uncached_latency": 0.0,
+}
+_prompt_cache_lock = threading.Lock()
+
+
+def _cached_prompt_tokens(usage):
+    # openai 1.3.x 의 CompletionUsage 에는 prompt_tokens_details 필드가 없어 추가 필드(dict)로 전달됨
+    details = getattr(usage, "prompt_tokens_details", None)
+    if isinstance(details, dict):
+        return details.get("cached_tokens") or 0
+    return getattr(details, "cached_tokens", 0) or 0
+
+
+def record_prompt_cache_usage(prompt_tokens, cached_tokens, latency):
+    with _prompt_cache_lock:
+        stats = _prompt_cache_stats
+        stats["calls"] += 1
+        stats["prompt_tokens"] += prompt_tokens or 0
+        stats["cached_tokens"] += cached_tokens
+        if cached_tokens:
+            stats["cached_calls"] += 1
+            stats["cached_latency"] += latency
+        else:
+            stats["uncached_latency"] += latency
+
+
+def get_prompt_cache_stats():
+    """프롬프트 캐시 적중률(토큰 기준 %)과 캐시 적중/미적중 호출의 평균 지연 시간(초)"""
+    with _prompt_cache_lock:
+        stats = dict(_prompt_cache_stats)
+    uncached_calls = stats["calls"] - stats["cached_calls"]
+    stats["hit_rate"] = stats["cached_tokens"] / stats["prompt_tokens"] * 100 if stats["prompt_tokens"] else 0.0
+    stats["avg_cached_latency"] = stats["cached_latency"] / stats["cached_calls"] if stats["cached_calls"] else None
+    stats["avg_uncached_latency"] = stats["uncached_latency"] / uncached_calls if uncached_calls else None
+    return stats
+
+
+# AI 호출 오류 표시 함수 (기본은 로그, Streamlit 앱에서는 st.error 로 교체)
+_error_reporter = logger.error
+
+
+def set_error_reporter(reporter):
+    global _error_reporter
+    _error_reporter = reporter
+
+
+# 연결 테스트는 변환 요청보다 짧은 타임아웃 사용 (같은 연결 풀 공유)
+CONNECTION_TEST_TIMEOUT_SECONDS = 15
+
+
+# Azure OpenAI 연결 테스트
+def test_connection():
+    try:
+        response = get_client().with_options(timeout=CONNECTION_TEST_TIMEOUT_SECONDS).chat.completions.create(
+            model=CONFIG["deployment_name"],
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant."},
+                {
+                    "role": "user",
+                    "content": "Hello! Please respond with 'Connection successful!'",
+                },
+            ],
+            max_tokens=50,
+            temperature=0.1,
+        )
+        return True, response.choices[0].message.content
+    except Exception as e:
+        return False, str(e)
+
+
+# 스레드별 AI 호출 대체 함수 (배치 모드에서 요청 수집/결과 재생에 사용)
+_call_handler = threading.local()
+
+
+def set_call_handler(handler):
+    """현재 스레드의 call_ai 를 handler(messages, max_tokens) 로 대체 (None 이면 해제)"""
+    _call_handler.value = handler
+
+
+# 동시성을 줄여 다시 시도할 오류 (except 절은 예외가 났을 때만 평가되므로 이때 openai 는 이미 로드됨)
+def _throttle_errors():
+    from openai import APITimeoutError, RateLimitError
+
+    return (RateLimitError, APITimeoutError)
+
+
+# AI 호출 공통 함수 (on_token 을 주면 stream=True 로 받아 누적 텍스트를 전달)
+def call_ai(system_prompt, user_prompt, max_tokens=4000, on_token=None, operation="convert", filename=""):
+    """operation/filename 은 호출 기록(텔레메트리)용 (convert, convert_chunk, convert_pack, repair, analyze)"""
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+    handler = getattr(_call_handler, "value", None)
+    if handler is not None:
+        return handler(messages, max_tokens)
+
+    # 요청 자체의 지연 시간 (스케줄러 대기/재시도 시간 제외)
+    timing = {}
+    telemetry = {"operation": operation, "filename": filename, "stream": on_token is not None}
+    try:
+        def request():
+            timing["started_at"] = time.perf_counter()
+            return get_client().chat.completions.create(
+                model=CONFIG["deployment_name"],
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=0.1,
+                stream=on_token is not None,
+                **json_mode_params(),
+            )
+
+        # 토큰 버킷으로 RPM/TPM 예산을 확보한 뒤 호출 (429 는 Retry-After 에 맞춰 재시도하고, 429 마다 동시성 축소)
+        response = get_request_scheduler().execute(
+            request, estimate_request_tokens(messages, max_tokens), on_throttle=report_throttle
+        )
+        if on_token is None:
+            content = response.choices[0].message.content
+            telemetry["finish_reason"] = response.choices[0].finish_reason
+            if response.usage is not None:
+                cached_tokens = _cached_prompt_tokens(response.usage)
+                report_usage(response.usage.prompt_tokens, response.usage.completion_tokens, cached_tokens)
+                record_prompt_cache_usage(response.usage.prompt_tokens, cached_tokens, time.perf_counter() - timing["started_at"])
+                telemetry.update(
+                    prompt_tokens=response.usage.prompt_tokens,
+                    completion_tokens=response.usage.completion_tokens,
+                    cached_tokens=cached_tokens,
+                )
+        else:
+            content = ""
+            for chunk in response:
+                # Azure 는 첫 청크로 choices 가 비어 있는 콘텐츠 필터 결과를 보낼 수 있음
+                if chunk.choices and chunk.choices[0].delta.content:
+                    if not content:
+                        telemetry["time_to_first_token"] = time.perf_counter() - timing["started_at"]
+                    content += chunk.choices[0].delta.content
+                    on_token(content)
+                if chunk.choices and chunk.choices[0].finish_reason:
+                    telemetry["finish_reason"] = chunk.choices[0].finish_reason
+            # 스트리밍 응답에는 usage 가 없으므로 토큰 수는 추정값으로 기록
+            telemetry.update(
+                prompt_tokens=estimate_request_tokens(messages, 0),
+                completion_tokens=len(content) // 3,
+                usage_estimated=True,
+            )
+        report_outcome(OUTCOME_OK)
+        _record_call(telemetry, timing, OUTCOME_OK)
+        return content
+    except _throttle_errors() as e:
+        # 재시도 횟수를 모두 쓴 429/타임아웃 (파일 상태를 rate_limited 로 표시)
+        report_outcome(OUTCOME_THROTTLED, str(e))
+        _record_call(telemetry, timing, OUTCOME_THROTTLED, str(e))
+        _error_reporter(f"AI 호출 오류: {e}")
+        return None
+    except Exception as e:
+        report_outcome(OUTCOME_FAILED, str(e))
+        _record_call(telemetry, timing, OUTCOME_FAILED, str(e))
+        _error_reporter(f"AI 호출 오류: {e}")
+        return None
+
+
+# AI 호출 한 건을 텔레메트리에 기록 (세션/작업 태그는 호출한 스레드의 태그 사용)
+def _record_call(telemetry, timing, outcome, error=None):
+    started_at = timing.get("started_at")
+    get_telemetry().record(
+        deployment=CONFIG["deployment_name"],
+        outcome=outcome,
+        error=error,
+        latency=time.perf_counter() - started_at if started_at is not None else None,
+        **current_call_tags(),
+        **telemetry,
+    )
+
+
+# JSON 모드 요청 파라미터 (모든 변환/분석 프롬프트가 JSON 응답을 요구)
+def json_mode_params():
+    return {"response_format": {"type": "json_object"}} if CONFIG["json_mode"] else {}
+
+
+# 응답 파싱 결과 집계 (파싱 실패율이 곧 재변환 비용)
+_parse_stats = {"responses": 0, "repaired": 0, "truncated": 0, "failed": 0}
+_parse_stats_lock = threading.Lock()
+
+# 잘린 응답을 보정하여 파싱한 결과에 붙는 경고 (캐시하지 않음)
+TRUNCATED_WARNING = "응답이 잘려 변환 결과가 불완전할 수 있습니다."
+
+
+def get_parse_stats():
+    with _parse_stats_lock:
+        stats = dict(_parse_stats)
+    responses = stats["responses"]
+    stats["failure_rate"] = stats["failed"] / responses * 100 if responses else 0.0
+    stats["repair_rate"] = (stats["repaired"] + stats["truncated"]) / responses * 100 if responses else 0.0
+    return stats
+
+
+def _parse_json(response_text):
+    """(dict 또는 None, 상태) 반환하고 파싱 결과를 집계"""
+    value, status = extract_json_object(response_text)
+    with _parse_stats_lock:
+        _parse_stats["responses"] += 1
+        if status != PARSE_OK:
+            _parse_stats[status] += 1
+    if status == PARSE_FAILED:
+        logger.warning("JSON 응답 파싱 실패 (%d자)", len(response_text or ""))
+    return value, status
+
+
+# JSON 파싱 유틸리티 (설명 문장/코드 펜스/이스케이프 오류/잘린 응답을 보정하여 추출)
+def parse_json_response(response_text, default_response):
+    value, status = _parse_json(response_text)
+    if value is None:
+        return default_response
+    # 보정/잘린 응답에는 일부 필드만 있을 수 있으므로 빠진 필드는 기본값으로 채움
+    # (기본 경고는 파싱 실패 안내이므로 파싱에 성공한 응답에는 빈 목록)
+    for key, default in default_response.items():
+        if key not in value:
+            value[key] = [] if key == "warnings" else default
+    if status == PARSE_TRUNCATED and "warnings" in default_response:
+        warnings = value.get("warnings")
+        value["warnings"] = (warnings if isinstance(warnings, list) else []) + [TRUNCATED_WARNING]
+    return value
+
+
+# 캐시에 저장할 수 있는 결과인지 (파싱 실패/잘린 응답/구문 오류가 남은 코드는 다시 요청할 수 있도록 제외)
+def is_cacheable_result(result, default_response):
+    return (
+        result is not default_response
+        and TRUNCATED_WARNING not in result.get("warnings", [])
+        and result.get("status") != STATUS_SYNTAX_ERROR
+        and fragment_errors(result.get("java_code", "")) is None
+    )
+
+
+# 파일별 변환 결과 상태 (결과의 "status" 에 저장, 원인은 "status_detail")
+STATUS_OK = "ok"
+STATUS_TRUNCATED = "truncated"  # 응답이 잘려 일부만 변환됨
+STATUS_SYNTAX_ERROR = "syntax_error"  # 로컬 Java 구문 검사 실패 (오류 부분 수정 요청 후에도 남음)
+STATUS_PARSE_FAILED = "parse_failed"  # 응답 JSON 을 파싱하지 못해 원문을 그대로 사용
+STATUS_RATE_LIMITED = "rate_limited"  # 429/타임아웃으로 재시도 후에도 실패
+STATUS_ERROR = "error"  # 그 밖의 AI 호출 오류
+
+# 심각도 순서 (여러 호출을 합친 결과는 가장 나쁜 상태를 따름)
+_STATUS_SEVERITY = [STATUS_OK, STATUS_TRUNCATED, STATUS_SYNTAX_ERROR, STATUS_PARSE_FAILED, STATUS_RATE_LIMITED, STATUS_ERROR]
+
+
+def result_status(result):
+    """변환 결과의 상태 (상태가 저장되지 않은 이전 결과는 내용으로 판단)"""
+    if result.get("status"):
+        return result["status"]
+    if "변환 오류 발생" in result.get("java_code", ""):
+        return STATUS_ERROR
+    warnings = result.get("warnings", [])
+    if any("JSON 파싱 실패" in warning for warning in warnings):
+        return STATUS_PARSE_FAILED
+    if TRUNCATED_WARNING in warnings:
+        return STATUS_TRUNCATED
+    return STATUS_OK
+
+
+def worst_status(statuses):
+    return max(statuses, key=_STATUS_SEVERITY.index, default=STATUS_OK)
+
+
+def _call_failure(result):
+    """AI 호출 실패 결과에 상태와 원인 추가"""
+    result["status"] = STATUS_RATE_LIMITED if current_outcome() == OUTCOME_THROTTLED else STATUS_ERROR
+    result["status_detail"] = current_error() or "AI 호출 실패"
+    return result
+
+
+# 예기치 않은 예외로 변환하지 못한 결과 (작업 전체를 중단하지 않고 해당 파일만 오류 처리)
+def failed_conversion(error):
+    return {
+        "java_code": "// 변환 오류 발생",
+        "imports": [],
+        "conversion_notes": "변환 실패",
+        "warnings": ["변환 실패"],
+        "status": STATUS_ERROR,
+        "status_detail": f"변환 중 예외 발생: {type(error).__name__}: {error}",
+    }
+
+
+def _with_parse_status(result, default_response):
+    """파싱 결과에 상태와 원인 추가"""
+    if result is default_response:
+        result["status"] = STATUS_PARSE_FAILED
+        result["status_detail"] = "응답 JSON 을 파싱하지 못해 원문을 Java 코드로 사용했습니다."
+    elif TRUNCATED_WARNING in result.get("warnings", []):
+        result["status"] = STATUS_TRUNCATED
+        result["status_detail"] = TRUNCATED_WARNING
+    else:
+        result["status"] = STATUS_OK
+        result["status_detail"] = ""
+    return result
+
+
+_JSON_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+# 스트리밍 중인(미완성) JSON 응답에서 문자열 필드 값 추출
+def extract_streaming_field(response_text, field):
+    key_index = response_text.find(f'"{field}"')
+    if key_index == -1:
+        return ""
+    colon = response_text.find(":", key_index + len(field) + 2)
+    start = response_text.find('"', colon + 1) if colon != -1 else -1
+    if start == -1:
+        return ""
+
+    value = []
+    i = start + 1
+    while i < len(response_text):
+        ch = response_text[i]
+        if ch == '"':
+            break
+        if ch == "\\":
+            if i + 1 >= len(response_text):
+                break  # 이스케이프가 잘린 채로 도착
+            escape = response_text[i + 1]
+            if escape == "u":
+                code = response_text[i + 2:i + 6]
+                if len(code) < 4:
+                    break
+                try:
+                    value.append(chr(int(code, 16)))
+                except ValueError:
+                    pass
+                i += 6
+                continue
+            value.append(_JSON_ESCAPES.get(escape, escape))
+            i += 2
+            continue
+        value.append(ch)
+        i += 1
+    return "".join(value)
+
+
+# 변환 응답 JSON 형식 (모드별)
+_CONVERSION_RESPONSE_FORMATS = {
+    "file": """{{
+    "java_code": "변환된 Java 코드",
+    "imports": ["필요한 import 문들"],
+    "conversion_notes": "주요 변환 사항 설명",
+    "warnings": ["주의가 필요한 부분들"],
+    "applied_options": {applied_options}
+}}""",
+    "project": """{{
+    "java_code": "변환된 Java 코드",
+    "package_declaration": "package 선언",
+    "imports": ["필요한 import 문들"],
+    "conversion_notes": "주요 변환 사항 설명",
+    "warnings": ["주의가 필요한 부분들"],
+    "type_mappings": {{"C#타입": "Java타입"}},
+    "applied_options": {applied_options}
+}}""",
+    "chunk": """{{
+    "java_code": "변환된 Java 멤버 코드 (package, import, 클래스 선언 없이 멤버만)",
+    "imports": ["필요한 import 문들"],
+    "warnings": ["주의가 필요한 부분들"]
+}}""",
+    "pack": """{{
+    "files": [
+        {{
+            "filename": "입력 파일명 (그대로)",
+            "java_code": "변환된 Java 코드",
+            "imports": ["필요한 import 문들"],
+            "conversion_notes": "주요 변환 사항 설명",
+            "warnings": ["주의가 필요한 부분들"]
+        }}
+    ]
+}}""",
+    "project_pack": """{{
+    "files": [
+        {{
+            "filename": "입력 파일명 (그대로)",
+            "java_code": "변환된 Java 코드",
+            "package_declaration": "package 선언",
+            "imports": ["필요한 import 문들"],
+            "conversion_notes": "주요 변환 사항 설명",
+            "warnings": ["주의가 필요한 부분들"],
+            "type_mappings": {{"C#타입": "Java타입"}}
+        }}
+    ]
+}}""",
+}
+
+# 모든 변환 호출의 시스템 프롬프트 앞부분 (옵션/모드와 무관하게 항상 같은 내용)
+# Azure OpenAI 프롬프트 캐시는 1024 토큰 이상 같은 접두부부터 적용되므로 변환 지침을 모두 이 부분에 둠
+_CONVERSION_GUIDE = r"""당신은 C# to Java 코드 변환 전문가입니다. 아래 변환 가이드를 따라 C# 코드를 동작이 같은 Java 코드로 변환하세요.
+뒤에 나오는 변환 옵션과 모드별 규칙이 이 가이드와 다르면 옵션/규칙을 우선합니다.
+
+[타입 매핑]
+- string → String, object → Object, bool → boolean, char → char, float/double → float/double
+- sbyte → byte, byte → byte (0~255 값을 다루면 int 로 확장), short/int/long → short/int/long
+- ushort → int, uint → long, ulong → long (범위를 넘을 수 있으면 java.math.BigInteger), decimal → java.math.BigDecimal
+- int?, bool? 같은 nullable 값 타입 → 래퍼 타입 (Integer, Boolean 등)
+- 제네릭 타입 인자에는 기본형 대신 래퍼 타입 사용 (List<int> → List<Integer>)
+- DateTime → java.time.LocalDateTime, DateTimeOffset → java.time.OffsetDateTime, DateOnly → LocalDate, TimeOnly → LocalTime
+- TimeSpan → java.time.Duration, Guid → java.util.UUID, Random → java.util.Random, StringBuilder → StringBuilder
+- List<T> → List<T> (ArrayList), Dictionary<K,V> → Map<K,V> (HashMap), HashSet<T> → Set<T> (HashSet)
+- SortedDictionary<K,V> → TreeMap<K,V>, Queue<T> → Deque<T> (ArrayDeque), Stack<T> → Deque<T> (push/pop)
+- IEnumerable<T> → Iterable<T> 또는 Stream<T>, ICollection<T> → Collection<T>, IList<T>/IReadOnlyList<T> → List<T>
+- KeyValuePair<K,V> → Map.Entry<K,V>, Tuple/ValueTuple → record 또는 전용 클래스
+- T[] 는 그대로, 다차원 배열 T[,] → T[][], Array.Empty<T>() → 길이 0 배열
+- Task → CompletableFuture<Void>, Task<T> → CompletableFuture<T>
+- Action → Runnable/Consumer/BiConsumer, Func → Supplier/Function/BiFunction, Predicate<T> → Predicate<T>
+- 그 밖의 delegate → @FunctionalInterface 인터페이스
+- ArgumentException → IllegalArgumentException, ArgumentNullException → NullPointerException (Objects.requireNonNull)
+- InvalidOperationException → IllegalStateException, NotImplementedException/NotSupportedException → UnsupportedOperationException
+- IndexOutOfRangeException/ArgumentOutOfRangeException → IndexOutOfBoundsException, KeyNotFoundException → NoSuchElementException
+- FormatException → NumberFormatException 또는 IllegalArgumentException, IOException → java.io.IOException (checked 예외는 throws 선언)
+
+[선언 변환]
+- namespace → package, using → 필요한 import 를 명시적으로 작성 (java.util.*, java.time.* 등 와일드카드 사용 금지)
+- 파일당 public 최상위 타입은 하나, 중첩 타입은 static 중첩 클래스로 변환
+- 속성(Property) 은 변환 옵션에 따라 private 필드 + getter/setter 또는 public 필드로 변환
+- get 만 있는 속성 → final 필드 + getter, 계산 속성 → getter 메서드, init 접근자 → 생성자 매개변수
+- 생성자 체이닝 : this(...) / : base(...) → 생성자 첫 줄의 this(...) / super(...)
+- override → @Override, virtual 은 제거, abstract 는 유지, sealed 클래스 → final 클래스, sealed override → final 메서드
+- static class → private 생성자를 가진 final 클래스, const → static final, readonly 필드 → final 필드
+- struct → final 클래스 (값 비교가 필요하면 equals/hashCode 구현) 또는 record, record → Java record
+- enum → Java enum (명시적 값이 있으면 값 필드, 생성자, getter 추가, [Flags] enum 은 EnumSet 으로 조합)
+- interface 의 기본 구현 메서드 → default 메서드, 인터페이스 이름의 I 접두사는 유지
+- 확장 메서드(this 매개변수) → static 유틸리티 메서드, partial 클래스 → 하나의 클래스로 합침
+- 연산자 오버로딩 → 이름 있는 메서드 (add, subtract, equals, compareTo), 인덱서 → get/set 메서드
+- out/ref 매개변수 → 반환 값 또는 결과 객체로 변경, 선택적 매개변수/명명된 인수 → 메서드 오버로딩
+- params T[] → 가변 인자 T..., 제네릭 제약 where T : Base → <T extends Base>, where T : new() → Supplier<T> 매개변수
+- event/EventHandler → 리스너 인터페이스와 add/remove 메서드
+- 특성(Attribute) 은 대응하는 어노테이션이 있으면 사용 ([Obsolete] → @Deprecated, [Serializable] → implements Serializable), 없으면 주석으로 남김
+
+[문장/식 변환]
+- 지역 변수 var 는 Java var 사용 가능, 필드/반환 타입은 명시적 타입
+- 문자열 보간 $"..." → String.format 또는 문자열 연결, 축자 문자열 @"..." → 이스케이프한 일반 문자열 또는 텍스트 블록
+- C# 전용 이스케이프(\a, \v, \e, \x, \U, \0 뒤 숫자)는 Java 에서 쓸 수 없으므로 \u 형식으로 변환
+- string.IsNullOrEmpty(s) → s == null || s.isEmpty(), string.IsNullOrWhiteSpace(s) → s == null || s.isBlank()
+- string.Format → String.format, string.Join → String.join, 문자열 == 비교 → equals (null 가능성이 있으면 Objects.equals)
+- ?. / ?? / ??= → null 검사, Optional 또는 Objects.requireNonNullElse
+- is 패턴 / as 캐스트 → instanceof 패턴 매칭, switch 식 → Java switch 식(->), when 조건은 if 로 분리
+- foreach → 향상된 for, using 문/선언 → try-with-resources (IDisposable → AutoCloseable)
+- lock → synchronized 블록, Interlocked → java.util.concurrent.atomic 클래스
+- async/await → CompletableFuture 조합 (supplyAsync, thenApply, thenCompose, join)
+- LINQ → Stream API: Where → filter, Select → map, SelectMany → flatMap, OrderBy/ThenBy → sorted(Comparator.comparing(...).thenComparing(...))
+- First/FirstOrDefault → findFirst().orElseThrow() / orElse(null), Any → anyMatch, All → allMatch, Count → count
+- Sum → mapToInt(...).sum(), ToList → collect(Collectors.toList()), ToDictionary → Collectors.toMap, GroupBy → Collectors.groupingBy, Distinct → distinct
+- #region, #if 같은 전처리기 지시문은 제거하고 필요하면 주석으로 설명
+- checked/unchecked, unsafe, 포인터처럼 Java 에 없는 기능은 가장 가까운 구현으로 바꾸고 warnings 에 기록
+
+[출력 규칙]
+- 괄호 짝, 세미콜론, import 가 빠지지 않은 컴파일 가능한 Java 코드를 작성
+- 원본에 없는 비즈니스 로직을 추가하지 말고 동작을 그대로 유지
+- 확신할 수 없는 변환이나 수동 검토가 필요한 부분은 warnings 에 구체적으로 기록
+- 응답은 지정한 JSON 형식만 사용하고 JSON 밖에 설명 문장이나 코드 블록을 쓰지 않음"""
+
+# 시스템 프롬프트에 넣을 프로젝트 컨텍스트 최대 크기 (넘으면 파일별로 필요한 부분만 사용자 메시지에 포함)
+PROMPT_CONTEXT_MAX_CHARS = 12000
+
+
+_PROJECT_RULES = """
+프로젝트 단위 변환 규칙:
+1. 클래스명은 일관되게 변환
+2. 인터페이스 구현 관계 유지
+3. 커스텀 타입은 적절한 Java 타입으로 매핑
+4. 네임스페이스는 package로 변환
+5. '프로젝트 컨텍스트 정보'(시스템 프롬프트 또는 사용자 메시지)가 있으면 이를 활용하여 타입 변환 시 일관성을 유지"""
+
+_CHUNK_RULES = """
+대용량 파일 분할 변환 규칙:
+- 사용자 메시지의 '공통 헤더'는 문맥 참고용이며, '변환 대상 멤버'만 Java로 변환
+- package, import, 클래스 선언 없이 멤버 코드만 작성"""
+
+
+_PACK_RULES = """
+여러 파일 묶음 변환 규칙:
+- 사용자 메시지의 각 파일을 독립된 Java 파일로 변환
+- files 배열에 입력 파일마다 하나씩, 입력 순서대로 항목을 작성하고 filename 은 입력 파일명을 그대로 사용"""
+
+
+# 시스템 프롬프트에 넣을 프로젝트 전체 컨텍스트 (너무 크면 "" 를 반환하여 파일별 선택 컨텍스트 사용)
+def shared_project_context(project_context):
+    if not project_context:
+        return ""
+    if isinstance(project_context, str):
+        text = project_context
+    else:
+        text = json.dumps(project_context, ensure_ascii=False, separators=(",", ":"))
+    return text if len(text) <= PROMPT_CONTEXT_MAX_CHARS else ""
+
+
+# 변환 옵션을 시스템 프롬프트에 포함하는 함수
+def create_conversion_system_prompt(include_comments=True, generate_getters_setters=True, use_java_conventions=True, mode="file", project_context=""):
+    """변환 시스템 프롬프트 (변환 가이드, 프로젝트 컨텍스트, 옵션, 응답 JSON 형식)
+
+    앞부분은 항상 같은 변환 가이드이고, 그 뒤에 같은 작업의 모든 파일이 공유하는 프로젝트 컨텍스트
+    (shared_project_context 결과), 옵션, 모드별 규칙 순으로 배치합니다. 파일마다 달라지는 내용
+    (파일명, 코드)은 사용자 메시지에만 있으므로 모든 호출이 1024 토큰 이상의 같은 접두부를 공유하여
+    Azure OpenAI 프롬프트 캐시가 적용됩니다.
+    """
+    base_prompt = _CONVERSION_GUIDE
+    if project_context:
+        base_prompt += f"\n\n프로젝트 컨텍스트 정보:\n{project_context}"
+    
+    options = []
+    if include_comments:
+        options.append("- 원본 C# 코드의 주석을 Java 스타일로 변환하여 포함하세요")
+    else:
+        options.append("- 주석은 제거하고 코드만 변환하세요")
+    
+    if generate_getters_setters:
+        options.append("- C# Properties는 private 필드와 public getter/setter 메서드로 변환하세요")
+    else:
+        options.append("- C# Properties는 public 필드로 간단히 변환하세요")
+    
+    if use_java_conventions:
+        options.append("- Java 네이밍 컨벤션을 적용하세요 (camelCase, 패키지명 소문자 등)")
+    else:
+        options.append("- 원본 C# 네이밍을 최대한 유지하세요")
+    
+    if options:
+        base_prompt += "\n\n변환 옵션:\n" + "\n".join(options)
+
+    if mode in ("project", "project_pack"):
+        base_prompt += "\n" + _PROJECT_RULES
+    elif mode == "chunk":
+        base_prompt += "\n" + _CHUNK_RULES
+    if mode in ("pack", "project_pack"):
+        base_prompt += "\n" + _PACK_RULES
+
+    applied_options = json.dumps({
+        "include_comments": include_comments,
+        "generate_getters_setters": generate_getters_setters,
+        "use_java_conventions": use_java_conventions,
+    })
+    response_format = _CONVERSION_RESPONSE_FORMATS[mode].format(applied_options=applied_options)
+    base_prompt += f"\n\n반드시 다음 JSON 형식으로 응답하세요:\n{response_format}"
+    
+    return base_prompt
+
+
+# C# 코드 분석 결과 캐시 키 (주석/공백 차이는 무시)
+def analysis_cache_key(csharp_code):
+    return make_cache_key(
+        "analyze",
+        CONFIG["deployment_name"],
+        PROMPT_TEMPLATE_VERSION,
+        content_hash(normalize_csharp_source(csharp_code)),
+    )
+
+
+# C# 코드 분석
+def analyze_csharp_code(csharp_code, filename="", on_token=None):
+    cache = get_analysis_cache()
+    cache_key = analysis_cache_key(csharp_code)
+
+    result = cache.get(cache_key)
+    if result is None:
+        result, parsed = _request_code_analysis(csharp_code, filename, on_token)
+        if result is None:
+            return None
+        # 파싱에 실패한 응답은 캐시하지 않음
+        if parsed:
+            cache.set(cache_key, result)
+    return result
+
+
+# 코드 분석 시스템 프롬프트 (모든 분석 호출이 동일한 접두부를 공유)
+ANALYSIS_SYSTEM_PROMPT = """당신은 20년 경력의 시니어 C# 개발자이자 코드 리뷰 전문가입니다. 정확하고 실용적인 분석을 제공해주세요.
+
+반드시 다음 JSON 형식으로 응답하세요:
+{
+    "complexity_score": 숫자(1-10),
+    "quality_score": 숫자(1-100),
+    "code_patterns": ["패턴1", "패턴2"],
+    "potential_issues": [
+        {"type": "성능|보안|가독성|유지보수", "description": "문제점 설명", "severity": "low|medium|high", "line_info": "해당 라인 정보"}
+    ],
+    "refactoring_suggestions": [
+        {"category": "성능|구조|네이밍|보안", "suggestion": "구체적인 개선 방안", "benefit": "개선시 얻을 수 있는 효과", "priority": "low|medium|high"}
+    ],
+    "java_conversion_notes": ["Java 변환시 주의사항1", "Java 변환시 주의사항2"],
+    "code_metrics": {"lines_of_code": 숫자, "methods_count": 숫자, "classes_count": 숫자, "estimated_maintainability": "low|medium|high"},
+    "summary": "코드에 대한 전반적인 평가와 요약"
+}"""
+
+
+# 코드 분석 AI 호출 (결과, 파싱 성공 여부) 반환
+def _request_code_analysis(csharp_code, filename, on_token=None):
+    user_prompt = f"""다음 C# 코드를 분석해주세요.
+
+파일명: {filename}
+C# 코드:
+```csharp
+{csharp_code}
+```
+"""
+
+    response_text = call_ai(ANALYSIS_SYSTEM_PROMPT, user_prompt, on_token=on_token, operation="analyze", filename=filename)
+    if not response_text:
+        return None, False
+
+    default_response = {
+        "complexity_score": 5,
+        "quality_score": 70,
+        "code_patterns": [],
+        "potential_issues": [],
+        "refactoring_suggestions": [],
+        "java_conversion_notes": [],
+        "code_metrics": {},
+        "summary": "분석 중 오류가 발생했습니다.",
+    }
+
+    result = parse_json_response(response_text, default_response)
+    return result, is_cacheable_result(result, default_response)
+
+
+# 파일 단위 변환 결과 캐시 키 (file_context 가 None 이면 단일 파일 변환, 아니면 프로젝트 단위 변환)
+def conversion_cache_key(csharp_code, include_comments, generate_getters_setters, use_java_conventions, file_context=None):
+    if file_context is None:
+        return make_cache_key(
+            "convert",
+            CONFIG["deployment_name"],
+            PROMPT_TEMPLATE_VERSION,
+            content_hash(csharp_code),
+            include_comments,
+            generate_getters_setters,
+            use_java_conventions,
+        )
+    return make_cache_key(
+        "convert_with_context",
+        CONFIG["deployment_name"],
+        PROMPT_TEMPLATE_VERSION,
+        content_hash(csharp_code),
+        include_comments,
+        generate_getters_setters,
+        use_java_conventions,
+        file_context,
+    )
+
+
+# C# to Java 변환 (옵션 적용)
+def convert_csharp_to_java(csharp_code, filename="", include_comments=True, generate_getters_setters=True, use_java_conventions=True, on_token=None):
+    cache = get_conversion_cache()
+    cache_key = conversion_cache_key(csharp_code, include_comments, generate_getters_setters, use_java_conventions)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    system_prompt = create_conversion_system_prompt(include_comments, generate_getters_setters, use_java_conventions)
+
+    user_prompt = f"""다음 C# 코드를 Java로 변환해주세요.
+
+파일명: {filename}
+C# 코드:
+```csharp
+{csharp_code}
+```
+"""
+
+    response_text = call_ai(system_prompt, user_prompt, on_token=on_token, filename=filename)
+    if not response_text:
+        return _call_failure({
+            "java_code": "// 변환 오류 발생",
+            "imports": [],
+            "conversion_notes": "변환 실패",
+            "warnings": ["변환 실패"],
+            "applied_options": {"include_comments": include_comments, "generate_getters_setters": generate_getters_setters, "use_java_conventions": use_java_conventions}
+        })
+
+    default_response = {
+        "java_code": response_text,
+        "imports": [],
+        "conversion_notes": "AI가 생성한 변환 결과입니다.",
+        "warnings": ["JSON 파싱 실패로 인해 상세 정보가 제한됩니다."],
+        "applied_options": {"include_comments": include_comments, "generate_getters_setters": generate_getters_setters, "use_java_conventions": use_java_conventions}
+    }
+
+    result = _with_parse_status(parse_json_response(response_text, default_response), default_response)
+    # 구문 오류는 캐시하기 전에 해당 부분만 수정 (수정하지 못한 결과는 다시 변환할 수 있도록 캐시하지 않음)
+    result = check_java_result(result, filename)
+    # 파싱에 실패했거나 잘린 응답은 캐시하지 않음
+    if is_cacheable_result(result, default_response):
+        cache.set(cache_key, result)
+    return result
+
+
+# 프로젝트 단위의 코드 변환
+def analyze_project_context(extracted_files):
+    """프로젝트 전체 컨텍스트 분석 (모든 파일의 선언부를 로컬에서 색인, LLM 호출 없음)"""
+    if len(extracted_files) <= 1:
+        return ""
+    return project_context_from_index(build_symbol_index(extracted_files))
+
+def convert_csharp_to_java_with_context(csharp_code, filename="", project_context="", include_comments=True, generate_getters_setters=True, use_java_conventions=True):
+    """프로젝트 컨텍스트를 고려한 C# to Java 변환"""
+    
+    # 이 파일이 참조하는 타입/네임스페이스 관련 컨텍스트만 사용 (캐시 키도 선택된 컨텍스트 기준)
+    file_context = select_file_context(project_context, csharp_code)
+
+    cache = get_conversion_cache()
+    cache_key = conversion_cache_key(csharp_code, include_comments, generate_getters_setters, use_java_conventions, file_context)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # 프로젝트 전체 컨텍스트는 모든 파일이 공유하는 시스템 프롬프트 접두부에, 파일명과 코드는 사용자 메시지 끝에 배치
+    # (컨텍스트가 너무 크면 이 파일이 참조하는 부분만 사용자 메시지에 포함)
+    shared_context = shared_project_context(project_context)
+    system_prompt = create_conversion_system_prompt(
+        include_comments, generate_getters_setters, use_java_conventions, mode="project", project_context=shared_context
+    )
+
+    context_info = ""
+    if file_context and not shared_context:
+        context_info = f"""
+프로젝트 컨텍스트 정보:
+{json.dumps(file_context, ensure_ascii=False, separators=(",", ":"))}
+"""
+
+    user_prompt = f"""다음 C# 코드를 Java로 변환해주세요.
+{context_info}
+파일명: {filename}
+C# 코드:
+```csharp
+{csharp_code}
+```
+"""
+
+    response_text = call_ai(system_prompt, user_prompt, max_tokens=5000, filename=filename)
+    if not response_text:
+        return _call_failure({
+            "java_code": "// 변환 오류 발생",
+            "package_declaration": "",
+            "imports": [],
+            "conversion_notes": "변환 실패",
+            "warnings": ["변환 실패"],
+            "type_mappings": {},
+            "applied_options": {"include_comments": include_comments, "generate_getters_setters": generate_getters_setters, "use_java_conventions": use_java_conventions}
+        })
+
+    default_response = {
+        "java_code": response_text,
+        "package_declaration": "",
+        "imports": [],
+        "conversion_notes": "AI가 생성한 변환 결과입니다.",
+        "warnings": ["JSON 파싱 실패로 인해 상세 정보가 제한됩니다."],
+        "type_mappings": {},
+        "applied_options": {"include_comments": include_comments, "generate_getters_setters": generate_getters_setters, "use_java_conventions": use_java_conventions}
+    }
+
+    result = _with_parse_status(parse_json_response(response_text, default_response), default_response)
+    # 구문 오류는 캐시하기 전에 해당 부분만 수정 (수정하지 못한 결과는 다시 변환할 수 있도록 캐시하지 않음)
+    result = check_java_result(result, filename)
+    # 파싱에 실패했거나 잘린 응답은 캐시하지 않음
+    if is_cacheable_result(result, default_response):
+        cache.set(cache_key, result)
+    return result
+
+
+# 대용량 C# 파일 분할 변환 (namespace/class/method 경계 기준)
+def convert_large_csharp_file(csharp_code, filename="", project_context="", include_comments=True, generate_getters_setters=True, use_java_conventions=True, initializer=None):
+    """큰 파일은 골격(타입 선언/필드)과 메서드 청크로 나누어 병렬 변환한 뒤 하나의 Java 파일로 합침
+
+    initializer 는 청크 변환 워커 스레드 시작 시 호출됩니다 (Streamlit 스크립트 컨텍스트 연결 등).
+    """
+    plan = split_csharp_file(csharp_code)
+    if plan is None:
+        if project_context:
+            return convert_csharp_to_java_with_context(csharp_code, filename, project_context, include_comments, generate_getters_setters, use_java_conventions)
+        return convert_csharp_to_java(csharp_code, filename, include_comments, generate_getters_setters, use_java_conventions)
+
+    def convert_part(chunk):
+        # None 은 골격 변환
+        if chunk is None:
+            if project_context:
+                return convert_csharp_to_java_with_context(plan["skeleton"], filename, project_context, include_comments, generate_getters_setters, use_java_conventions)
+            return convert_csharp_to_java(plan["skeleton"], filename, include_comments, generate_getters_setters, use_java_conventions)
+        return convert_csharp_chunk(chunk, filename, include_comments, generate_getters_setters, use_java_conventions)
+
+    parts = run_subtasks(
+        [None] + plan["chunks"], convert_part, initializer=initializer, on_error=lambda chunk, error: failed_conversion(error)
+    )
+    skeleton_result, chunk_results = parts[0], parts[1:]
+
+    java_code = stitch_java(
+        skeleton_result.get("java_code", ""),
+        [(chunk["type_name"], result.get("java_code", "")) for chunk, result in zip(plan["chunks"], chunk_results)],
+    )
+
+    imports = []
+    warnings = list(skeleton_result.get("warnings", []))
+    for result in [skeleton_result] + chunk_results:
+        for imp in result.get("imports", []):
+            if imp not in imports:
+                imports.append(imp)
+    for result in chunk_results:
+        warnings.extend(result.get("warnings", []))
+
+    merged = dict(skeleton_result)
+    merged.update({
+        "java_code": java_code,
+        "imports": imports,
+        "warnings": warnings,
+        "conversion_notes": f"{skeleton_result.get('conversion_notes', '')}\n(대용량 파일을 {len(plan['chunks'])}개 청크로 분할 변환했습니다.)".strip(),
+    })
+    # 청크 중 하나라도 실패하면 파일 전체 상태에 반영
+    parts = [skeleton_result] + chunk_results
+    merged["status"] = worst_status([result_status(result) for result in parts])
+    merged["status_detail"] = next(
+        (result.get("status_detail", "") for result in parts if result_status(result) == merged["status"]), ""
+    )
+    # 합친 코드의 구문 오류를 수정하지 못하면 다시 변환할 때 새로 요청하도록 청크 캐시를 지움
+    merged = check_java_result(merged, filename, initializer)
+    if merged["status"] == STATUS_SYNTAX_ERROR:
+        cache = get_conversion_cache()
+        for chunk in plan["chunks"]:
+            cache.delete(chunk_cache_key(chunk, include_comments, generate_getters_setters, use_java_conventions))
+    return merged
+
+
+def chunk_cache_key(chunk, include_comments=True, generate_getters_setters=True, use_java_conventions=True):
+    return make_cache_key(
+        "convert_chunk",
+        CONFIG["deployment_name"],
+        PROMPT_TEMPLATE_VERSION,
+        content_hash(chunk["shared_header"] + chunk["code"]),
+        include_comments,
+        generate_getters_setters,
+        use_java_conventions,
+    )
+
+
+# 분할된 메서드 청크 변환 (공통 헤더는 참고용 문맥으로만 사용)
+def convert_csharp_chunk(chunk, filename="", include_comments=True, generate_getters_setters=True, use_java_conventions=True):
+    cache = get_conversion_cache()
+    cache_key = chunk_cache_key(chunk, include_comments, generate_getters_setters, use_java_conventions)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    system_prompt = create_conversion_system_prompt(include_comments, generate_getters_setters, use_java_conventions, mode="chunk")
+
+    user_prompt = f"""다음은 대용량 C# 파일 중 {chunk["type_name"]} 타입의 일부 메서드입니다.
+
+파일명: {filename}
+공통 헤더:
+```csharp
+{chunk["shared_header"]}
+```
+
+변환 대상 멤버:
+```csharp
+{chunk["code"]}
+```
+"""
+
+    response_text = call_ai(system_prompt, user_prompt, operation="convert_chunk", filename=filename)
+    if not response_text:
+        return _call_failure({
+            "java_code": "// 변환 오류 발생",
+            "imports": [],
+            "warnings": ["변환 실패"],
+        })
+
+    default_response = {
+        "java_code": response_text,
+        "imports": [],
+        "warnings": ["JSON 파싱 실패로 인해 상세 정보가 제한됩니다."],
+    }
+
+    result = _with_parse_status(parse_json_response(response_text, default_response), default_response)
+    # 청크 결과는 멤버 조각이므로 괄호 오류가 있으면 합치기 전에 조각만 수정 요청
+    error = fragment_errors(result.get("java_code", "")) if result is not default_response else None
+    if error and repair_allowed():
+        fixed = repair_java_member({"code": result.get("java_code", ""), "error": error, "type_header": chunk["type_name"]}, filename)
+        if fixed is not None:
+            result["java_code"] = fixed
+    # 파싱에 실패했거나 잘린 응답은 캐시하지 않음
+    if is_cacheable_result(result, default_response):
+        cache.set(cache_key, result)
+    return result
+
+
+# 업로드/프로젝트 파일 하나 변환 (변환 옵션에 따라 분할/컨텍스트 변환 선택)
+def convert_project_file(file_info, project_context="", options=None, initializer=None):
+    """file_info: {"filename", "content"}, options: 변환 옵션 dict (conversion_options 형식)"""
+    options = options or {}
+    include_comments = options.get("include_comments", True)
+    generate_getters_setters = options.get("generate_getters_setters", True)
+    use_java_conventions = options.get("use_java_conventions", True)
+
+    # 대용량 파일은 청크 단위로 분할 변환
+    if options.get("use_chunking", True):
+        return convert_large_csharp_file(
+            file_info["content"],
+            file_info["filename"],
+            project_context,
+            include_comments,
+            generate_getters_setters,
+            use_java_conventions,
+            initializer=initializer,
+        )
+    # 컨텍스트 정보 포함 변환
+    if project_context:
+        return convert_csharp_to_java_with_context(
+            file_info["content"],
+            file_info["filename"],
+            project_context,
+            include_comments,
+            generate_getters_setters,
+            use_java_conventions,
+        )
+    return convert_csharp_to_java(
+        file_info["content"],
+        file_info["filename"],
+        include_comments,
+        generate_getters_setters,
+        use_java_conventions,
+    )
+
+
+
+# 작은 파일 묶음 변환 기준 (DTO/enum/interface 처럼 짧은 파일은 한 번의 요청으로 변환)
+PACK_FILE_MAX_CHARS = 2000  # 이보다 작은 파일만 묶음 대상
+PACK_MAX_CHARS = 16000  # 묶음 하나의 원본 코드 총량 (응답 토큰 한도 고려)
+PACK_MAX_FILES = 20
+
+
+def pack_small_files(files, options=None):
+    """변환 단위 목록 [[file_info, ...]] 반환 (작은 파일은 묶고, 나머지는 파일 하나가 한 단위)"""
+    options = options or {}
+    if not options.get("use_packing", True):
+        return [[file_info] for file_info in files]
+
+    units = []
+    pack, pack_chars, pack_names = [], 0, set()
+    for file_info in files:
+        size = len(file_info["content"])
+        if size > PACK_FILE_MAX_CHARS:
+            units.append([file_info])
+            continue
+        # 응답을 파일명으로 나누므로 같은 파일명은 한 묶음에 넣지 않음
+        if pack and (pack_chars + size > PACK_MAX_CHARS or len(pack) >= PACK_MAX_FILES or file_info["filename"] in pack_names):
+            units.append(pack)
+            pack, pack_chars, pack_names = [], 0, set()
+        pack.append(file_info)
+        pack_chars += size
+        pack_names.add(file_info["filename"])
+    if pack:
+        units.append(pack)
+    return units
+
+
+# 여러 개의 작은 파일을 한 번의 AI 호출로 변환
+def convert_csharp_pack(files, project_context="", include_comments=True, generate_getters_setters=True, use_java_conventions=True):
+    """파일 순서대로 변환 결과 리스트 반환 (응답에 없는 파일은 None, 호출 실패 시 모두 변환 오류 결과)
+
+    결과는 파일 단위 변환과 같은 캐시 키로 저장하므로 묶음 여부와 관계없이 캐시가 재사용됩니다.
+    """
+    applied_options = {"include_comments": include_comments, "generate_getters_setters": generate_getters_setters, "use_java_conventions": use_java_conventions}
+    cache = get_conversion_cache()
+    cache_keys = [
+        conversion_cache_key(
+            file_info["content"],
+            include_comments,
+            generate_getters_setters,
+            use_java_conventions,
+            select_file_context(project_context, file_info["content"]) if project_context else None,
+        )
+        for file_info in files
+    ]
+    results = [cache.get(cache_key) for cache_key in cache_keys]
+    missing = [index for index, result in enumerate(results) if result is None]
+    if not missing:
+        return results
+
+    mode = "project_pack" if project_context else "pack"
+    shared_context = shared_project_context(project_context)
+    system_prompt = create_conversion_system_prompt(
+        include_comments, generate_getters_setters, use_java_conventions, mode=mode, project_context=shared_context
+    )
+
+    # 컨텍스트가 시스템 프롬프트에 없으면 묶음 전체가 참조하는 컨텍스트를 한 번만 포함
+    context_info = ""
+    if project_context and not shared_context:
+        pack_context = select_file_context(project_context, "\n".join(files[index]["content"] for index in missing))
+        if pack_context:
+            context_info = f"""
+프로젝트 컨텍스트 정보:
+{json.dumps(pack_context, ensure_ascii=False, separators=(",", ":"))}
+"""
+
+    sources = "".join(
+        f"""
+파일명: {files[index]["filename"]}
+C# 코드:
+```csharp
+{files[index]["content"]}
+```
+"""
+        for index in missing
+    )
+    user_prompt = f"""다음 {len(missing)}개의 C# 파일을 각각 Java로 변환해주세요.
+{context_info}{sources}"""
+
+    # 응답에는 파일마다 Java 코드와 JSON 필드가 포함되므로 원본 크기에 비례하여 여유를 둠
+    pack_chars = sum(len(files[index]["content"]) for index in missing)
+    response_text = call_ai(
+        system_prompt,
+        user_prompt,
+        max_tokens=min(16000, 2000 + pack_chars),
+        operation="convert_pack",
+        filename=f"{files[missing[0]]['filename']} 외 {len(missing) - 1}개",
+    )
+    if not response_text:
+        for index in missing:
+            results[index] = _call_failure({
+                "java_code": "// 변환 오류 발생",
+                "imports": [],
+                "conversion_notes": "변환 실패",
+                "warnings": ["변환 실패"],
+                "applied_options": applied_options,
+            })
+        return results
+
+    parsed, status = _parse_json(response_text)
+    items = parsed.get("files") if parsed is not None else None
+    items = items if isinstance(items, list) else []
+    # 잘린 응답의 마지막 파일은 불완전하므로 개별 요청으로 다시 변환
+    if status == PARSE_TRUNCATED:
+        items = items[:-1]
+    by_filename = {}
+    for item in items:
+        if isinstance(item, dict) and item.get("java_code") and item.get("filename"):
+            by_filename[item["filename"].strip()] = item
+
+    for index in missing:
+        item = by_filename.get(files[index]["filename"])
+        if item is None:
+            continue
+        result = {key: value for key, value in item.items() if key != "filename"}
+        result.setdefault("imports", [])
+        result.setdefault("conversion_notes", "")
+        result.setdefault("warnings", [])
+        if project_context:
+            result.setdefault("package_declaration", "")
+            result.setdefault("type_mappings", {})
+        result["applied_options"] = applied_options
+        result["status"] = STATUS_OK
+        result["status_detail"] = ""
+        result = check_java_result(result, files[index]["filename"])
+        if result["status"] == STATUS_OK:
+            cache.set(cache_keys[index], result)
+        results[index] = result
+    return results
+
+
+# Java 구문 검사/부분 수정 집계
+_syntax_stats = {"checked": 0, "failed": 0, "repaired": 0, "repair_requests": 0}
+_syntax_stats_lock = threading.Lock()
+
+# 부분 수정을 시도할 최대 멤버 수 (더 많이 깨진 파일은 구문 오류로 표시하고 다시 변환하도록 둠)
+REPAIR_MAX_MEMBERS = 5
+
+REPAIR_SYSTEM_PROMPT = """당신은 Java 구문 오류 수정 전문가입니다. 주어진 Java 코드 조각의 구문 오류만 최소한으로 수정해주세요.
+- 조각은 클래스 멤버(메서드, 필드, 중첩 클래스) 하나입니다. 조각 밖의 코드는 작성하지 마세요
+- 로직, 이름, 주석은 그대로 두고 괄호/문장 누락 같은 구문 오류만 고치세요
+- 코드가 중간에 잘렸다면 원래 의도대로 멤버를 끝까지 완성하세요
+
+반드시 다음 JSON 형식으로 응답하세요:
+{
+    "java_code": "수정된 코드 조각"
+}"""
+
+
+def get_syntax_stats():
+    with _syntax_stats_lock:
+        return dict(_syntax_stats)
+
+
+def _count_syntax(key, amount=1):
+    with _syntax_stats_lock:
+        _syntax_stats[key] += amount
+
+
+def repair_allowed():
+    """수정 요청을 보낼 수 있는지 (배치 모드에서 호출을 대체 중이면 추가 요청을 만들 수 없음)"""
+    return getattr(_call_handler, "value", None) is None
+
+
+# 구문 오류가 있는 멤버 하나만 수정 요청 (파일 전체 재변환 대비 입력/출력 모두 조각 크기)
+def repair_java_member(member, filename=""):
+    """수정된 조각 반환 (호출/파싱에 실패했거나 수정 결과에도 괄호 오류가 있으면 None)"""
+    cache = get_conversion_cache()
+    cache_key = make_cache_key(
+        "repair", CONFIG["deployment_name"], PROMPT_TEMPLATE_VERSION, content_hash(member["code"]), member["error"]
+    )
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached["java_code"]
+
+    user_prompt = f"""다음 Java 코드 조각의 구문 오류를 수정해주세요.
+
+파일명: {filename}
+소속 타입: {member["type_header"]}
+구문 오류: {member["error"]}
+
+```java
+{member["code"]}
+```
+"""
+    _count_syntax("repair_requests")
+    response_text = call_ai(
+        REPAIR_SYSTEM_PROMPT,
+        user_prompt,
+        max_tokens=min(4000, 500 + len(member["code"])),
+        operation="repair",
+        filename=filename,
+    )
+    if not response_text:
+        return None
+    value, _ = _parse_json(response_text)
+    fixed = value.get("java_code") if value is not None else None
+    if not isinstance(fixed, str) or not fixed.strip() or fragment_errors(fixed) is not None:
+        return None
+    cache.set(cache_key, {"java_code": fixed})
+    return fixed
+
+
+# 변환 결과 Java 구문 검사 (오류가 있는 멤버만 수정 요청하여 원래 위치에 반영)
+def check_java_result(result, filename="", initializer=None):
+    """수정하지 못한 구문 오류는 STATUS_SYNTAX_ERROR 로 표시 (배치 모드에서는 추가 요청 없이 표시만 함)"""
+    if result_status(result) not in (STATUS_OK, STATUS_TRUNCATED):
+        return result
+    java_code = result.get("java_code", "")
+    _count_syntax("checked")
+    errors = check_java_syntax(java_code)
+    if not errors:
+        return result
+    _count_syntax("failed")
+
+    members = find_broken_members(java_code)
+    if len(members) <= REPAIR_MAX_MEMBERS and repair_allowed():
+        fixes = run_subtasks(members, lambda member: repair_java_member(member, filename), initializer=initializer)
+        if all(fix is not None for fix in fixes):
+            repaired = close_open_blocks(replace_members(java_code, list(zip(members, fixes))))
+            if not check_java_syntax(repaired):
+                _count_syntax("repaired")
+                note = f"(구문 오류가 있는 {len(members)}개 부분만 다시 요청하여 수정했습니다.)" if members else "(닫히지 않은 괄호를 보완했습니다.)"
+                return {
+                    **result,
+                    "java_code": repaired,
+                    "conversion_notes": f"{result.get('conversion_notes', '')}\n{note}".strip(),
+                }
+
+    detail = f"Java 구문 오류 ({errors[0]['line']}번째 줄): {errors[0]['message']}"
+    return {
+        **result,
+        "status": STATUS_SYNTAX_ERROR,
+        "status_detail": detail,
+        "warnings": list(result.get("warnings", [])) + [detail],
+    }
+
+
+# 규칙 기반 로컬 변환 (POCO/enum/interface 처럼 단순한 파일은 AI 호출 없이 변환)
+def convert_locally(file_info, project_context="", options=None):
+    """지원하지 않는 구문이 있거나 옵션(use_fast_path)이 꺼져 있으면 None (AI 변환 대상)"""
+    options = options or {}
+    if not options.get("use_fast_path", True):
+        return None
+    include_comments = options.get("include_comments", True)
+    generate_getters_setters = options.get("generate_getters_setters", True)
+    use_java_conventions = options.get("use_java_conventions", True)
+
+    converted = convert_simple_csharp(
+        file_info["content"], include_comments, generate_getters_setters, use_java_conventions, project_context
+    )
+    if converted is None:
+        return None
+    result = {
+        "java_code": converted["java_code"],
+        "imports": converted["imports"],
+        "conversion_notes": converted["conversion_notes"],
+        "warnings": [],
+        "applied_options": {"include_comments": include_comments, "generate_getters_setters": generate_getters_setters, "use_java_conventions": use_java_conventions},
+        "status": STATUS_OK,
+        "status_detail": "",
+        "converter": "rules",
+    }
+    if project_context:
+        result["package_declaration"] = converted["package_declaration"]
+        result["type_mappings"] = converted["type_mappings"]
+    return result
+
+
+# 변환 단위(파일 하나 또는 작은 파일 묶음) 변환
+def convert_file_pack(files, project_context="", options=None, initializer=None):
+    """files 순서대로 conversion_results 형식(original_filename, java_filename, zip_source 포함)의 결과 리스트 반환
+
+    규칙 기반으로 변환되는 단순 파일은 AI 호출 없이 변환하고, 묶음 응답에서 빠진 파일은 개별 요청으로 다시 변환합니다.
+    모든 결과는 로컬 Java 구문 검사를 거치며(AI 결과는 캐시 저장 전에 검사), 오류가 있는 멤버만 다시 요청하여 수정합니다.
+    """
+    options = options or {}
+    results = [convert_locally(file_info, project_context, options) for file_info in files]
+    remote = [index for index, result in enumerate(results) if result is None]
+    if len(remote) == 1:
+        results[remote[0]] = convert_project_file(files[remote[0]], project_context, options, initializer=initializer)
+    elif remote:
+        pack_results = convert_csharp_pack(
+            [files[index] for index in remote],
+            project_context,
+            options.get("include_comments", True),
+            options.get("generate_getters_setters", True),
+            options.get("use_java_conventions", True),
+        )
+        missing = [index for index, result in zip(remote, pack_results) if result is None]
+        for index, result in zip(remote, pack_results):
+            results[index] = result
+        if missing:
+            logger.info("묶음 응답에 없는 %d개 파일을 개별 변환합니다.", len(missing))
+            fallback = run_subtasks(
+                [files[index] for index in missing],
+                lambda file_info: convert_project_file(file_info, project_context, options, initializer=initializer),
+                initializer=initializer,
+                on_error=lambda file_info, error: failed_conversion(error),
+            )
+            for index, result in zip(missing, fallback):
+                results[index] = result
+
+    # AI 변환 결과는 캐시에 저장하기 전에 이미 검사했으므로 규칙 기반 결과만 검사
+    results = [
+        result if index in remote else check_java_result(result, file_info["filename"], initializer)
+        for index, (file_info, result) in enumerate(zip(files, results))
+    ]
+    for file_info, result in zip(files, results):
+        _attach_file_info(file_info, result)
+    return results
+
+
+def _attach_file_info(file_info, result):
+    result.update({
+        "original_filename": file_info["filename"],
+        "java_filename": file_info["filename"].replace(".cs", ".java"),
+        "zip_source": file_info.get("zip_source"),
+    })
+    return result
+
+
+# 변환 단위 처리 중 예외가 난 경우 convert_file_pack 과 같은 형식의 오류 결과
+def failed_file_pack(files, error):
+    return [_attach_file_info(file_info, failed_conversion(error)) for file_info in files]
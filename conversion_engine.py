@@ -0,0 +1,223 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+# 호출 결과 구분
+OUTCOME_OK = "ok"
+OUTCOME_THROTTLED = "throttled"  # 429 / 타임아웃 (동시성 축소 대상)
+OUTCOME_FAILED = "failed"  # 그 밖의 오류
+
+# 워커 스레드별 AI 호출 결과/토큰 사용량 (call_ai 에서 기록)
+_call_outcome = threading.local()
+
+# 워커 스레드를 실행 중인 run_concurrent 의 동시성 제어기 (하위 작업이 상위 한도를 따르도록)
+_current_limiter = threading.local()
+
+# 파일 하나의 하위 작업(청크/부분 수정) 동시 실행 상한 (상위 작업 동시성과 곱해지므로 작게 유지)
+SUBTASK_MAX_CONCURRENCY = 4
+
+
+def _empty_usage():
+    return {"prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0, "calls": 0}
+
+
+def report_outcome(outcome, error=None):
+    """현재 스레드에서 수행된 AI 호출 결과를 기록 (call_ai 에서 사용, error 는 실패 원인 메시지)"""
+    current = getattr(_call_outcome, "value", OUTCOME_OK)
+    # 한 작업 내 여러 호출 중 가장 나쁜 결과를 유지
+    if current == OUTCOME_THROTTLED or (current == OUTCOME_FAILED and outcome == OUTCOME_OK):
+        return
+    _call_outcome.value = outcome
+    if error is not None:
+        _call_outcome.error = error
+
+
+def report_usage(prompt_tokens, completion_tokens, cached_tokens=0):
+    """현재 스레드에서 수행된 AI 호출의 토큰 사용량을 누적 (call_ai 에서 사용)
+
+    cached_tokens: 프롬프트 중 Azure OpenAI 프롬프트 캐시에서 처리된 토큰 수
+    """
+    usage = current_usage()
+    usage["prompt_tokens"] += prompt_tokens or 0
+    usage["completion_tokens"] += completion_tokens or 0
+    usage["cached_tokens"] += cached_tokens or 0
+    usage["calls"] += 1
+
+
+def share_usage(usage, count):
+    """여러 파일을 한 번에 변환한 사용량을 파일 수로 나눈 값 (파일별 집계용)"""
+    if count == 1:
+        return dict(usage)
+    return {key: round(value / count, 2) for key, value in usage.items()}
+
+
+def report_throttle(started_at):
+    """재시도 중인 AI 호출의 429/타임아웃을 현재 작업의 동시성 제어기에 바로 반영 (RequestScheduler 에서 호출)"""
+    limiter = getattr(_current_limiter, "value", None)
+    if limiter is not None:
+        limiter.on_throttle(started_at)
+
+
+def reset_call_state():
+    """현재 스레드의 호출 결과/사용량 초기화 (작업 단위 시작 시 호출)"""
+    _call_outcome.value = OUTCOME_OK
+    _call_outcome.error = None
+    _call_outcome.usage = _empty_usage()
+
+
+def current_outcome():
+    return getattr(_call_outcome, "value", OUTCOME_OK)
+
+
+def set_call_tags(**tags):
+    """현재 스레드의 AI 호출 기록에 붙일 태그 (session_id, job_id 등)"""
+    _call_outcome.tags = dict(tags)
+
+
+def current_call_tags():
+    return getattr(_call_outcome, "tags", {})
+
+
+def current_error():
+    """현재 작업 단위에서 마지막으로 기록된 AI 호출 실패 원인"""
+    return getattr(_call_outcome, "error", None)
+
+
+def current_usage():
+    if not hasattr(_call_outcome, "usage"):
+        _call_outcome.usage = _empty_usage()
+    return _call_outcome.usage
+
+
+# AIMD 방식 동시성 제어 (성공 시 선형 증가, 429/타임아웃 시 절반으로 감소)
+class AdaptiveConcurrencyLimiter:
+    def __init__(self, initial=4, min_limit=1, max_limit=16, decrease_factor=0.5, parent=None):
+        """parent: 상위 작업의 제어기 (한도는 parent 한도를 넘지 않고, 429/타임아웃은 parent 에도 반영)"""
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.parent = parent
+        self._limit = float(max(min_limit, min(initial, max_limit)))
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self):
+        with self._lock:
+            limit = int(self._limit)
+        return min(limit, self.parent.limit) if self.parent is not None else limit
+
+    def on_success(self):
+        with self._lock:
+            # 현재 한도만큼 연속 성공하면 한도 +1 (TCP 혼잡 윈도우와 동일한 방식)
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+    def on_throttle(self, started_at):
+        with self._lock:
+            # 직전 감소 이전에 출발한 요청의 429는 같은 혼잡 구간이므로 한 번만 감소
+            if started_at < self._last_decrease:
+                return
+            self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+            self._last_decrease = time.monotonic()
+        if self.parent is not None:
+            self.parent.on_throttle(started_at)
+
+
+def run_concurrent(items, worker, on_progress=None, limiter=None, max_retries=0, initializer=None, on_error=None):
+    """items 를 병렬로 처리하고 원래 순서대로 결과 리스트를 반환
+
+    worker(item) 는 결과를 반환하며, 내부 AI 호출 결과는 report_outcome 으로 전달됩니다.
+    429/타임아웃은 호출마다 report_throttle 로 동시성을 줄이고 RequestScheduler 가 재시도하므로,
+    기본값(max_retries=0)에서는 항목을 다시 제출하지 않습니다 (0보다 크면 그 횟수까지 다시 제출).
+    worker 에서 예외가 나면 나머지 항목은 계속 처리하고, 그 항목의 결과는 on_error(item, error) (없으면 None) 입니다.
+    on_progress(done, total, item) 는 호출한 스레드(Streamlit 스크립트 스레드)에서 실행됩니다.
+    """
+    items = list(items)
+    total = len(items)
+    results = [None] * total
+    if not items:
+        return results
+
+    limiter = limiter or AdaptiveConcurrencyLimiter()
+    pending = list(range(total))
+    pending.reverse()  # pop() 으로 앞쪽 항목부터 제출
+    attempts = [0] * total
+    done_count = 0
+
+    def _run(index):
+        reset_call_state()
+        _current_limiter.value = limiter
+        started_at = time.monotonic()
+        try:
+            result = worker(items[index])
+        except Exception as e:
+            logger.exception("병렬 작업 항목 처리 중 예외 발생")
+            report_outcome(OUTCOME_FAILED, f"{type(e).__name__}: {e}")
+            result = on_error(items[index], e) if on_error else None
+        return result, current_outcome(), started_at
+
+    with ThreadPoolExecutor(max_workers=limiter.max_limit, initializer=initializer) as executor:
+        in_flight = {}
+        while pending or in_flight:
+            while pending and len(in_flight) < limiter.limit:
+                index = pending.pop()
+                attempts[index] += 1
+                in_flight[executor.submit(_run, index)] = index
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = in_flight.pop(future)
+                result, outcome, started_at = future.result()
+
+                if outcome == OUTCOME_THROTTLED:
+                    limiter.on_throttle(started_at)
+                    if attempts[index] <= max_retries:
+                        pending.append(index)
+                        continue
+                elif outcome == OUTCOME_OK:
+                    limiter.on_success()
+
+                results[index] = result
+                done_count += 1
+                if on_progress:
+                    on_progress(done_count, total, items[index])
+
+    return results
+
+
+def run_subtasks(items, worker, initializer=None, on_error=None):
+    """한 작업을 여러 하위 작업으로 나누어 병렬 실행 (예: 대용량 파일의 청크 변환)
+
+    하위 작업 스레드의 호출 결과와 토큰 사용량을 호출한 스레드에 합쳐
+    상위 작업 단위의 집계가 그대로 유지되도록 합니다. on_error 는 run_concurrent 와 같습니다.
+    동시 실행은 SUBTASK_MAX_CONCURRENCY 와 상위 run_concurrent 의 현재 한도 중 작은 값으로 제한합니다.
+    """
+    # 하위 작업 스레드의 호출도 상위 작업과 같은 태그로 기록
+    tags = current_call_tags()
+
+    def _run(item):
+        set_call_tags(**tags)
+        result = worker(item)
+        return result, current_outcome(), current_error(), dict(current_usage())
+
+    def _on_error(item, error):
+        result = on_error(item, error) if on_error else None
+        return result, current_outcome(), current_error(), dict(current_usage())
+
+    limiter = AdaptiveConcurrencyLimiter(
+        initial=SUBTASK_MAX_CONCURRENCY,
+        max_limit=SUBTASK_MAX_CONCURRENCY,
+        parent=getattr(_current_limiter, "value", None),
+    )
+    outputs = run_concurrent(items, _run, initializer=initializer, on_error=_on_error, limiter=limiter)
+    usage = current_usage()
+    results = []
+    for result, outcome, error, sub_usage in outputs:
+        report_outcome(outcome, error)
+        for key in usage:
+            usage[key] += sub_usage[key]
+        results.append(result)
+    return results
@@ -0,0 +1,604 @@
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+
+from batch_conversion import BATCH_TERMINAL_STATUSES, run_batch_conversion
+from conversion_core import STATUS_OK, CONFIG, analyze_project_context, convert_file_pack, failed_file_pack, pack_small_files, result_status
+from conversion_engine import run_concurrent, set_call_tags
+from result_cache import SessionResultCache
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_INTERRUPTED = "interrupted"  # 프로세스 재시작 등으로 중단됨 (이어서 변환 가능)
+
+ACTIVE_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+
+# 실행 중인 작업의 생존 신호 주기와, 신호가 끊겼다고 보는 시간 (초)
+JOB_HEARTBEAT_INTERVAL_SECONDS = 15
+JOB_HEARTBEAT_TIMEOUT_SECONDS = 90
+
+
+def make_owner_id():
+    """작업을 실행하는 프로세스 식별값 (호스트:PID:임의값)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _owner_alive(owner, heartbeat_at, now):
+    """작업을 실행하던 프로세스가 살아 있는지 (같은 호스트면 PID 로, 아니면 생존 신호로 판단)"""
+    if not owner or heartbeat_at is None or now - heartbeat_at > JOB_HEARTBEAT_TIMEOUT_SECONDS:
+        return False
+    host, pid, _ = owner.split(":", 2)
+    if host != socket.gethostname():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, ValueError):
+        pass
+    return True
+
+
+# 원본 코드/변환 결과는 zlib 으로 압축하여 BLOB 으로 저장 (이전 버전의 TEXT 값도 그대로 읽음)
+def _pack(text):
+    return zlib.compress(text.encode("utf-8"), 6)
+
+
+def _unpack(value):
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+# 변환 작업과 파일별 체크포인트를 저장하는 SQLite 저장소
+class ConversionJobStore:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._local = threading.local()
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS conversion_jobs (
+                job_id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                status TEXT NOT NULL,
+                options TEXT NOT NULL,
+                archives TEXT NOT NULL,
+                project_context TEXT,
+                total INTEGER NOT NULL,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS conversion_job_files (
+                job_id TEXT NOT NULL,
+                file_index INTEGER NOT NULL,
+                filename TEXT NOT NULL,
+                content TEXT NOT NULL,
+                zip_source TEXT,
+                result TEXT,
+                completed_at REAL,
+                PRIMARY KEY (job_id, file_index)
+            )
+            """
+        )
+        # Batch API 모드 컬럼 (이전 버전 DB 에는 없으므로 추가)
+        for column in ("batch_id TEXT", "batch_status TEXT"):
+            try:
+                conn.execute(f"ALTER TABLE conversion_jobs ADD COLUMN {column}")
+            except sqlite3.OperationalError:
+                pass
+        # 실행 프로세스/생존 신호 컬럼 (같은 저장소를 쓰는 다른 프로세스의 작업을 중단 처리하지 않도록)
+        for column in ("owner TEXT", "heartbeat_at REAL"):
+            try:
+                conn.execute(f"ALTER TABLE conversion_jobs ADD COLUMN {column}")
+            except sqlite3.OperationalError:
+                pass
+        # 작업을 만든 브라우저 세션 키 (다른 사용자의 작업/원본 코드를 조회하지 못하도록)
+        try:
+            conn.execute("ALTER TABLE conversion_jobs ADD COLUMN session_key TEXT")
+        except sqlite3.OperationalError:
+            pass
+        # 결과 목록 컬럼 (결과 본문을 풀지 않고 상태/파일명만 조회)
+        for column in ("status TEXT", "java_filename TEXT", "warning_count INTEGER"):
+            try:
+                conn.execute(f"ALTER TABLE conversion_job_files ADD COLUMN {column}")
+            except sqlite3.OperationalError:
+                pass
+
+    def _connect(self):
+        # sqlite3 연결은 스레드 간 공유하지 않음 (스레드별 연결)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def create_job(self, name, files, options, archives=None, owner=None, session_key=None):
+        """작업과 원본 파일을 저장하고 job_id 반환 (원본을 함께 저장해야 재시작 후 이어서 변환 가능)
+
+        session_key 는 작업을 만든 세션의 키로, 목록 조회와 결과 불러오기를 같은 키로 제한합니다.
+        """
+        job_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            conn.execute(
+                "INSERT INTO conversion_jobs (job_id, name, status, options, archives, total, created_at, updated_at, "
+                "owner, heartbeat_at, session_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id, name, JOB_QUEUED, json.dumps(options), json.dumps(archives or []), len(files), now, now, owner, now,
+                    session_key,
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO conversion_job_files (job_id, file_index, filename, content, zip_source) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (job_id, index, file_info["filename"], _pack(file_info["content"]), file_info.get("zip_source"))
+                    for index, file_info in enumerate(files)
+                ],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return job_id
+
+    def _job_from_row(self, row):
+        (job_id, name, status, options, archives, project_context, total, error,
+         created_at, updated_at, batch_id, batch_status, session_key, done) = row
+        return {
+            "job_id": job_id,
+            "name": name,
+            "status": status,
+            "options": json.loads(options),
+            "archives": json.loads(archives),
+            "project_context": json.loads(project_context) if project_context else "",
+            "total": total,
+            "done": done,
+            "error": error,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "batch_id": batch_id,
+            "batch_status": batch_status,
+            "session_key": session_key,
+        }
+
+    _JOB_COLUMNS = (
+        "j.job_id, j.name, j.status, j.options, j.archives, j.project_context, j.total, j.error, j.created_at, j.updated_at, "
+        "j.batch_id, j.batch_status, j.session_key, "
+        "(SELECT COUNT(*) FROM conversion_job_files f WHERE f.job_id = j.job_id AND f.result IS NOT NULL)"
+    )
+
+    def get_job(self, job_id):
+        row = self._connect().execute(
+            f"SELECT {self._JOB_COLUMNS} FROM conversion_jobs j WHERE j.job_id = ?", (job_id,)
+        ).fetchone()
+        return self._job_from_row(row) if row else None
+
+    def list_jobs(self, session_key, limit=10):
+        """session_key 로 만든 최근 작업 (키가 없는 이전 작업은 누구에게도 표시하지 않음)"""
+        rows = self._connect().execute(
+            f"SELECT {self._JOB_COLUMNS} FROM conversion_jobs j WHERE j.session_key = ? ORDER BY j.created_at DESC LIMIT ?",
+            (session_key, limit),
+        ).fetchall()
+        return [self._job_from_row(row) for row in rows]
+
+    def archive_paths(self):
+        """저장된 작업들이 참조하는 원본 ZIP 경로 (완료 후에도 전체 프로젝트 다운로드에 사용)"""
+        paths = set()
+        for (archives,) in self._connect().execute("SELECT archives FROM conversion_jobs"):
+            paths.update(archive["path"] for archive in json.loads(archives))
+        return paths
+
+    def update_job(self, job_id, status=None, error=None, project_context=None, batch_id=None, batch_status=None):
+        fields = ["updated_at = ?"]
+        values = [time.time()]
+        if status is not None:
+            fields.append("status = ?")
+            values.append(status)
+        if error is not None:
+            fields.append("error = ?")
+            values.append(error)
+        if project_context is not None:
+            fields.append("project_context = ?")
+            values.append(json.dumps(project_context, ensure_ascii=False))
+        if batch_id is not None:
+            fields.append("batch_id = ?")
+            values.append(batch_id)
+        if batch_status is not None:
+            fields.append("batch_status = ?")
+            values.append(batch_status)
+        self._connect().execute(
+            f"UPDATE conversion_jobs SET {', '.join(fields)} WHERE job_id = ?", values + [job_id]
+        )
+
+    def claim_job(self, job_id, owner):
+        """작업을 대기 상태로 되돌리고 실행 프로세스로 등록"""
+        now = time.time()
+        self._connect().execute(
+            "UPDATE conversion_jobs SET status = ?, owner = ?, heartbeat_at = ?, updated_at = ? WHERE job_id = ?",
+            (JOB_QUEUED, owner, now, now, job_id),
+        )
+
+    def heartbeat(self, owner):
+        """owner 가 실행 중인 작업의 생존 신호 갱신"""
+        self._connect().execute(
+            "UPDATE conversion_jobs SET heartbeat_at = ? WHERE owner = ? AND status IN (?, ?)",
+            (time.time(), owner) + ACTIVE_STATUSES,
+        )
+
+    def mark_interrupted(self, owner=None):
+        """실행하던 프로세스가 종료된 작업을 중단 상태로 표시 (owner 자신의 작업과 다른 프로세스가 실행 중인 작업은 제외)"""
+        conn = self._connect()
+        now = time.time()
+        rows = conn.execute(
+            "SELECT job_id, owner, heartbeat_at FROM conversion_jobs WHERE status IN (?, ?)", ACTIVE_STATUSES
+        ).fetchall()
+        orphaned = [
+            job_id for job_id, job_owner, heartbeat_at in rows
+            if job_owner != owner and not _owner_alive(job_owner, heartbeat_at, now)
+        ]
+        if orphaned:
+            conn.executemany(
+                "UPDATE conversion_jobs SET status = ?, updated_at = ? WHERE job_id = ? AND status IN (?, ?)",
+                [(JOB_INTERRUPTED, now, job_id) + ACTIVE_STATUSES for job_id in orphaned],
+            )
+        return orphaned
+
+    def prune_jobs(self, max_age_seconds=None, max_count=None):
+        """보존 기간이 지났거나 최대 개수를 넘는 끝난 작업을 삭제하고, 남은 작업이 참조하지 않는 원본 ZIP 경로 반환
+
+        실행 중이거나 대기 중인 작업은 삭제하지 않습니다.
+        """
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT job_id, status, updated_at FROM conversion_jobs ORDER BY created_at DESC"
+        ).fetchall()
+        cutoff = time.time() - max_age_seconds if max_age_seconds is not None else None
+        expired = [
+            job_id for position, (job_id, status, updated_at) in enumerate(rows)
+            if status not in ACTIVE_STATUSES
+            and ((cutoff is not None and updated_at < cutoff) or (max_count is not None and position >= max_count))
+        ]
+        if not expired:
+            return []
+
+        kept_paths = set()
+        removed_paths = set()
+        conn.execute("BEGIN")
+        try:
+            for job_id in expired:
+                (archives,) = conn.execute("SELECT archives FROM conversion_jobs WHERE job_id = ?", (job_id,)).fetchone()
+                removed_paths.update(archive["path"] for archive in json.loads(archives))
+            conn.executemany("DELETE FROM conversion_job_files WHERE job_id = ?", [(job_id,) for job_id in expired])
+            conn.executemany("DELETE FROM conversion_jobs WHERE job_id = ?", [(job_id,) for job_id in expired])
+            for (archives,) in conn.execute("SELECT archives FROM conversion_jobs"):
+                kept_paths.update(archive["path"] for archive in json.loads(archives))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info("보존 기간/개수를 넘은 변환 작업 %d개 삭제", len(expired))
+        return sorted(removed_paths - kept_paths)
+
+    def load_files(self, job_id, pending_only=False):
+        """[{"index", "filename", "content", "zip_source"}] (pending_only 면 결과가 없는 파일만)"""
+        query = "SELECT file_index, filename, content, zip_source FROM conversion_job_files WHERE job_id = ?"
+        if pending_only:
+            query += " AND result IS NULL"
+        rows = self._connect().execute(query + " ORDER BY file_index", (job_id,)).fetchall()
+        return [
+            {"index": index, "filename": filename, "content": _unpack(content), "zip_source": zip_source}
+            for index, filename, content, zip_source in rows
+        ]
+
+    def save_result(self, job_id, index, result):
+        # 원본 코드는 이미 저장되어 있으므로 결과에서 제외
+        stored = {key: value for key, value in result.items() if key != "original_content"}
+        self._connect().execute(
+            "UPDATE conversion_job_files SET result = ?, completed_at = ?, status = ?, java_filename = ?, warning_count = ? "
+            "WHERE job_id = ? AND file_index = ?",
+            (
+                _pack(json.dumps(stored, ensure_ascii=False)),
+                time.time(),
+                result_status(result),
+                result.get("java_filename"),
+                len(result.get("warnings", [])),
+                job_id,
+                index,
+            ),
+        )
+
+    def failed_file_indices(self, job_id):
+        """완료된 파일 중 상태가 ok 가 아닌 파일 번호"""
+        return [item["index"] for item in self.load_result_index(job_id) if item["status"] != STATUS_OK]
+
+    def reset_for_retry(self, job_id, indices, owner=None):
+        """지정한 파일의 결과를 지우고 작업을 대기 상태로 되돌림 (이전 배치 ID 도 초기화)"""
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "UPDATE conversion_job_files SET result = NULL, completed_at = NULL, status = NULL, java_filename = NULL, "
+                "warning_count = NULL WHERE job_id = ? AND file_index = ?",
+                [(job_id, index) for index in indices],
+            )
+            conn.execute(
+                "UPDATE conversion_jobs SET status = ?, error = NULL, batch_id = NULL, batch_status = NULL, updated_at = ?, "
+                "owner = ?, heartbeat_at = ? WHERE job_id = ?",
+                (JOB_QUEUED, time.time(), owner, time.time(), job_id),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def load_result_index(self, job_id):
+        """완료된 파일 목록 [{"index", "original_filename", "java_filename", "status", "warning_count", "completed_at"}]
+
+        결과 본문은 풀지 않으므로 파일 수가 많아도 가볍습니다 (목록 컬럼이 없는 이전 결과만 본문에서 계산).
+        """
+        rows = self._connect().execute(
+            "SELECT file_index, filename, java_filename, status, warning_count, completed_at, "
+            "CASE WHEN status IS NULL THEN result END "
+            "FROM conversion_job_files WHERE job_id = ? AND result IS NOT NULL ORDER BY file_index",
+            (job_id,),
+        ).fetchall()
+        index = []
+        for file_index, filename, java_filename, status, warning_count, completed_at, legacy_result in rows:
+            if status is None:
+                result = json.loads(_unpack(legacy_result))
+                status = result_status(result)
+                java_filename = result.get("java_filename")
+                warning_count = len(result.get("warnings", []))
+            index.append({
+                "index": file_index,
+                "original_filename": filename,
+                "java_filename": java_filename or filename[:-3] + ".java",
+                "status": status,
+                "warning_count": warning_count or 0,
+                "completed_at": completed_at,
+            })
+        return index
+
+    def load_result(self, job_id, index):
+        """파일 하나의 변환 결과 (original_content 포함, 없으면 None)"""
+        row = self._connect().execute(
+            "SELECT content, result FROM conversion_job_files WHERE job_id = ? AND file_index = ? AND result IS NOT NULL",
+            (job_id, index),
+        ).fetchone()
+        if row is None:
+            return None
+        result = json.loads(_unpack(row[1]))
+        result["original_content"] = _unpack(row[0])
+        return result
+
+    def iter_results(self, job_id, include_content=False):
+        """완료된 파일들의 변환 결과를 원래 순서대로 하나씩 반환 (패키징 등 전체를 한 번 훑을 때 사용)"""
+        cursor = self._connect().execute(
+            f"SELECT {'content' if include_content else 'NULL'}, result FROM conversion_job_files "
+            "WHERE job_id = ? AND result IS NOT NULL ORDER BY file_index",
+            (job_id,),
+        )
+        for content, result in cursor:
+            result = json.loads(_unpack(result))
+            if include_content:
+                result["original_content"] = _unpack(content)
+            yield result
+
+    def load_results(self, job_id):
+        """완료된 파일들의 변환 결과 (원래 순서, original_content 포함)"""
+        return list(self.iter_results(job_id, include_content=True))
+
+
+# 변환 작업을 백그라운드 스레드에서 실행 (Streamlit 재실행/연결 끊김과 무관하게 진행)
+class ConversionJobManager:
+    def __init__(self, store, result_cache=None, retention_seconds=None, max_jobs=None):
+        self.store = store
+        self.result_cache = result_cache or SessionResultCache()
+        self.retention_seconds = retention_seconds
+        self.max_jobs = max_jobs
+        self.owner = make_owner_id()
+        self._threads = {}
+        self._lock = threading.Lock()
+        # 실행하던 프로세스가 종료된 작업은 스레드가 없으므로 중단 상태로 전환
+        # (같은 저장소를 쓰는 다른 Streamlit 워커/CLI 가 실행 중인 작업은 그대로 둠)
+        store.mark_interrupted(self.owner)
+        self.prune()
+        threading.Thread(target=self._heartbeat_loop, name="conversion-job-heartbeat", daemon=True).start()
+
+    def _heartbeat_loop(self):
+        while True:
+            time.sleep(JOB_HEARTBEAT_INTERVAL_SECONDS)
+            try:
+                self.store.heartbeat(self.owner)
+                self.store.mark_interrupted(self.owner)
+            except Exception:
+                logger.exception("변환 작업 생존 신호 갱신 실패")
+
+    def prune(self):
+        """보존 기간/개수를 넘은 작업을 원본 ZIP 파일과 함께 삭제"""
+        try:
+            paths = self.store.prune_jobs(self.retention_seconds, self.max_jobs)
+        except Exception:
+            logger.exception("오래된 변환 작업 정리 실패")
+            return
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def submit(self, name, files, options, archives=None, session_key=None):
+        # 새 작업을 저장하기 전에 오래된 작업을 정리하여 저장소가 계속 커지지 않도록 함
+        self.prune()
+        job_id = self.store.create_job(name, files, options, archives, owner=self.owner, session_key=session_key)
+        self._start(job_id)
+        return job_id
+
+    def resume(self, job_id):
+        """중단/실패한 작업을 마지막 완료 파일 이후부터 이어서 실행 (다른 프로세스가 실행 중이면 False)"""
+        job = self.store.get_job(job_id)
+        if job is None or job["status"] == JOB_COMPLETED or self.is_running(job_id) or self._running_elsewhere(job_id):
+            return False
+        self.store.claim_job(job_id, self.owner)
+        self._start(job_id)
+        return True
+
+    def retry_failed(self, job_id):
+        """실패한 파일만 다시 변환 (성공한 파일의 결과는 그대로 유지) 하고 다시 변환할 파일 수 반환"""
+        if self.is_running(job_id) or self._running_elsewhere(job_id):
+            return 0
+        indices = self.store.failed_file_indices(job_id)
+        if not indices:
+            return 0
+        self.store.reset_for_retry(job_id, indices, owner=self.owner)
+        self._start(job_id)
+        return len(indices)
+
+    def get_result(self, session_id, job_id, item):
+        """load_result_index 의 항목 하나의 전체 결과 (세션 캐시 경유)
+
+        캐시 키에 완료 시각을 포함하므로 다시 변환한 파일은 새 결과를 불러옵니다.
+        """
+        return self.result_cache.get(
+            session_id,
+            (job_id, item["index"], item["completed_at"]),
+            lambda: self.store.load_result(job_id, item["index"]),
+        )
+
+    def _running_elsewhere(self, job_id):
+        """다른 프로세스가 아직 실행 중인 작업인지 (실행 프로세스가 종료되었으면 먼저 중단 상태로 전환)"""
+        self.store.mark_interrupted(self.owner)
+        job = self.store.get_job(job_id)
+        return job is not None and job["status"] in ACTIVE_STATUSES
+
+    def is_running(self, job_id):
+        with self._lock:
+            thread = self._threads.get(job_id)
+            return thread is not None and thread.is_alive()
+
+    def _start(self, job_id):
+        thread = threading.Thread(target=self._run, args=(job_id,), name=f"conversion-job-{job_id}", daemon=True)
+        with self._lock:
+            self._threads[job_id] = thread
+        thread.start()
+
+    def _run(self, job_id):
+        store = self.store
+        try:
+            job = store.get_job(job_id)
+            store.update_job(job_id, status=JOB_RUNNING)
+            options = job["options"]
+
+            # 프로젝트 컨텍스트는 한 번만 분석하여 저장 (재개 시 재사용)
+            project_context = job["project_context"]
+            if not project_context and options.get("use_project_context") and job["total"] > 1:
+                project_context = analyze_project_context(store.load_files(job_id))
+                if project_context:
+                    store.update_job(job_id, project_context=project_context)
+
+            pending = store.load_files(job_id, pending_only=True)
+            if options.get("use_batch_api"):
+                self._run_batch(job, pending, project_context)
+                store.update_job(job_id, status=JOB_COMPLETED)
+                return
+
+            saved = set()
+
+            def convert(unit):
+                # AI 호출 기록을 작업 단위로 집계
+                set_call_tags(job_id=job_id)
+                results = convert_file_pack(unit, project_context, options)
+                for file_info, result in zip(unit, results):
+                    store.save_result(job_id, file_info["index"], result)
+                    saved.add(file_info["index"])
+                return results
+
+            # 작은 파일은 묶어서 한 번의 요청으로 변환
+            units = pack_small_files(pending, options)
+            outputs = run_concurrent(units, convert, on_error=failed_file_pack)
+
+            # 변환 중 예외가 난 파일도 결과를 남겨 작업을 완료 처리
+            for unit, results in zip(units, outputs):
+                for file_info, result in zip(unit, results):
+                    if file_info["index"] not in saved:
+                        store.save_result(job_id, file_info["index"], result)
+            store.update_job(job_id, status=JOB_COMPLETED)
+        except Exception as e:
+            logger.exception("변환 작업 %s 실패", job_id)
+            store.update_job(job_id, status=JOB_FAILED, error=str(e))
+        finally:
+            with self._lock:
+                self._threads.pop(job_id, None)
+
+    def _run_batch(self, job, pending, project_context):
+        """Batch API 로 남은 파일을 변환 (제출한 배치 ID 를 저장하여 재시작 후에는 제출 없이 이어서 대기)"""
+        store = self.store
+        job_id = job["job_id"]
+
+        def on_submitted(batch_id):
+            store.update_job(job_id, batch_id=batch_id)
+
+        def on_status(batch):
+            store.update_job(job_id, batch_status=batch["status"])
+
+        # 실패/만료된 배치는 이어서 기다리지 않고 남은 요청을 다시 제출
+        batch_id = job["batch_id"]
+        if job["batch_status"] in BATCH_TERMINAL_STATUSES and job["batch_status"] != "completed":
+            batch_id = None
+
+        outputs = run_batch_conversion(
+            pending,
+            project_context,
+            job["options"],
+            batch_id=batch_id,
+            on_submitted=on_submitted,
+            on_status=on_status,
+        )
+        for file_info, (result, _, _) in zip(pending, outputs):
+            store.save_result(job_id, file_info["index"], result)
+
+
+# 프로세스 공용 작업 관리자 (모든 세션이 공유)
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager():
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ConversionJobManager(
+                ConversionJobStore(CONFIG["job_store_path"]),
+                SessionResultCache(
+                    max_bytes=CONFIG["result_cache_mb"] * 1024 * 1024,
+                    session_quota_bytes=CONFIG["result_session_quota_mb"] * 1024 * 1024,
+                    idle_seconds=CONFIG["result_idle_seconds"],
+                ),
+                retention_seconds=CONFIG["job_retention_days"] * 24 * 3600,
+                max_jobs=CONFIG["job_max_count"],
+            )
+        return _manager
@@ -0,0 +1,266 @@
+"""C# 프로젝트 일괄 변환 CLI (Streamlit 없이 실행)
+
+    python convert_cli.py ./LegacySolution -o ./java_out
+    python convert_cli.py Legacy.zip -o ./java_out --workers 16 --project-context --analyze
+    python convert_cli.py ./LegacySolution -o ./java_out --batch
+
+변환된 Java 파일은 원본 경로 구조를 유지하여 출력 디렉터리에 저장되고,
+파일별 상태/토큰/지연 시간은 JSONL 리포트(기본: <출력>/conversion_report.jsonl)에 기록됩니다.
+하나라도 실패하면 종료 코드 1 을 반환합니다.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import zipfile
+
+from batch_conversion import BATCH_POLL_INTERVAL_SECONDS, run_batch_conversion
+from conversion_core import (
+    STATUS_OK,
+    analyze_csharp_code,
+    analyze_project_context,
+    convert_file_pack,
+    failed_file_pack,
+    get_http_pool_stats,
+    get_telemetry,
+    pack_small_files,
+    result_status,
+)
+from conversion_engine import (
+    AdaptiveConcurrencyLimiter,
+    current_usage,
+    run_concurrent,
+    share_usage,
+)
+
+# 제출한 배치 ID 저장 파일 (출력 디렉터리 기준)
+BATCH_STATE_FILENAME = "batch_state.json"
+
+
+def read_csharp_sources(source):
+    """디렉터리 또는 ZIP 에서 .cs 파일 목록 [{"filename", "content"}] 을 읽음"""
+    files = []
+    if os.path.isdir(source):
+        for root, dirs, names in os.walk(source):
+            # 빌드 산출물 디렉터리는 건너뜀
+            dirs[:] = sorted(d for d in dirs if d not in ("bin", "obj", ".git", ".vs"))
+            for name in sorted(names):
+                if name.endswith(".cs"):
+                    path = os.path.join(root, name)
+                    with open(path, encoding="utf-8-sig") as f:
+                        files.append({
+                            "filename": os.path.relpath(path, source).replace(os.sep, "/"),
+                            "content": f.read(),
+                        })
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zip_ref:
+            for info in zip_ref.infolist():
+                if not info.is_dir() and info.filename.endswith(".cs"):
+                    files.append({
+                        "filename": info.filename,
+                        "content": zip_ref.read(info).decode("utf-8-sig"),
+                    })
+    else:
+        raise ValueError(f"디렉터리 또는 ZIP 파일이 아닙니다: {source}")
+    return files
+
+
+def conversion_options(args):
+    return {
+        "include_comments": not args.no_comments,
+        "generate_getters_setters": not args.no_getters_setters,
+        "use_java_conventions": not args.keep_csharp_naming,
+        "use_chunking": not args.no_chunking,
+        "use_packing": not args.no_packing,
+        "use_fast_path": not args.no_fast_path,
+    }
+
+
+def make_record(file_info, result, usage, latency_ms):
+    return {
+        "file": file_info["filename"],
+        "java_file": file_info["filename"][:-3] + ".java",
+        "status": result_status(result),
+        "status_detail": result.get("status_detail", ""),
+        "warnings": len(result.get("warnings", [])),
+        "converter": result.get("converter", "llm"),
+        "prompt_tokens": usage["prompt_tokens"],
+        "completion_tokens": usage["completion_tokens"],
+        "cached_tokens": usage["cached_tokens"],
+        "llm_calls": usage["calls"],
+        "latency_ms": latency_ms,
+    }
+
+
+def convert_unit(unit, args, project_context):
+    """변환 단위(파일 하나 또는 작은 파일 묶음)를 변환하고 [(결과, 리포트 레코드)] 반환"""
+    started_at = time.perf_counter()
+    results = convert_file_pack(unit, project_context, conversion_options(args))
+    # 묶음 요청의 토큰 사용량은 파일 수로 나누어 기록
+    usage = share_usage(current_usage(), len(unit))
+    latency_ms = round((time.perf_counter() - started_at) * 1000)
+
+    outputs = []
+    for file_info, result in zip(unit, results):
+        record = make_record(file_info, result, usage, latency_ms)
+        if args.analyze:
+            record["analysis"] = analyze_csharp_code(file_info["content"], file_info["filename"])
+        outputs.append((result, record))
+    return outputs
+
+
+def failed_unit(unit, error):
+    """변환 단위 처리 중 예외가 나면 해당 파일들만 오류로 기록"""
+    usage = share_usage(current_usage(), len(unit))
+    return [(result, make_record(file_info, result, usage, None)) for file_info, result in zip(unit, failed_file_pack(unit, error))]
+
+
+def convert_with_batch(files, args, project_context, log):
+    """Batch API 로 변환 (배치 ID 를 출력 디렉터리에 저장하여 중단 후 다시 실행하면 이어서 대기)"""
+    state_path = os.path.join(args.output, BATCH_STATE_FILENAME)
+    batch_id = None
+    if os.path.exists(state_path):
+        with open(state_path, encoding="utf-8") as f:
+            batch_id = json.load(f)["batch_id"]
+        log.info("이전에 제출한 배치를 이어서 기다립니다: %s", batch_id)
+
+    def on_submitted(submitted_id):
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump({"batch_id": submitted_id}, f)
+
+    def on_status(batch):
+        counts = batch.get("request_counts") or {}
+        log.info("배치 상태: %s (%s/%s)", batch["status"], counts.get("completed", 0), counts.get("total", 0))
+
+    outputs = run_batch_conversion(
+        files,
+        project_context,
+        conversion_options(args),
+        batch_id=batch_id,
+        requests_path=os.path.join(args.output, "batch_requests.jsonl"),
+        poll_interval=args.batch_poll_interval,
+        on_submitted=on_submitted,
+        on_status=on_status,
+    )
+    if os.path.exists(state_path):
+        os.remove(state_path)
+    return [
+        (result, make_record(file_info, result, usage, None))
+        for file_info, (result, _, usage) in zip(files, outputs)
+    ]
+
+
+def write_outputs(output_dir, result, record):
+    java_path = os.path.join(output_dir, record["java_file"])
+    os.makedirs(os.path.dirname(java_path) or ".", exist_ok=True)
+    with open(java_path, "w", encoding="utf-8") as f:
+        f.write(result["java_code"])
+
+    if record.get("analysis") is not None:
+        analysis_path = os.path.join(output_dir, "analysis", record["file"][:-3] + ".json")
+        os.makedirs(os.path.dirname(analysis_path), exist_ok=True)
+        with open(analysis_path, "w", encoding="utf-8") as f:
+            json.dump(record["analysis"], f, ensure_ascii=False, indent=2)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="C# 프로젝트를 Java 로 일괄 변환합니다 (Streamlit 불필요)")
+    parser.add_argument("source", help="C# 프로젝트 디렉터리 또는 .zip 파일")
+    parser.add_argument("-o", "--output", required=True, help="Java 파일을 저장할 디렉터리")
+    parser.add_argument("--report", help="JSONL 리포트 경로 (기본: <출력>/conversion_report.jsonl)")
+    parser.add_argument("--telemetry", help="AI 호출별 토큰/지연 시간 기록을 저장할 JSONL 경로")
+    parser.add_argument("--workers", type=int, default=8, help="최대 동시 변환 수")
+    parser.add_argument("--project-context", action="store_true", help="프로젝트 단위 컨텍스트를 분석하여 변환")
+    parser.add_argument("--analyze", action="store_true", help="파일별 코드 분석 결과도 함께 저장")
+    parser.add_argument("--no-comments", action="store_true", help="주석을 제거하고 변환")
+    parser.add_argument("--no-getters-setters", action="store_true", help="Properties 를 public 필드로 변환")
+    parser.add_argument("--keep-csharp-naming", action="store_true", help="Java 네이밍 컨벤션을 적용하지 않음")
+    parser.add_argument("--no-chunking", action="store_true", help="대용량 파일 분할 변환을 사용하지 않음")
+    parser.add_argument("--no-packing", action="store_true", help="작은 파일을 묶어서 변환하지 않음 (파일마다 개별 요청)")
+    parser.add_argument("--no-fast-path", action="store_true", help="단순 파일도 규칙 기반 로컬 변환 없이 AI 로 변환")
+    parser.add_argument("--batch", action="store_true", help="Batch API 로 제출하여 변환 (최대 24시간, 비용 절감)")
+    parser.add_argument("--batch-poll-interval", type=float, default=BATCH_POLL_INTERVAL_SECONDS, help="배치 상태 조회 간격 (초)")
+    args = parser.parse_args(argv)
+    if args.batch and args.analyze:
+        parser.error("--analyze 는 --batch 와 함께 사용할 수 없습니다")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    log = logging.getLogger("convert_cli")
+
+    files = read_csharp_sources(args.source)
+    if not files:
+        log.error("C# 파일을 찾을 수 없습니다: %s", args.source)
+        return 1
+    log.info("%d개의 C# 파일을 변환합니다.", len(files))
+
+    project_context = ""
+    if args.project_context and len(files) > 1:
+        project_context = analyze_project_context(files)
+
+    os.makedirs(args.output, exist_ok=True)
+    report_path = args.report or os.path.join(args.output, "conversion_report.jsonl")
+    started_at = time.perf_counter()
+
+    def on_progress(done, total, unit):
+        if len(unit) == 1:
+            log.info("(%d/%d) %s", done, total, unit[0]["filename"])
+        else:
+            log.info("(%d/%d) %s 외 %d개 파일 (묶음 변환)", done, total, unit[0]["filename"], len(unit) - 1)
+
+    if args.batch:
+        outputs = convert_with_batch(files, args, project_context, log)
+    else:
+        units = pack_small_files(files, conversion_options(args))
+        unit_outputs = run_concurrent(
+            units,
+            lambda unit: convert_unit(unit, args, project_context),
+            on_progress=on_progress,
+            limiter=AdaptiveConcurrencyLimiter(initial=min(4, args.workers), max_limit=args.workers),
+            on_error=failed_unit,
+        )
+        outputs = [output for unit_output in unit_outputs for output in unit_output]
+
+    failures = 0
+    with open(report_path, "w", encoding="utf-8") as report:
+        for result, record in outputs:
+            write_outputs(args.output, result, record)
+            if record["status"] != STATUS_OK:
+                failures += 1
+            record.pop("analysis", None)
+            report.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    elapsed = time.perf_counter() - started_at
+    telemetry = get_telemetry()
+    summary = telemetry.summarize(telemetry.records())
+    if summary["calls"]:
+        log.info(
+            "AI 호출 %d건: 입력 %d / 출력 %d 토큰, 지연 p50 %.2f초 / p95 %.2f초",
+            summary["calls"], summary["prompt_tokens"], summary["completion_tokens"],
+            summary["latency_p50"] or 0, summary["latency_p95"] or 0,
+        )
+    pool_stats = get_http_pool_stats()
+    if pool_stats is not None:
+        log.info(
+            "HTTP 요청 %d건: 새 연결 %d개 (재사용률 %.0f%%), 최대 동시 요청 %d건",
+            pool_stats["requests"], pool_stats["connections_opened"],
+            pool_stats["connection_reuse_rate"], pool_stats["peak_in_flight"],
+        )
+    if args.telemetry:
+        with open(args.telemetry, "w", encoding="utf-8") as f:
+            f.write(telemetry.to_jsonl(telemetry.records()))
+    log.info(
+        "완료: %d개 중 %d개 성공, %d개 실패 (%.1f초, 리포트: %s)",
+        len(outputs), len(outputs) - failures, failures, elapsed, report_path,
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+import re
+
+# 이 크기를 넘는 파일만 분할 변환
+CHUNK_THRESHOLD_CHARS = 20000
+# 청크 하나에 담을 멤버 코드 최대 크기
+MAX_CHUNK_CHARS = 8000
+
+_TYPE_PATTERN = re.compile(r"\b(class|struct|interface|enum|record)\s+(\w+)")
+_NAMESPACE_PATTERN = re.compile(r"\bnamespace\s+[\w.]+")
+_ATTRIBUTE_PATTERN = re.compile(r"^\s*(\[[^\]]*\]\s*)+")
+_JAVA_TYPE_PATTERN = r"\b(class|interface|enum|record)\s+{name}\b"
+
+
+def _scan_blocks(code):
+    """문자열/주석을 건너뛰며 중괄호 블록 트리를 구성
+
+    각 블록: {"open": '{' 위치, "close": '}' 위치, "start": 선언부 시작 위치, "children": [...]}
+    선언부 시작 위치는 같은 깊이의 직전 ';' / '{' / '}' 바로 다음입니다.
+    """
+    root = {"open": -1, "close": len(code), "start": 0, "children": []}
+    stack = [root]
+    boundary = [0]  # 깊이별 마지막 문장 경계
+    i = 0
+    n = len(code)
+
+    while i < n:
+        ch = code[i]
+        if code.startswith("//", i):
+            end = code.find("\n", i)
+            i = n if end == -1 else end
+            continue
+        if code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            continue
+        if ch == '"' or ch == "'" or code.startswith(('@"', '$"', '$@"', '@$"'), i):
+            start = i
+            while code[i] != '"' and code[i] != "'":
+                i += 1
+            verbatim = "@" in code[start:i]
+            quote = code[i]
+            i += 1
+            while i < n:
+                if verbatim and code.startswith('""', i):
+                    i += 2
+                elif not verbatim and code[i] == "\\":
+                    i += 2
+                elif code[i] == quote:
+                    i += 1
+                    break
+                else:
+                    i += 1
+            continue
+
+        if ch == "{":
+            block = {"open": i, "close": None, "start": boundary[-1], "children": []}
+            stack[-1]["children"].append(block)
+            stack.append(block)
+            boundary.append(i + 1)
+        elif ch == "}":
+            if len(stack) > 1:
+                block = stack.pop()
+                block["close"] = i
+                boundary.pop()
+                boundary[-1] = i + 1
+        elif ch == ";":
+            boundary[-1] = i + 1
+        i += 1
+
+    # 닫히지 않은 블록은 파일 끝에서 닫힌 것으로 간주
+    while len(stack) > 1:
+        stack.pop()["close"] = n - 1
+    return root
+
+
+def _header(code, block):
+    return code[block["start"]:block["open"]]
+
+
+def _is_method(header):
+    # 속성/인덱서 접근자가 아닌, 매개변수 목록이 있는 멤버 (메서드, 생성자, 연산자)
+    signature = _signature(header)
+    return "(" in signature and not _TYPE_PATTERN.search(signature) and "=>" not in signature
+
+
+def _signature(header):
+    # 주석/특성([...])을 제외한 한 줄 시그니처
+    lines = []
+    for line in header.strip().splitlines():
+        line = _ATTRIBUTE_PATTERN.sub("", line).strip()
+        if line and not line.startswith(("//", "/*", "*")):
+            lines.append(line)
+    return " ".join(lines)
+
+
+def _collect_types(code, block, types):
+    for child in block["children"]:
+        header = _header(code, child)
+        match = _TYPE_PATTERN.search(header)
+        if match:
+            types.append({"block": child, "name": match.group(2), "signature": _signature(header)})
+            _collect_types(code, child, types)
+        elif _NAMESPACE_PATTERN.search(header):
+            _collect_types(code, child, types)
+
+
+def split_csharp_file(code, threshold=CHUNK_THRESHOLD_CHARS, max_chunk_chars=MAX_CHUNK_CHARS):
+    """큰 C# 파일을 타입 골격(skeleton)과 메서드 청크로 분할
+
+    반환값: None (분할 불필요) 또는
+    {
+        "skeleton": 메서드 본문을 제거한 전체 파일 (using, namespace, 타입 선언, 필드, 속성),
+        "chunks": [{"type_name", "shared_header", "code"}],
+    }
+    shared_header 는 using 문, namespace, 타입 시그니처, 필드 선언과
+    같은 타입의 전체 메서드 시그니처로 구성되어 모든 청크가 같은 문맥을 공유합니다.
+    """
+    if len(code) <= threshold:
+        return None
+
+    root = _scan_blocks(code)
+    types = []
+    _collect_types(code, root, types)
+
+    usings = "\n".join(
+        line.strip() for line in code.splitlines() if line.strip().startswith("using ") and line.strip().endswith(";")
+    )
+    namespace_match = _NAMESPACE_PATTERN.search(code)
+    namespace_line = namespace_match.group(0) if namespace_match else ""
+
+    removed = []  # 골격에서 제거할 (시작, 끝) 범위
+    chunks = []
+    for type_info in types:
+        block = type_info["block"]
+        methods = [
+            child for child in block["children"]
+            if _is_method(_header(code, child))
+        ]
+        if not methods:
+            continue
+
+        signatures = "\n".join(f"    {_signature(_header(code, m))};" for m in methods)
+        fields = _skeleton_text(code, block, methods)
+        shared_header = (
+            f"{usings}\n\n{namespace_line}\n\n"
+            f"// 타입 시그니처\n{type_info['signature']}\n\n"
+            f"// 필드/속성 선언\n{fields.strip()}\n\n"
+            f"// 메서드 시그니처\n{signatures}\n"
+        )
+
+        current = []
+        current_size = 0
+        for method in methods:
+            member_code = code[method["start"]:method["close"] + 1]
+            if current and current_size + len(member_code) > max_chunk_chars:
+                chunks.append({"type_name": type_info["name"], "shared_header": shared_header, "code": "\n".join(current)})
+                current, current_size = [], 0
+            current.append(member_code)
+            current_size += len(member_code)
+            removed.append((method["start"], method["close"] + 1))
+        if current:
+            chunks.append({"type_name": type_info["name"], "shared_header": shared_header, "code": "\n".join(current)})
+
+    if len(chunks) < 2:
+        return None
+
+    return {"skeleton": _remove_ranges(code, removed), "chunks": chunks}
+
+
+def _skeleton_text(code, block, methods):
+    body = code[block["open"] + 1:block["close"]]
+    offset = block["open"] + 1
+    ranges = [(m["start"] - offset, m["close"] + 1 - offset) for m in methods]
+    return _remove_ranges(body, ranges)
+
+
+def _remove_ranges(text, ranges):
+    parts = []
+    position = 0
+    for start, end in sorted(ranges):
+        parts.append(text[position:start])
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def _find_java_type_end(java_code, type_name):
+    """Java 코드에서 타입 선언의 닫는 중괄호 위치를 찾음 (없으면 -1)"""
+    match = re.search(_JAVA_TYPE_PATTERN.format(name=re.escape(type_name)), java_code)
+    if not match:
+        return -1
+    open_index = java_code.find("{", match.end())
+    if open_index == -1:
+        return -1
+    root = _scan_blocks(java_code[open_index:])
+    if not root["children"]:
+        return -1
+    return open_index + root["children"][0]["close"]
+
+
+def stitch_java(skeleton_java, chunk_results):
+    """골격 Java 코드의 각 타입 닫는 중괄호 앞에 변환된 메서드 청크를 삽입
+
+    chunk_results: [(type_name, java_members)] (원본 순서)
+    """
+    java_code = skeleton_java.rstrip()
+    grouped = {}
+    order = []
+    for type_name, members in chunk_results:
+        if type_name not in grouped:
+            grouped[type_name] = []
+            order.append(type_name)
+        grouped[type_name].append(members.strip("\n"))
+
+    for type_name in order:
+        members = "\n\n".join(grouped[type_name])
+        end = _find_java_type_end(java_code, type_name)
+        if end == -1:
+            # 타입을 찾지 못하면 마지막 닫는 중괄호 앞에 삽입
+            end = java_code.rfind("}")
+            if end == -1:
+                java_code += "\n\n" + members + "\n"
+                continue
+        java_code = java_code[:end].rstrip() + "\n\n" + members + "\n" + java_code[end:]
+
+    return java_code
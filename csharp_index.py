@@ -0,0 +1,390 @@
+import re
+
+# 주석/문자열/전처리기 지시문 (내용을 공백으로 지워 선언부 분석에 방해되지 않도록 함)
+_LEXER_PATTERN = re.compile(
+    r"""
+      //[^\n]*
+    | /\*.*?\*/
+    | (?:\$@|@\$|@)"(?:[^"]|"")*"
+    | \$?"(?:\\.|[^"\\\n])*"
+    | '(?:\\.|[^'\\\n])*'
+    | ^[ \t]*\#[^\n]*
+    """,
+    re.S | re.M | re.X,
+)
+_LEADING_ATTRIBUTE_PATTERN = re.compile(r"^\s*\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]")
+_TYPE_DECLARATION_PATTERN = re.compile(
+    r"\b(class|struct|interface|enum|record(?:\s+class|\s+struct)?|delegate)\s+"
+)
+_NAMESPACE_DECLARATION_PATTERN = re.compile(r"^\s*namespace\s+([\w.]+)\s*$")
+_USING_PATTERN = re.compile(r"^\s*(?:global\s+)?using\s+(?:static\s+)?(?:\w+\s*=\s*)?([\w.<>, ]+?)\s*$")
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*")
+_BLOCK_TOKEN_PATTERN = re.compile(r"[{};]")
+_MODIFIERS = {
+    "public", "private", "protected", "internal", "static", "abstract", "sealed", "partial",
+    "virtual", "override", "readonly", "const", "new", "extern", "unsafe", "async", "volatile",
+    "required", "file", "ref", "event", "implicit", "explicit", "operator",
+}
+
+
+def _blank(match):
+    text = match.group(0)
+    # 문자열은 따옴표만 남기고 내용을 지움 (위치는 그대로 유지)
+    if text.endswith('"') and '"' in text[:-1]:
+        start = text.index('"')
+        return text[:start + 1] + " " * (len(text) - start - 2) + '"'
+    return " " * len(text)
+
+
+def _clean(code):
+    return _LEXER_PATTERN.sub(_blank, code)
+
+
+def _scan_blocks(code):
+    """주석/문자열을 지운 코드의 중괄호 블록 트리 (csharp_chunker._scan_blocks 와 같은 구조)
+
+    문자를 하나씩 검사하지 않고 '{', '}', ';' 위치만 정규식으로 찾아 대규모 프로젝트도 빠르게 처리합니다.
+    """
+    root = {"open": -1, "close": len(code), "start": 0, "children": []}
+    stack = [root]
+    boundary = [0]
+    for match in _BLOCK_TOKEN_PATTERN.finditer(code):
+        ch = match.group(0)
+        i = match.start()
+        if ch == "{":
+            block = {"open": i, "close": None, "start": boundary[-1], "children": []}
+            stack[-1]["children"].append(block)
+            stack.append(block)
+            boundary.append(i + 1)
+        elif ch == "}":
+            if len(stack) > 1:
+                stack.pop()["close"] = i
+                boundary.pop()
+                boundary[-1] = i + 1
+        else:
+            boundary[-1] = i + 1
+
+    while len(stack) > 1:
+        stack.pop()["close"] = len(code) - 1
+    return root
+
+
+def _strip_attributes(text):
+    text = text.strip()
+    while True:
+        match = _LEADING_ATTRIBUTE_PATTERN.match(text)
+        if not match:
+            return text
+        text = text[match.end():].strip()
+
+
+def _normalize(text):
+    return " ".join(_strip_attributes(text).split())
+
+
+def _split_top_level(text, separator=","):
+    """제네릭 꺾쇠/괄호 안의 구분자는 무시하고 분리"""
+    parts = []
+    depth = 0
+    current = ""
+    for ch in text:
+        if ch in "<([":
+            depth += 1
+        elif ch in ">)]":
+            depth -= 1
+        if ch == separator and depth == 0:
+            parts.append(current.strip())
+            current = ""
+        else:
+            current += ch
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _base_name(type_text):
+    # "IRepository<Movie>" -> "IRepository", "System.IDisposable" -> "IDisposable"
+    return type_text.split("<")[0].strip().split(".")[-1]
+
+
+def _parse_type_header(header):
+    """타입 선언부에서 {"kind", "name", "bases"} 추출 (타입 선언이 아니면 None)"""
+    match = _TYPE_DECLARATION_PATTERN.search(header)
+    if not match or "(" in header[:match.start()] or "=" in header[:match.start()]:
+        return None
+    kind = match.group(1).split()[0]
+    rest = header[match.end():]
+
+    if kind == "delegate":
+        # delegate 반환형 이름(매개변수)
+        name_match = re.search(r"(\w+)\s*(?:<[^>]*>)?\s*\(", rest)
+        return {"kind": kind, "name": name_match.group(1), "bases": []} if name_match else None
+
+    name_match = _IDENTIFIER_PATTERN.match(rest)
+    if not name_match:
+        return None
+    rest = rest[name_match.end():]
+    # 제네릭 매개변수 / record 기본 생성자 건너뜀
+    rest = re.sub(r"^\s*<[^>]*>", "", rest)
+    if rest.lstrip().startswith("("):
+        depth = 0
+        for i, ch in enumerate(rest):
+            depth += ch == "("
+            depth -= ch == ")"
+            if depth == 0 and ch == ")":
+                rest = rest[i + 1:]
+                break
+
+    bases = []
+    rest = rest.split(" where ")[0]
+    if rest.strip().startswith(":"):
+        bases = [_base_name(base.split("(")[0]) for base in _split_top_level(rest.strip()[1:])]
+    return {"kind": kind, "name": name_match.group(0), "bases": [b for b in bases if b]}
+
+
+def _parse_member(statement):
+    """타입 본문의 멤버 선언에서 {"kind", "name", "signature"} 추출"""
+    signature = _normalize(statement)
+    if not signature or signature.startswith(("=", "where ")):
+        return None
+
+    head = signature.split("=>")[0].split(" = ")[0].strip()
+    if "(" in head:
+        before = head[:head.index("(")].strip()
+        before = re.sub(r"<[^<>]*(?:<[^<>]*>[^<>]*)*>$", "", before).strip()
+        words = before.split()
+        if not words:
+            return None
+        return {"kind": "method", "name": words[-1].split(".")[-1], "signature": head}
+
+    words = [w for w in re.split(r"\s+", head) if w]
+    if len(words) < 2:
+        return None
+    name = words[-1].rstrip(",")
+    if name == "]" or name.startswith("this["):
+        return {"kind": "indexer", "name": "this", "signature": head}
+    if not _IDENTIFIER_PATTERN.fullmatch(name):
+        return None
+    return {"kind": "field", "name": name, "signature": head}
+
+
+def _statements(code, block):
+    """블록 본문 중 하위 블록을 제외한 ';' 단위 문장들"""
+    body_start = block["open"] + 1
+    body_end = block["close"]
+    text = ""
+    position = body_start
+    for child in block["children"]:
+        text += code[position:child["start"]]
+        position = child["close"] + 1
+    text += code[position:body_end]
+    return [statement for statement in text.split(";") if statement.strip()]
+
+
+def _referenced_names(signature):
+    return set(_IDENTIFIER_PATTERN.findall(signature)) - _MODIFIERS
+
+
+def _new_type(header_info, namespace, filename):
+    return {
+        "name": header_info["name"],
+        "kind": header_info["kind"],
+        "namespace": namespace,
+        "file": filename,
+        "bases": header_info["bases"],
+        "methods": [],
+        "properties": [],
+        "fields": [],
+        "references": set(),
+    }
+
+
+def _index_type(code, block, header_info, namespace, filename, types):
+    type_info = _new_type(header_info, namespace, filename)
+    types.append(type_info)
+
+    if header_info["kind"] == "enum":
+        body = code[block["open"] + 1:block["close"]]
+        type_info["fields"] = [
+            _normalize(value).split("=")[0].strip() for value in _split_top_level(body) if _normalize(value)
+        ]
+        return
+
+    for child in block["children"]:
+        header = _normalize(code[child["start"]:child["open"]])
+        nested = _parse_type_header(header)
+        if nested:
+            _index_type(code, child, nested, namespace, filename, types)
+            continue
+        member = _parse_member(header)
+        if member is None:
+            continue
+        # 본문 블록이 있는 멤버: 매개변수가 있으면 메서드/생성자, 없으면 속성/이벤트
+        if member["kind"] == "field":
+            type_info["properties"].append(member["signature"])
+        elif member["kind"] == "method":
+            type_info["methods"].append(member["signature"])
+        type_info["references"] |= _referenced_names(member["signature"])
+
+    for statement in _statements(code, block):
+        # 본문 없는 타입 선언 (record Point(int X, int Y); / delegate)
+        nested = _parse_type_header(_normalize(statement))
+        if nested:
+            types.append(_new_type(nested, namespace, filename))
+            continue
+        member = _parse_member(statement)
+        if member is None:
+            continue
+        # 식 본문(=>) 멤버는 속성, 그 외 ';' 로 끝나는 선언은 필드/추상 메서드
+        if member["kind"] == "method":
+            type_info["methods"].append(member["signature"])
+        elif "=>" in statement:
+            type_info["properties"].append(member["signature"])
+        else:
+            type_info["fields"].append(member["signature"])
+        type_info["references"] |= _referenced_names(member["signature"])
+
+
+def _index_scope(code, block, namespace, filename, result):
+    # 파일 범위 namespace (namespace A.B;) 는 이후 선언 전체에 적용
+    for statement in _statements(code, block):
+        text = _normalize(statement)
+        namespace_match = _NAMESPACE_DECLARATION_PATTERN.match(text)
+        using_match = _USING_PATTERN.match(text)
+        if namespace_match:
+            namespace = namespace_match.group(1)
+            result["namespaces"].append(namespace)
+        elif using_match and text.split()[0] in ("using", "global"):
+            result["usings"].append(using_match.group(1).replace(" ", ""))
+        else:
+            header_info = _parse_type_header(text)
+            if header_info:
+                result["types"].append(_new_type(header_info, namespace, filename))
+
+    for child in block["children"]:
+        header = _normalize(code[child["start"]:child["open"]])
+        namespace_match = re.match(r"namespace\s+([\w.]+)", header)
+        if namespace_match:
+            child_namespace = f"{namespace}.{namespace_match.group(1)}" if namespace else namespace_match.group(1)
+            result["namespaces"].append(child_namespace)
+            _index_scope(code, child, child_namespace, filename, result)
+            continue
+        header_info = _parse_type_header(header)
+        if header_info:
+            _index_type(code, child, header_info, namespace, filename, result["types"])
+
+
+def index_csharp_file(filename, code):
+    """C# 파일 하나의 선언 정보 {"namespaces", "usings", "types"} (메서드 본문은 분석하지 않음)"""
+    cleaned = _clean(code)
+    root = _scan_blocks(cleaned)
+    result = {"namespaces": [], "usings": [], "types": []}
+    _index_scope(cleaned, root, "", filename, result)
+    return result
+
+
+def build_symbol_index(extracted_files):
+    """프로젝트 전체 파일의 선언 인덱스 (LLM 호출 없이 한 번에 분석)
+
+    반환값: {"namespaces": [...], "types": [...], "files": {파일명: {"namespaces", "usings", "types"}}}
+    """
+    namespaces = set()
+    types = []
+    files = {}
+    for file_info in extracted_files:
+        file_index = index_csharp_file(file_info["filename"], file_info["content"])
+        namespaces.update(file_index["namespaces"])
+        types.extend(file_index["types"])
+        files[file_info["filename"]] = {
+            "namespaces": file_index["namespaces"],
+            "usings": file_index["usings"],
+            "types": [type_info["name"] for type_info in file_index["types"]],
+        }
+    return {"namespaces": sorted(namespaces), "types": types, "files": files}
+
+
+def _is_interface_name(name, kinds):
+    # 프로젝트 밖 타입은 .NET 명명 규칙(I + 대문자)으로 인터페이스 여부 판단
+    if name in kinds:
+        return kinds[name] == "interface"
+    return len(name) > 1 and name[0] == "I" and name[1].isupper()
+
+
+def project_context_from_index(index):
+    """심볼 인덱스를 변환 프롬프트용 프로젝트 컨텍스트(JSON) 로 변환
+
+    {"namespaces", "interfaces", "base_classes", "custom_types", "dependencies"}
+    """
+    kinds = {}
+    for type_info in index["types"]:
+        kinds.setdefault(type_info["name"], type_info["kind"])
+
+    interfaces = {}
+    base_names = set()
+    dependencies = set()
+    for type_info in index["types"]:
+        name = type_info["name"]
+        if type_info["kind"] == "interface":
+            interfaces.setdefault(name, [])
+            interfaces[name].extend(m for m in type_info["methods"] if m not in interfaces[name])
+
+        for position, base in enumerate(type_info["bases"]):
+            if type_info["kind"] == "interface":
+                relation = "상속"
+            elif type_info["kind"] in ("class", "record") and position == 0 and not _is_interface_name(base, kinds):
+                relation = "상속"
+                base_names.add(base)
+            else:
+                relation = "구현"
+            dependencies.add((name, base, relation))
+
+        # 멤버 시그니처에 등장하는 프로젝트 타입은 의존 관계
+        for referenced in type_info["references"]:
+            if referenced in kinds and referenced != name and referenced not in type_info["bases"]:
+                dependencies.add((name, referenced, "의존"))
+
+    base_classes = {}
+    for type_info in index["types"]:
+        if type_info["name"] in base_names and type_info["kind"] in ("class", "record"):
+            properties = base_classes.setdefault(type_info["name"], [])
+            properties.extend(p for p in type_info["properties"] if p not in properties)
+
+    return {
+        "namespaces": index["namespaces"],
+        "interfaces": [{"name": name, "methods": methods} for name, methods in sorted(interfaces.items())],
+        "base_classes": [{"name": name, "properties": properties} for name, properties in sorted(base_classes.items())],
+        "custom_types": sorted(set(kinds)),
+        "dependencies": [
+            {"from": source, "to": target, "type": relation}
+            for source, target, relation in sorted(dependencies)
+        ],
+    }
+
+
+_NAMESPACE_REFERENCE_PATTERN = re.compile(r"\b(?:using|namespace)\s+(?:static\s+)?(?:\w+\s*=\s*)?([\w.]+)")
+
+
+def select_file_context(project_context, code):
+    """프로젝트 컨텍스트 중 이 파일이 실제로 참조하는 타입/네임스페이스 관련 항목만 선택
+
+    프로젝트 크기와 관계없이 파일별 프롬프트 크기가 일정하게 유지됩니다.
+    """
+    if not isinstance(project_context, dict):
+        return project_context
+
+    cleaned = _clean(code)
+    names = set(_IDENTIFIER_PATTERN.findall(cleaned))
+    namespaces = set(_NAMESPACE_REFERENCE_PATTERN.findall(cleaned))
+
+    selected = {
+        "namespaces": [n for n in project_context.get("namespaces", []) if n in namespaces],
+        "interfaces": [i for i in project_context.get("interfaces", []) if i.get("name") in names],
+        "base_classes": [b for b in project_context.get("base_classes", []) if b.get("name") in names],
+        "custom_types": [t for t in project_context.get("custom_types", []) if t in names],
+        "dependencies": [
+            d for d in project_context.get("dependencies", [])
+            if d.get("from") in names and d.get("to") in names
+        ],
+    }
+    # 비어 있는 항목은 생략
+    return {key: value for key, value in selected.items() if value}
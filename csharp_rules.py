@@ -0,0 +1,818 @@
+"""규칙 기반 C# → Java 로컬 변환 (단순 POCO / enum / interface 전용)
+
+자동 속성·필드·상수만 있는 클래스, 값 목록만 있는 enum, 메서드 시그니처와 속성만 있는 interface 처럼
+기본 변환 규칙(Properties → getter/setter, string → String, PascalCase → camelCase)만으로 변환되는 파일을
+AI 호출 없이 바로 변환합니다. 메서드 본문, 생성자, 특성([...]), 식 본문(=>), 알 수 없는 타입 등 지원하지 않는
+구문이 하나라도 있으면 None 을 반환하여 AI 변환을 사용하도록 합니다.
+"""
+import re
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+      (?P<doc>///[^\n]*)
+    | (?P<comment>//[^\n]*|/\*.*?\*/)
+    | (?P<directive>^[ \t]*\#[^\n]*)
+    | (?P<string>"(?:\\.|[^"\\\n])*")
+    | (?P<char>'(?:\\.|[^'\\\n])')
+    | (?P<number>\d[\w.]*)
+    | (?P<name>[A-Za-z_]\w*)
+    | (?P<symbol>[{}()\[\]<>,;:=?.\-])
+    | (?P<space>\s+)
+    | (?P<other>.)
+    """,
+    re.S | re.M | re.X,
+)
+# 메서드/생성자 본문, 식 본문(=>), 특성 – 토큰 분석 전에 빠르게 제외 (주석/문자열 안에 있어도 AI 변환)
+_QUICK_REJECT_PATTERN = re.compile(r"\)\s*\{|=>|^\s*\[", re.M)
+# 무시해도 되는 전처리기 지시문 (그 밖의 #if 등은 AI 변환)
+_IGNORED_DIRECTIVES = ("#region", "#endregion", "#nullable", "#pragma warning")
+
+# C# 기본 타입 → (Java 타입, 제네릭 인자로 쓸 박싱 타입, import)
+_PRIMITIVE_TYPES = {
+    "string": ("String", "String", None),
+    "String": ("String", "String", None),
+    "int": ("int", "Integer", None),
+    "Int32": ("int", "Integer", None),
+    "long": ("long", "Long", None),
+    "Int64": ("long", "Long", None),
+    "short": ("short", "Short", None),
+    "Int16": ("short", "Short", None),
+    "byte": ("byte", "Byte", None),
+    "sbyte": ("byte", "Byte", None),
+    "bool": ("boolean", "Boolean", None),
+    "Boolean": ("boolean", "Boolean", None),
+    "double": ("double", "Double", None),
+    "Double": ("double", "Double", None),
+    "float": ("float", "Float", None),
+    "Single": ("float", "Float", None),
+    "char": ("char", "Character", None),
+    "object": ("Object", "Object", None),
+    "Object": ("Object", "Object", None),
+    "decimal": ("BigDecimal", "BigDecimal", "java.math.BigDecimal"),
+    "Decimal": ("BigDecimal", "BigDecimal", "java.math.BigDecimal"),
+    "DateTime": ("LocalDateTime", "LocalDateTime", "java.time.LocalDateTime"),
+    "DateTimeOffset": ("OffsetDateTime", "OffsetDateTime", "java.time.OffsetDateTime"),
+    "DateOnly": ("LocalDate", "LocalDate", "java.time.LocalDate"),
+    "TimeOnly": ("LocalTime", "LocalTime", "java.time.LocalTime"),
+    "TimeSpan": ("Duration", "Duration", "java.time.Duration"),
+    "Guid": ("UUID", "UUID", "java.util.UUID"),
+}
+
+# C# 컬렉션 → (Java 인터페이스, 구현 클래스, 제네릭 인자 수)
+_COLLECTION_TYPES = {
+    "List": ("List", "ArrayList", 1),
+    "IList": ("List", "ArrayList", 1),
+    "ICollection": ("List", "ArrayList", 1),
+    "IEnumerable": ("List", "ArrayList", 1),
+    "IReadOnlyList": ("List", "ArrayList", 1),
+    "IReadOnlyCollection": ("List", "ArrayList", 1),
+    "Dictionary": ("Map", "HashMap", 2),
+    "IDictionary": ("Map", "HashMap", 2),
+    "IReadOnlyDictionary": ("Map", "HashMap", 2),
+    "HashSet": ("Set", "HashSet", 1),
+    "ISet": ("Set", "HashSet", 1),
+}
+
+_TYPE_MODIFIERS = {"public", "internal", "sealed", "abstract", "static"}
+_MEMBER_MODIFIERS = {"public", "private", "protected", "internal", "static", "readonly", "const", "virtual", "required"}
+_ACCESS_MODIFIERS = {"public", "private", "protected", "internal"}
+
+_JAVA_KEYWORDS = {
+    "abstract", "assert", "boolean", "break", "byte", "case", "catch", "char", "class", "const", "continue",
+    "default", "do", "double", "else", "enum", "extends", "final", "finally", "float", "for", "goto", "if",
+    "implements", "import", "instanceof", "int", "interface", "long", "native", "new", "package", "private",
+    "protected", "public", "return", "short", "static", "strictfp", "super", "switch", "synchronized", "this",
+    "throw", "throws", "transient", "try", "void", "volatile", "while", "true", "false", "null", "var", "record",
+}
+
+_INDENT = "    "
+
+
+class _Unsupported(Exception):
+    """규칙 기반으로 변환할 수 없는 구문 (AI 변환 대상)"""
+
+
+class _Token:
+    def __init__(self, kind, text, line):
+        self.kind = kind
+        self.text = text
+        self.line = line
+        self.comments = []  # 바로 앞의 주석 (("doc" | "comment", 원문), ...)
+        self.trailing = None  # 같은 줄 뒤에 붙은 주석
+
+
+def _tokenize(code):
+    tokens = []
+    pending = []
+    line = 1
+    for match in _TOKEN_PATTERN.finditer(code):
+        kind = match.lastgroup
+        text = match.group(0)
+        if kind == "other":
+            raise _Unsupported(text)
+        if kind == "directive":
+            if not text.strip().startswith(_IGNORED_DIRECTIVES):
+                raise _Unsupported(text.strip())
+        elif kind in ("doc", "comment"):
+            # 같은 줄의 앞 토큰 뒤에 붙은 주석은 그 토큰의 후행 주석
+            if tokens and not pending and tokens[-1].line == line and tokens[-1].trailing is None and kind == "comment":
+                tokens[-1].trailing = text
+            else:
+                pending.append((kind, text))
+        elif kind != "space":
+            token = _Token(kind, text, line)
+            token.comments, pending = pending, []
+            tokens.append(token)
+        line += text.count("\n")
+    if pending:
+        # 파일 끝 주석은 마지막 토큰의 후행 주석으로 취급하지 않음
+        raise _Unsupported("파일 끝 주석")
+    return tokens
+
+
+# 이름 변환 (PascalCase → camelCase / UPPER_SNAKE)
+def _camel(name):
+    name = re.sub(r"^(?:m_|_+)", "", name)
+    if not name:
+        raise _Unsupported("이름")
+    if name.isupper():
+        return name.lower()
+    run = len(name) - len(name.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    if run > 1:
+        return name[:run - 1].lower() + name[run - 1:]
+    return name[0].lower() + name[1:]
+
+
+def _pascal(name):
+    name = re.sub(r"^(?:m_|_+)", "", name)
+    return name[0].upper() + name[1:]
+
+
+def _accessor_name(name, java_type, use_java_conventions):
+    """getter/setter 이름 (boolean 은 isXxx(), IsActive 같은 속성은 isActive() / setActive())"""
+    if not use_java_conventions:
+        return "get", name
+    name = _pascal(name)
+    if java_type == "boolean":
+        if re.match(r"Is[A-Z]", name):
+            name = name[2:]
+        return "is", name
+    return "get", name
+
+
+def _claim_method(signatures, name, parameter_types=()):
+    """생성한 메서드 시그니처 등록 (IsOpen/Open 속성의 isOpen() 처럼 이미 있는 시그니처면 지원하지 않음)"""
+    # 제네릭 타입 인자는 컴파일 후 지워지므로 비교에서 제외
+    signature = (name, tuple(re.sub(r"<.*>", "", parameter_type) for parameter_type in parameter_types))
+    if signature in signatures:
+        raise _Unsupported(f"메서드 이름 충돌 {name}")
+    signatures.add(signature)
+
+
+# C# 문자열/문자 리터럴 → Java 리터럴 (Java 에 없는 이스케이프는 같은 문자를 나타내는 8진수/\u 이스케이프로 변환)
+_ESCAPE_PATTERN = re.compile(r"\\(x[0-9A-Fa-f]{1,4}|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|.)")
+_SIMPLE_ESCAPES = {
+    "'": "\\'", '"': '\\"', "\\": "\\\\", "b": "\\b", "f": "\\f", "n": "\\n", "r": "\\r", "t": "\\t",
+    # \0 뒤의 숫자를 Java 가 8진수로 이어 읽지 않도록 3자리로 씀
+    "0": "\\000", "a": "\\007", "v": "\\013", "e": "\\033",
+}
+
+
+def _java_escape(code_point, allow_surrogates=True):
+    # \u000a 같은 유니코드 이스케이프는 Java 가 소스를 읽기 전에 풀어 버리므로 0xFF 이하는 8진수로 씀
+    if code_point <= 0xFF:
+        return f"\\{code_point:03o}"
+    if code_point <= 0xFFFF:
+        return f"\\u{code_point:04x}"
+    if not allow_surrogates or code_point > 0x10FFFF:
+        raise _Unsupported(f"문자 코드 {code_point:x}")
+    code_point -= 0x10000
+    return f"\\u{0xD800 + (code_point >> 10):04x}\\u{0xDC00 + (code_point & 0x3FF):04x}"
+
+
+def _java_literal(token):
+    def replace(match):
+        escape = match.group(1)
+        if escape in _SIMPLE_ESCAPES:
+            return _SIMPLE_ESCAPES[escape]
+        if escape[0] in "xuU" and len(escape) > 1:
+            return _java_escape(int(escape[1:], 16), allow_surrogates=token.kind == "string")
+        raise _Unsupported(f"문자열 이스케이프 \\{escape}")
+
+    return _ESCAPE_PATTERN.sub(replace, token.text)
+
+
+def _constant(name):
+    name = name.lstrip("_")
+    if name.isupper():
+        return name
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", name).upper()
+
+
+# XML 문서 주석 (/// <summary>) → Javadoc
+def _inline_xml(text):
+    text = re.sub(r'<see\s+cref="(?:\w:)?([\w.]+)(?:\{[^}]*\})?"\s*/>', r"{@link \1}", text)
+    text = re.sub(r'<(?:paramref|typeparamref)\s+name="(\w+)"\s*/>', r"\1", text)
+    text = re.sub(r"<c>(.*?)</c>", r"{@code \1}", text, flags=re.S)
+    text = re.sub(r"</?\w+[^>]*>", " ", text)
+    return " ".join(text.split())
+
+
+def _javadoc(doc_lines, indent):
+    xml = "\n".join(re.sub(r"^\s*///\s?", "", line) for line in doc_lines)
+    body = []
+    for tag in ("summary", "value", "remarks"):
+        for content in re.findall(rf"<{tag}>(.*?)</{tag}>", xml, re.S):
+            if _inline_xml(content):
+                body.append(_inline_xml(content))
+    if not re.search(r"<(?:summary|value|remarks|param|returns|typeparam)\b", xml) and _inline_xml(xml):
+        body.append(_inline_xml(xml))
+    tags = [f"@param {name} {_inline_xml(content)}".rstrip() for name, content in re.findall(r'<param\s+name="(\w+)"\s*>(.*?)</param>', xml, re.S)]
+    tags += [f"@param <{name}> {_inline_xml(content)}".rstrip() for name, content in re.findall(r'<typeparam\s+name="(\w+)"\s*>(.*?)</typeparam>', xml, re.S)]
+    tags += [f"@return {_inline_xml(content)}" for content in re.findall(r"<returns>(.*?)</returns>", xml, re.S)]
+
+    lines = [f"{indent}/**"]
+    lines += [f"{indent} * {line}" for line in body]
+    if body and tags:
+        lines.append(f"{indent} *")
+    lines += [f"{indent} * {tag}" for tag in tags]
+    lines.append(f"{indent} */")
+    return lines
+
+
+def _comment_lines(comments, indent):
+    lines = []
+    doc = []
+    for kind, text in comments + [(None, None)]:
+        if kind == "doc":
+            doc.append(text)
+            continue
+        if doc:
+            lines += _javadoc(doc, indent)
+            doc = []
+        if kind == "comment":
+            for position, line in enumerate(text.splitlines()):
+                line = line.strip()
+                lines.append(indent + (" " + line if position and line.startswith("*") else line))
+    return lines
+
+
+# 토큰 목록을 읽으며 파일 전체를 Java 코드로 변환
+class _Converter:
+    def __init__(self, tokens, include_comments, generate_getters_setters, use_java_conventions, project_context):
+        self.tokens = tokens
+        self.position = 0
+        self.include_comments = include_comments
+        self.generate_getters_setters = generate_getters_setters
+        self.use_java_conventions = use_java_conventions
+
+        project_context = project_context if isinstance(project_context, dict) else {}
+        self.project_types = set(project_context.get("custom_types", []))
+        self.project_namespaces = set(project_context.get("namespaces", []))
+        self.known_types = set(self.project_types)
+        self.type_params = set()
+
+        self.imports = set()
+        self.type_mappings = {}
+        self.usings = []
+        self.notes = []
+
+    # 토큰 읽기
+    def peek(self, offset=0):
+        index = self.position + offset
+        return self.tokens[index].text if index < len(self.tokens) else None
+
+    def next(self):
+        if self.position >= len(self.tokens):
+            raise _Unsupported("파일 끝")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def accept(self, text):
+        if self.peek() == text:
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, text):
+        if not self.accept(text):
+            raise _Unsupported(f"{text} 필요: {self.peek()}")
+        return self.tokens[self.position - 1]
+
+    def identifier(self):
+        token = self.next()
+        if token.kind != "name":
+            raise _Unsupported(token.text)
+        return token.text
+
+    def comments_of(self, token, indent):
+        """토큰 앞의 주석을 Java 주석 줄로 변환 (사용한 주석은 비움)"""
+        comments, token.comments = token.comments, []
+        return _comment_lines(comments, indent) if self.include_comments else []
+
+    def trailing_of(self, token):
+        trailing, token.trailing = token.trailing, None
+        return f" {trailing}" if trailing and self.include_comments else ""
+
+    # 타입 참조
+    def parse_type_ref(self):
+        names = [self.identifier()]
+        while self.peek() == "." and self.tokens[self.position + 1].kind == "name":
+            self.position += 1
+            names.append(self.identifier())
+        args = []
+        if self.accept("<"):
+            args.append(self.parse_type_ref())
+            while self.accept(","):
+                args.append(self.parse_type_ref())
+            self.expect(">")
+        nullable = self.accept("?")
+        arrays = 0
+        while self.peek() == "[" and self.peek(1) == "]":
+            self.position += 2
+            arrays += 1
+        return {"name": names[-1], "qualified": ".".join(names), "args": args, "nullable": nullable, "arrays": arrays}
+
+    def java_type(self, ref, boxed=False):
+        name = ref["name"]
+        if name in _PRIMITIVE_TYPES and not ref["args"]:
+            java, boxed_java, module = _PRIMITIVE_TYPES[name]
+            if module:
+                self.imports.add(module)
+            result = boxed_java if (boxed or ref["nullable"]) and not ref["arrays"] else java
+            self.type_mappings[name + ("?" if ref["nullable"] else "")] = result
+        elif name in _COLLECTION_TYPES:
+            interface, _, arity = _COLLECTION_TYPES[name]
+            if len(ref["args"]) != arity:
+                raise _Unsupported(name)
+            self.imports.add(f"java.util.{interface}")
+            result = f"{interface}<{', '.join(self.java_type(arg, boxed=True) for arg in ref['args'])}>"
+            self.type_mappings[name] = interface
+        elif name == "Task":
+            if len(ref["args"]) > 1:
+                raise _Unsupported(name)
+            self.imports.add("java.util.concurrent.CompletableFuture")
+            argument = self.java_type(ref["args"][0], boxed=True) if ref["args"] else "Void"
+            result = f"CompletableFuture<{argument}>"
+            self.type_mappings["Task"] = "CompletableFuture"
+        elif name in self.known_types and ref["qualified"] == name:
+            result = name
+            if ref["args"]:
+                result += f"<{', '.join(self.java_type(arg, boxed=True) for arg in ref['args'])}>"
+        else:
+            raise _Unsupported(f"알 수 없는 타입 {ref['qualified']}")
+        return result + "[]" * ref["arrays"]
+
+    def member_name(self, name, style):
+        if name in _JAVA_KEYWORDS or name[:1].isdigit():
+            raise _Unsupported(name)
+        if not self.use_java_conventions:
+            converted = name
+        elif style == "constant":
+            converted = _constant(name)
+        else:
+            converted = _camel(name)
+        if converted in _JAVA_KEYWORDS:
+            raise _Unsupported(converted)
+        return converted
+
+    # 파일 (using / namespace / 타입 선언 하나)
+    def convert_file(self):
+        header = []
+        namespace = None
+        declaration = None
+        block_namespace = False
+
+        while self.peek() is not None:
+            token = self.tokens[self.position]
+            if self.peek() in ("using", "global"):
+                header += self.comments_of(token, "")
+                self.accept("global")
+                self.expect("using")
+                self.accept("static")
+                names = [self.identifier()]
+                while self.accept("."):
+                    names.append(self.identifier())
+                if self.peek() != ";":
+                    raise _Unsupported("using 별칭")
+                self.trailing_of(self.expect(";"))
+                self.usings.append(".".join(names))
+            elif self.peek() == "namespace":
+                if namespace is not None:
+                    raise _Unsupported("namespace 중첩")
+                header += self.comments_of(token, "")
+                self.next()
+                names = [self.identifier()]
+                while self.accept("."):
+                    names.append(self.identifier())
+                namespace = ".".join(names)
+                if not self.accept(";"):
+                    self.expect("{")
+                    block_namespace = True
+            elif self.peek() == "}" and block_namespace:
+                if self.tokens[self.position].comments and self.include_comments:
+                    raise _Unsupported("namespace 끝 주석")
+                self.next()
+                block_namespace = False
+            elif declaration is None:
+                declaration = self.convert_type()
+            else:
+                raise _Unsupported("타입 선언 여러 개")
+
+        if declaration is None or block_namespace:
+            raise _Unsupported("타입 선언 없음")
+        if self.include_comments and any(token.comments or token.trailing for token in self.tokens):
+            raise _Unsupported("위치를 옮길 수 없는 주석")
+
+        package = ""
+        if namespace:
+            package = namespace.lower() if self.use_java_conventions else namespace
+        # 프로젝트 안의 다른 namespace 를 참조하면 해당 package 전체를 import
+        for using in self.usings:
+            if using in self.project_namespaces and using != namespace:
+                self.imports.add((using.lower() if self.use_java_conventions else using) + ".*")
+
+        lines = list(header)
+        if package:
+            lines += [f"package {package};", ""]
+        imports = [f"import {module};" for module in sorted(self.imports)]
+        if imports:
+            lines += imports + [""]
+        lines += declaration
+        return {
+            "java_code": "\n".join(lines) + "\n",
+            "package_declaration": f"package {package};" if package else "",
+            "imports": imports,
+            "type_mappings": self.type_mappings,
+            "conversion_notes": "규칙 기반 로컬 변환 (AI 호출 없음): " + ", ".join(self.notes),
+        }
+
+    # 타입 선언 (class / interface / enum)
+    def convert_type(self):
+        first = self.tokens[self.position]
+        comments = self.comments_of(first, "")
+        modifiers = set()
+        while self.peek() in _TYPE_MODIFIERS:
+            modifiers.add(self.next().text)
+        kind = self.next().text
+        if kind not in ("class", "interface", "enum"):
+            raise _Unsupported(kind)
+        name = self.identifier()
+        if name in _JAVA_KEYWORDS:
+            raise _Unsupported(name)
+        self.known_types.add(name)
+
+        type_params = []
+        if kind != "enum" and self.accept("<"):
+            type_params.append(self.identifier())
+            while self.accept(","):
+                type_params.append(self.identifier())
+            self.expect(">")
+            self.known_types.update(type_params)
+            self.type_params.update(type_params)
+
+        bases = []
+        if self.accept(":"):
+            bases.append(self.parse_type_ref())
+            while self.accept(","):
+                bases.append(self.parse_type_ref())
+        open_brace = self.expect("{")
+        if open_brace.trailing and self.include_comments:
+            raise _Unsupported("선언 줄 주석")
+
+        declaration = "public " if "public" in modifiers else ""
+        if kind == "class":
+            if "abstract" in modifiers:
+                declaration += "abstract "
+            elif "sealed" in modifiers or "static" in modifiers:
+                declaration += "final "
+        declaration += f"{kind} {name}"
+        if type_params:
+            declaration += f"<{', '.join(type_params)}>"
+
+        if kind == "enum":
+            if bases and (len(bases) > 1 or bases[0]["name"] not in ("int", "Int32")):
+                raise _Unsupported("enum 기반 형식")
+            body = self.convert_enum_body(name)
+        else:
+            declaration += self.base_clause(kind, bases)
+            body = self.convert_interface_body() if kind == "interface" else self.convert_class_body(name, "static" in modifiers)
+
+        close_brace = self.expect("}")
+        self.accept(";")
+        lines = comments + [declaration + " {"] + body
+        lines += self.comments_of(close_brace, _INDENT)
+        lines.append("}" + self.trailing_of(close_brace))
+        return lines
+
+    def base_clause(self, kind, bases):
+        if not bases:
+            return ""
+        names = [self.java_type(base) for base in bases]
+        if kind == "interface":
+            return " extends " + ", ".join(names)
+        # 클래스는 첫 번째 기반 형식만 클래스일 수 있음 (.NET 명명 규칙: I + 대문자는 인터페이스)
+        first = bases[0]["name"]
+        if not (len(first) > 1 and first[0] == "I" and first[1].isupper()):
+            clause = f" extends {names[0]}"
+            names = names[1:]
+        else:
+            clause = ""
+        if names:
+            clause += " implements " + ", ".join(names)
+        return clause
+
+    # enum 본문 (값 목록, 명시적 정수 값은 생성자와 getValue() 로 변환)
+    def convert_enum_body(self, type_name):
+        members = []
+        while self.peek() != "}":
+            token = self.tokens[self.position]
+            comments = self.comments_of(token, _INDENT)
+            name = self.identifier()
+            value = None
+            if self.accept("="):
+                sign = "-" if self.accept("-") else ""
+                number = self.next()
+                if number.kind != "number" or not re.fullmatch(r"0[xX][0-9A-Fa-f]+|\d+", number.text):
+                    raise _Unsupported("enum 값")
+                value = sign + number.text
+            last = self.tokens[self.position - 1]
+            if not self.accept(","):
+                if self.peek() != "}":
+                    raise _Unsupported(self.peek())
+            else:
+                last = self.tokens[self.position - 1]
+            members.append({"name": self.member_name(name, "constant"), "value": value, "comments": comments, "trailing": self.trailing_of(last)})
+
+        if not members:
+            raise _Unsupported("빈 enum")
+        if any(member["value"] is not None for member in members):
+            next_value = 0
+            for member in members:
+                if member["value"] is None:
+                    member["value"] = str(next_value)
+                next_value = int(member["value"], 0) + 1
+            self.notes.append("enum 값을 생성자와 getValue() 로 변환")
+        else:
+            self.notes.append(f"enum 상수 {len(members)}개 변환")
+
+        lines = []
+        for position, member in enumerate(members):
+            separator = "," if position < len(members) - 1 else (";" if member["value"] is not None else "")
+            value = f"({member['value']})" if member["value"] is not None else ""
+            lines += member["comments"]
+            lines.append(f"{_INDENT}{member['name']}{value}{separator}{member['trailing']}")
+        if members[0]["value"] is not None:
+            lines += [
+                "",
+                f"{_INDENT}private final int value;",
+                "",
+                f"{_INDENT}{type_name}(int value) {{",
+                f"{_INDENT * 2}this.value = value;",
+                f"{_INDENT}}}",
+                "",
+                f"{_INDENT}public int getValue() {{",
+                f"{_INDENT * 2}return value;",
+                f"{_INDENT}}}",
+            ]
+        return lines
+
+    # 속성 접근자 ({ get; set; }, { get; private set; }, { get; init; })
+    def parse_accessors(self, allow_modifiers=True):
+        accessors = {}
+        while not self.accept("}"):
+            modifier = None
+            if self.peek() in _ACCESS_MODIFIERS:
+                if not allow_modifiers:
+                    raise _Unsupported("접근자 한정자")
+                modifier = self.next().text
+            accessor = self.identifier()
+            if accessor not in ("get", "set", "init") or accessor in accessors:
+                raise _Unsupported(accessor)
+            self.expect(";")
+            accessors["set" if accessor == "init" else accessor] = modifier
+        if "get" not in accessors:
+            raise _Unsupported("get 없는 속성")
+        return accessors
+
+    # 필드/속성 초기값 (리터럴, 빈 컬렉션 생성만 지원)
+    def convert_initializer(self, declared):
+        token = self.next()
+        if token.kind in ("string", "char"):
+            return _java_literal(token)
+        if token.text in ("true", "false", "null"):
+            return token.text
+        if token.text == "-" or token.kind == "number":
+            sign = ""
+            if token.text == "-":
+                sign = "-"
+                token = self.next()
+                if token.kind != "number":
+                    raise _Unsupported(token.text)
+            number = token.text
+            if declared["name"] in ("decimal", "Decimal"):
+                return f'new BigDecimal("{sign}{re.sub(r"[mM]$", "", number)}")'
+            digits = number[2:] if number.lower().startswith("0x") else number
+            if re.search(r"[uUmM]", digits):
+                raise _Unsupported(number)
+            return sign + number
+        if token.text in ("string", "String") and self.accept("."):
+            if self.identifier() != "Empty":
+                raise _Unsupported("string 멤버")
+            return '""'
+        if token.text == "new":
+            ref = declared if self.peek() == "(" else self.parse_type_ref()
+            self.expect("(")
+            self.expect(")")
+            if ref["arrays"] or ref["nullable"]:
+                raise _Unsupported("배열/nullable 생성")
+            if ref["name"] in _COLLECTION_TYPES and not ref["name"].startswith("I"):
+                self.java_type(ref)
+                implementation = _COLLECTION_TYPES[ref["name"]][1]
+                self.imports.add(f"java.util.{implementation}")
+                return f"new {implementation}<>()"
+            if ref["name"] in self.known_types and ref["name"] not in self.type_params:
+                self.java_type(ref)
+                return f"new {ref['name']}{'<>' if ref['args'] else ''}()"
+            raise _Unsupported(f"new {ref['name']}")
+        raise _Unsupported(f"초기값 {token.text}")
+
+    # 클래스 본문 (필드, 상수, 자동 속성)
+    def convert_class_body(self, type_name, static_class):
+        fields = []
+        accessors = []
+        property_count = 0
+        field_names = set()
+        method_signatures = set()
+
+        while self.peek() != "}":
+            first = self.tokens[self.position]
+            comments = self.comments_of(first, _INDENT)
+            modifiers = []
+            while self.peek() in _MEMBER_MODIFIERS:
+                modifiers.append(self.next().text)
+            access = [modifier for modifier in modifiers if modifier in _ACCESS_MODIFIERS]
+            if len(access) > 1:
+                raise _Unsupported(" ".join(access))
+            access = access[0] if access else "private"
+            java_access = "" if access == "internal" else access + " "
+            is_const = "const" in modifiers
+            is_static = "static" in modifiers or is_const
+            if static_class and not is_static:
+                raise _Unsupported("static 클래스의 인스턴스 멤버")
+
+            declared = self.parse_type_ref()
+            java_type = self.java_type(declared)
+            name = self.identifier()
+
+            if self.accept("{"):
+                # 자동 속성
+                property_accessors = self.parse_accessors()
+                initializer = self.convert_initializer(declared) if self.accept("=") else None
+                last = self.expect(";") if initializer is not None else self.tokens[self.position - 1]
+                property_count += 1
+                read_only = "set" not in property_accessors
+                field_name = self.member_name(name, "field")
+                static = "static " if is_static else ""
+                final = "final " if read_only and initializer is not None else ""
+                assignment = f" = {initializer}" if initializer is not None else ""
+
+                if self.generate_getters_setters:
+                    declaration = f"{_INDENT}private {static}{final}{java_type} {field_name}{assignment};"
+                    getter_prefix, accessor_name = _accessor_name(name, java_type, self.use_java_conventions)
+                    _claim_method(method_signatures, getter_prefix + accessor_name)
+                    get_access = property_accessors["get"] or access
+                    accessors.append([
+                        f"{_INDENT}{'' if get_access == 'internal' else get_access + ' '}{static}{java_type} {getter_prefix}{accessor_name}() {{",
+                        f"{_INDENT * 2}return {field_name};",
+                        f"{_INDENT}}}",
+                    ])
+                    if not read_only:
+                        _claim_method(method_signatures, "set" + accessor_name, [java_type])
+                        set_access = property_accessors["set"] or access
+                        target = f"{type_name}.{field_name}" if is_static else f"this.{field_name}"
+                        accessors.append([
+                            f"{_INDENT}{'' if set_access == 'internal' else set_access + ' '}{static}void set{accessor_name}({java_type} {field_name}) {{",
+                            f"{_INDENT * 2}{target} = {field_name};",
+                            f"{_INDENT}}}",
+                        ])
+                else:
+                    declaration = f"{_INDENT}{java_access}{static}{final}{java_type} {field_name}{assignment};"
+            else:
+                # 필드 / 상수
+                initializer = self.convert_initializer(declared) if self.accept("=") else None
+                last = self.expect(";")
+                if is_const and initializer is None:
+                    raise _Unsupported("초기값 없는 상수")
+                constant = is_static and ("readonly" in modifiers or is_const)
+                field_name = self.member_name(name, "constant" if constant else "field")
+                static = "static " if is_static else ""
+                # 생성자가 없으므로 초기값이 있는 readonly 필드만 final
+                final = "final " if ("readonly" in modifiers or is_const) and initializer is not None else ""
+                assignment = f" = {initializer}" if initializer is not None else ""
+                declaration = f"{_INDENT}{java_access}{static}{final}{java_type} {field_name}{assignment};"
+
+            if field_name in field_names:
+                raise _Unsupported(f"이름 충돌 {field_name}")
+            field_names.add(field_name)
+            fields += comments + [declaration + self.trailing_of(last)]
+
+        if property_count:
+            if self.generate_getters_setters:
+                self.notes.append(f"속성 {property_count}개를 private 필드와 getter/setter 로 변환")
+            else:
+                self.notes.append(f"속성 {property_count}개를 필드로 변환")
+        if len(fields) - property_count:
+            self.notes.append(f"필드/상수 {len(fields) - property_count}개 변환")
+
+        lines = list(fields)
+        if static_class:
+            lines += ([""] if lines else []) + [f"{_INDENT}private {type_name}() {{", f"{_INDENT}}}"]
+        for accessor in accessors:
+            lines += [""] + accessor
+        return lines
+
+    # 인터페이스 본문 (메서드 시그니처, 속성)
+    def convert_interface_body(self):
+        lines = []
+        method_count = 0
+        method_signatures = set()
+        while self.peek() != "}":
+            first = self.tokens[self.position]
+            comments = self.comments_of(first, _INDENT)
+            self.accept("public")
+            declared = None
+            if not self.accept("void"):
+                declared = self.parse_type_ref()
+            name = self.identifier()
+
+            if self.accept("{"):
+                if declared is None:
+                    raise _Unsupported("void 속성")
+                return_type = self.java_type(declared)
+                property_accessors = self.parse_accessors(allow_modifiers=False)
+                last = self.tokens[self.position - 1]
+                getter_prefix, accessor_name = _accessor_name(name, return_type, self.use_java_conventions)
+                _claim_method(method_signatures, getter_prefix + accessor_name)
+                members = [f"{_INDENT}{return_type} {getter_prefix}{accessor_name}();"]
+                if "set" in property_accessors:
+                    _claim_method(method_signatures, "set" + accessor_name, [return_type])
+                    parameter = self.member_name(name, "field")
+                    members.append(f"{_INDENT}void set{accessor_name}({return_type} {parameter});")
+                members[-1] += self.trailing_of(last)
+                lines += ([""] if lines else []) + comments + members
+                continue
+
+            type_params = []
+            if self.accept("<"):
+                type_params.append(self.identifier())
+                while self.accept(","):
+                    type_params.append(self.identifier())
+                self.expect(">")
+            added = set(type_params) - self.known_types
+            self.known_types.update(type_params)
+            return_type = self.java_type(declared) if declared is not None else "void"
+
+            self.expect("(")
+            parameters = []
+            parameter_types = []
+            while not self.accept(")"):
+                if parameters:
+                    self.expect(",")
+                parameter_type = self.java_type(self.parse_type_ref())
+                parameter_name = self.identifier()
+                if parameter_name in _JAVA_KEYWORDS or self.peek() not in (",", ")"):
+                    raise _Unsupported("매개변수")
+                parameters.append(f"{parameter_type} {parameter_name}")
+                parameter_types.append(parameter_type)
+            if self.peek() == "where":
+                raise _Unsupported("제네릭 제약")
+            last = self.expect(";")
+            self.known_types -= added
+            method_count += 1
+
+            generic = f"<{', '.join(type_params)}> " if type_params else ""
+            method_name = self.member_name(name, "method")
+            _claim_method(method_signatures, method_name, parameter_types)
+            signature = f"{_INDENT}{generic}{return_type} {method_name}({', '.join(parameters)});"
+            lines += ([""] if lines else []) + comments + [signature + self.trailing_of(last)]
+
+        self.notes.append(f"인터페이스 멤버 {method_count}개 변환" if method_count else "인터페이스 속성 변환")
+        return lines
+
+
+def convert_simple_csharp(csharp_code, include_comments=True, generate_getters_setters=True, use_java_conventions=True, project_context=None):
+    """단순 파일을 규칙 기반으로 변환한 결과 {"java_code", "package_declaration", "imports", "type_mappings",
+    "conversion_notes"} (지원하지 않는 구문이 있으면 None)
+
+    project_context 에 프로젝트 타입 목록(custom_types)이 있으면 해당 타입을 참조하는 파일도 변환합니다.
+    """
+    if _QUICK_REJECT_PATTERN.search(csharp_code):
+        return None
+    try:
+        tokens = _tokenize(csharp_code)
+        converter = _Converter(tokens, include_comments, generate_getters_setters, use_java_conventions, project_context)
+        return converter.convert_file()
+    except _Unsupported:
+        return None
@@ -0,0 +1,416 @@
+"""로컬 Azure OpenAI 대역(fake) 엔드포인트
+
+실제 토큰을 쓰지 않고 429/지연 상황을 재현하기 위한 개발용 서버입니다.
+
+    python fake_openai.py --port 8765 --rate-limit-ratio 0.3 --retry-after 2
+    AZURE_ENDPOINT=http://127.0.0.1:8765/ OPENAI_API_KEY=fake DEPLOYMENT_NAME=fake streamlit run app.py
+
+Batch API (/files, /batches) 도 흉내 내므로 배치 모드를 오프라인으로 시험할 수 있습니다.
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# 변환 요청에 돌려줄 기본 응답
+FAKE_CONVERSION = {
+    "java_code": "// fake endpoint 변환 결과\npublic class FakeConverted {\n}\n",
+    "package_declaration": "",
+    "imports": [],
+    "conversion_notes": "fake endpoint 응답입니다.",
+    "warnings": [],
+    "type_mappings": {},
+}
+
+# broken_java_ratio 확률로 돌려줄 구문 오류 코드 (메서드 닫는 괄호 누락)
+BROKEN_JAVA_CODE = (
+    "// fake endpoint 변환 결과\npublic class FakeConverted {\n"
+    "    public void run() {\n        System.out.println(\"fake\");\n\n"
+    "    public int size() {\n        return 0;\n    }\n}\n"
+)
+
+
+class FakeSettings:
+    def __init__(self, rate_limit_ratio=0.0, retry_after=1.0, latency=0.0, batch_delay=1.0, batch_error_ratio=0.0, pack_drop_ratio=0.0, malformed_ratio=0.0, response_chars=0, broken_java_ratio=0.0):
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.latency = latency
+        self.batch_delay = batch_delay
+        self.batch_error_ratio = batch_error_ratio
+        self.pack_drop_ratio = pack_drop_ratio
+        self.malformed_ratio = malformed_ratio
+        self.response_chars = response_chars
+        self.broken_java_ratio = broken_java_ratio
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "rate_limited": 0, "batches": 0, "batch_requests": 0}
+        self.seen_prefixes = set()
+        self.files = {}  # file_id -> bytes
+        self.batches = {}  # batch_id -> 배치 객체
+
+
+# Azure OpenAI 프롬프트 캐시 흉내 (1024 토큰 이상 동일한 접두부를 128 토큰 단위로 캐시)
+PROMPT_CACHE_MIN_TOKENS = 1024
+PROMPT_CACHE_BLOCK_TOKENS = 128
+
+
+def _cached_tokens(settings, messages):
+    # 토큰은 3자당 1개로 보고, 앞에서부터 128 토큰 블록마다 이전 요청과 같은 접두부인지 확인
+    text = "".join((message.get("role") or "") + (message.get("content") or "") for message in messages)
+    block_chars = PROMPT_CACHE_BLOCK_TOKENS * 3
+    digest = hashlib.sha1()
+    cached = 0
+    for start in range(0, len(text) - block_chars + 1, block_chars):
+        digest.update(text[start:start + block_chars].encode("utf-8"))
+        tokens = (start + block_chars) // 3
+        if tokens < PROMPT_CACHE_MIN_TOKENS:
+            continue
+        key = digest.copy().hexdigest()
+        with settings.lock:
+            if key in settings.seen_prefixes:
+                cached = tokens
+            settings.seen_prefixes.add(key)
+    return cached
+
+
+def _sized_conversion(settings):
+    """response_chars 를 주면 java_code 를 그 길이까지 채워 응답 크기를 조절 (broken_java_ratio 확률로 구문 오류 코드)"""
+    java_code = BROKEN_JAVA_CODE if random.random() < settings.broken_java_ratio else FAKE_CONVERSION["java_code"]
+    if len(java_code) >= settings.response_chars:
+        return dict(FAKE_CONVERSION, java_code=java_code)
+    line = "    // fake endpoint 응답 크기 조절용 줄\n"
+    padding = line * ((settings.response_chars - len(java_code)) // len(line) + 1)
+    java_code = java_code.replace("{\n", "{\n" + padding, 1)
+    return dict(FAKE_CONVERSION, java_code=java_code)
+
+
+def _repair_response(messages):
+    """구문 오류 수정 요청이면 받은 조각에 빠진 닫는 괄호를 붙여 응답"""
+    match = re.search(r"```java\n(.*)\n```", messages[-1].get("content") or "", re.DOTALL)
+    fragment = match.group(1) if match else ""
+    missing = fragment.count("{") - fragment.count("}")
+    indent = fragment[: len(fragment) - len(fragment.lstrip(" "))]
+    closers = [indent + "    " * depth + "}" for depth in reversed(range(max(0, missing)))]
+    return {"java_code": "\n".join([fragment.rstrip()] + closers)}
+
+
+def _conversion_response(settings, messages):
+    """묶음 변환 요청이면 입력 파일마다 항목을 만들어 files 배열로 응답 (pack_drop_ratio 확률로 누락)"""
+    system_prompt = (messages[0].get("content") or "") if messages else ""
+    if "Java 구문 오류 수정" in system_prompt:
+        return _repair_response(messages)
+    if '"files": [' not in system_prompt:
+        return _sized_conversion(settings)
+    filenames = re.findall(r"^파일명: (.+)$", messages[-1].get("content") or "", re.MULTILINE)
+    return {
+        "files": [
+            dict(_sized_conversion(settings), filename=filename)
+            for filename in filenames
+            if random.random() >= settings.pack_drop_ratio
+        ]
+    }
+
+
+def _malformed(content):
+    """모델이 흔히 내는 형식 오류 중 하나를 재현 (설명 문장, 닫히지 않은 펜스, 따옴표 미이스케이프, 잘림)"""
+    kind = random.choice(["prose", "open_fence", "unescaped_quote", "truncated"])
+    if kind == "prose":
+        return "변환 결과입니다.\n```json\n" + content + "\n```\n추가 설명: 검토가 필요합니다."
+    if kind == "open_fence":
+        return "```json\n" + content
+    if kind == "unescaped_quote":
+        return content.replace('"java_code": "', '"java_code": "String label = "fake"; ', 1)
+    return content[: max(1, len(content) * 2 // 3)]
+
+
+def _completion_body(settings, request):
+    messages = request.get("messages", [])
+    prompt_chars = sum(len(m.get("content") or "") for m in messages)
+    content = json.dumps(_conversion_response(settings, messages), ensure_ascii=False)
+    # JSON 모드가 아니면 실제 모델처럼 코드 펜스로 감쌈
+    if (request.get("response_format") or {}).get("type") != "json_object":
+        content = "```json\n" + content + "\n```"
+    if random.random() < settings.malformed_ratio:
+        content = _malformed(content)
+    completion_tokens = len(content) // 3
+    prompt_tokens = prompt_chars // 3
+    cached_tokens = min(prompt_tokens, _cached_tokens(settings, messages))
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.get("model", "fake"),
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": cached_tokens},
+        },
+    }
+
+
+def _upload_file(settings, content):
+    file_id = f"file-{uuid.uuid4().hex}"
+    with settings.lock:
+        settings.files[file_id] = content
+    return file_id
+
+
+def _process_batch(settings, batch_id):
+    # 지연 후 입력 파일의 각 요청을 처리하여 결과/오류 파일 작성
+    time.sleep(settings.batch_delay)
+    with settings.lock:
+        batch = settings.batches[batch_id]
+        batch["status"] = "in_progress"
+        lines = settings.files[batch["input_file_id"]].decode("utf-8").splitlines()
+
+    outputs = []
+    errors = []
+    for line in lines:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        if random.random() < settings.batch_error_ratio:
+            errors.append({
+                "id": f"batch_req_{uuid.uuid4().hex}",
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 500, "body": {"error": {"message": "fake batch error"}}},
+                "error": None,
+            })
+            continue
+        outputs.append({
+            "id": f"batch_req_{uuid.uuid4().hex}",
+            "custom_id": request["custom_id"],
+            "response": {"status_code": 200, "request_id": uuid.uuid4().hex, "body": _completion_body(settings, request["body"])},
+            "error": None,
+        })
+
+    def to_file(items):
+        if not items:
+            return None
+        return _upload_file(settings, "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in items).encode("utf-8"))
+
+    output_file_id = to_file(outputs)
+    error_file_id = to_file(errors)
+    with settings.lock:
+        settings.stats["batch_requests"] += len(outputs) + len(errors)
+        batch.update({
+            "status": "completed",
+            "output_file_id": output_file_id,
+            "error_file_id": error_file_id,
+            "completed_at": int(time.time()),
+            "request_counts": {"total": len(outputs) + len(errors), "completed": len(outputs), "failed": len(errors)},
+        })
+
+
+def _create_batch(settings, request):
+    batch_id = f"batch_{uuid.uuid4().hex}"
+    batch = {
+        "id": batch_id,
+        "object": "batch",
+        "endpoint": request.get("endpoint"),
+        "input_file_id": request.get("input_file_id"),
+        "completion_window": request.get("completion_window"),
+        "status": "validating",
+        "output_file_id": None,
+        "error_file_id": None,
+        "created_at": int(time.time()),
+        "request_counts": {"total": 0, "completed": 0, "failed": 0},
+    }
+    with settings.lock:
+        settings.batches[batch_id] = batch
+        settings.stats["batches"] += 1
+    threading.Thread(target=_process_batch, args=(settings, batch_id), daemon=True).start()
+    return dict(batch)
+
+
+def make_handler(settings):
+    class FakeOpenAIHandler(BaseHTTPRequestHandler):
+        # 실제 엔드포인트처럼 keep-alive 연결 유지 (연결 풀 재사용 확인용)
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status, body, headers=None):
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            path = urlsplit(self.path).path
+            if "/batches/" in path:
+                with settings.lock:
+                    batch = settings.batches.get(path.rsplit("/", 1)[-1])
+                    batch = dict(batch) if batch else None
+                if batch is None:
+                    self._send_json(404, {"error": {"code": "404", "message": "Batch not found"}})
+                else:
+                    self._send_json(200, batch)
+                return
+            if "/files/" in path and path.endswith("/content"):
+                with settings.lock:
+                    content = settings.files.get(path.split("/")[-2])
+                if content is None:
+                    self._send_json(404, {"error": {"code": "404", "message": "File not found"}})
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+                return
+            self._send_json(404, {"error": {"code": "404", "message": "Not found"}})
+
+        def _handle_file_upload(self, body):
+            # multipart/form-data 의 file 필드를 저장
+            message = BytesParser(policy=policy.default).parsebytes(
+                b"Content-Type: " + self.headers["Content-Type"].encode() + b"\r\n\r\n" + body
+            )
+            content = b""
+            for part in message.iter_parts():
+                if part.get_param("name", header="content-disposition") == "file":
+                    content = part.get_payload(decode=True)
+            file_id = _upload_file(settings, content)
+            self._send_json(200, {
+                "id": file_id,
+                "object": "file",
+                "bytes": len(content),
+                "created_at": int(time.time()),
+                "filename": "batch_requests.jsonl",
+                "purpose": "batch",
+                "status": "processed",
+            })
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length)
+            path = urlsplit(self.path).path
+
+            # Batch API (파일 업로드 / 배치 생성) 는 429 흉내 대상이 아님
+            if path.endswith("/files"):
+                self._handle_file_upload(body)
+                return
+            if path.endswith("/batches"):
+                self._send_json(200, _create_batch(settings, json.loads(body or b"{}")))
+                return
+
+            request = json.loads(body or b"{}")
+            with settings.lock:
+                settings.stats["requests"] += 1
+                throttled = random.random() < settings.rate_limit_ratio
+                if throttled:
+                    settings.stats["rate_limited"] += 1
+
+            if throttled:
+                self._send_json(
+                    429,
+                    {"error": {"code": "429", "message": "Rate limit is exceeded. (fake)"}},
+                    {"Retry-After": str(settings.retry_after)},
+                )
+                return
+
+            if "/chat/completions" not in self.path:
+                self._send_json(404, {"error": {"code": "404", "message": "Not found"}})
+                return
+
+            if settings.latency:
+                time.sleep(settings.latency)
+            body = _completion_body(settings, request)
+            if request.get("stream"):
+                self._send_stream(body)
+            else:
+                self._send_json(200, body)
+
+        def _send_stream(self, body):
+            # SSE 형식으로 응답 내용을 작은 조각으로 나누어 전송 (길이를 알 수 없으므로 전송 후 연결 종료)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            content = body["choices"][0]["message"]["content"]
+            for start in range(0, len(content), 16):
+                chunk = {
+                    "id": body["id"],
+                    "object": "chat.completion.chunk",
+                    "created": body["created"],
+                    "model": body["model"],
+                    "choices": [{"index": 0, "delta": {"content": content[start:start + 16]}, "finish_reason": None}],
+                }
+                self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+            done = {
+                "id": body["id"],
+                "object": "chat.completion.chunk",
+                "created": body["created"],
+                "model": body["model"],
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            }
+            self.wfile.write(f"data: {json.dumps(done)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+
+    return FakeOpenAIHandler
+
+
+def start_server(port=0, **settings_kwargs):
+    """백그라운드 스레드에서 서버 시작 후 (server, settings) 반환"""
+    settings = FakeSettings(**settings_kwargs)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(settings))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Azure OpenAI fake endpoint")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="429 로 응답할 요청 비율 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--latency", type=float, default=0.0, help="정상 응답 지연 (초)")
+    parser.add_argument("--batch-delay", type=float, default=1.0, help="배치 작업 완료까지 걸리는 시간 (초)")
+    parser.add_argument("--batch-error-ratio", type=float, default=0.0, help="배치 요청 중 실패로 처리할 비율 (0~1)")
+    parser.add_argument("--malformed-ratio", type=float, default=0.0, help="형식이 깨진 JSON 을 돌려줄 비율 (0~1)")
+    parser.add_argument("--pack-drop-ratio", type=float, default=0.0, help="묶음 변환 응답에서 파일을 누락할 비율 (0~1)")
+    parser.add_argument("--broken-java-ratio", type=float, default=0.0, help="구문 오류가 있는 Java 코드를 돌려줄 비율 (0~1)")
+    parser.add_argument("--response-chars", type=int, default=0, help="변환 결과 java_code 의 최소 길이 (응답 크기 조절)")
+    args = parser.parse_args()
+
+    server, _ = start_server(
+        args.port,
+        rate_limit_ratio=args.rate_limit_ratio,
+        retry_after=args.retry_after,
+        latency=args.latency,
+        batch_delay=args.batch_delay,
+        batch_error_ratio=args.batch_error_ratio,
+        pack_drop_ratio=args.pack_drop_ratio,
+        malformed_ratio=args.malformed_ratio,
+        response_chars=args.response_chars,
+        broken_java_ratio=args.broken_java_ratio,
+    )
+    print(f"fake Azure OpenAI endpoint: http://127.0.0.1:{server.server_address[1]}/")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
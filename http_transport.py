@@ -0,0 +1,126 @@
+"""Azure OpenAI 호출용 프로세스 공용 HTTP 전송 계층
+
+모든 세션/작업 스레드가 하나의 연결 풀을 공유하여 TLS 핸드셰이크와 연결 재생성을 줄입니다.
+연결 수/keep-alive/타임아웃을 명시적으로 설정하고, 새 연결 수·연결 재사용률·동시 요청 수 같은
+풀 사용 현황을 집계합니다.
+"""
+import importlib.util
+import logging
+import threading
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+# 풀 사용 현황 집계
+class PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.connections_opened = 0  # TCP 연결 수 (나머지 요청은 keep-alive 연결 재사용)
+        self.tls_handshakes = 0
+        self.connect_errors = 0
+        self.pool_timeouts = 0  # 풀에서 연결을 기다리다 시간 초과
+
+    def trace_event(self, event_name, info):
+        # httpcore trace 이벤트: "connection.connect_tcp.complete" 등
+        with self._lock:
+            if event_name == "connection.connect_tcp.complete":
+                self.connections_opened += 1
+            elif event_name == "connection.start_tls.complete":
+                self.tls_handshakes += 1
+            elif event_name in ("connection.connect_tcp.failed", "connection.start_tls.failed"):
+                self.connect_errors += 1
+
+    def begin(self):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def end(self, pool_timeout=False):
+        with self._lock:
+            self.in_flight -= 1
+            if pool_timeout:
+                self.pool_timeouts += 1
+
+    def snapshot(self):
+        with self._lock:
+            stats = {
+                "requests": self.requests,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "connections_opened": self.connections_opened,
+                "tls_handshakes": self.tls_handshakes,
+                "connect_errors": self.connect_errors,
+                "pool_timeouts": self.pool_timeouts,
+            }
+        reused = stats["requests"] - stats["connections_opened"]
+        stats["connection_reuse_rate"] = max(0, reused) / stats["requests"] * 100 if stats["requests"] else 0.0
+        return stats
+
+
+# 요청마다 httpcore trace 로 연결 생성/TLS 핸드셰이크를 집계하는 전송 계층
+class PooledTransport(httpx.HTTPTransport):
+    def __init__(self, stats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    def handle_request(self, request):
+        previous_trace = request.extensions.get("trace")
+
+        def trace(event_name, info):
+            self.stats.trace_event(event_name, info)
+            if previous_trace is not None:
+                previous_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        self.stats.begin()
+        pool_timeout = False
+        try:
+            return super().handle_request(request)
+        except httpx.PoolTimeout:
+            pool_timeout = True
+            raise
+        finally:
+            # 응답 헤더를 받을 때까지를 동시 요청으로 집계 (스트리밍 본문 수신 시간 제외)
+            self.stats.end(pool_timeout)
+
+    def pool_state(self):
+        """현재 풀의 연결 수 (전체 / 유휴)"""
+        connections = list(self._pool.connections)
+        return {
+            "open_connections": len(connections),
+            "idle_connections": sum(1 for connection in connections if connection.is_idle()),
+        }
+
+
+def http2_available():
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(max_connections=50, max_keepalive_connections=20, keepalive_expiry=120.0,
+                       connect_timeout=10.0, read_timeout=120.0, write_timeout=30.0, pool_timeout=30.0,
+                       http2=False):
+    """(httpx.Client, PooledTransport) 생성
+
+    read_timeout 은 응답(스트리밍 청크 간격 포함)을 기다리는 최대 시간이므로 긴 변환 응답을 고려해 넉넉히 둡니다.
+    http2 는 h2 패키지가 설치된 경우에만 사용합니다.
+    """
+    if http2 and not http2_available():
+        logger.warning("h2 패키지가 없어 HTTP/1.1 로 연결합니다 (pip install h2)")
+        http2 = False
+    transport = PooledTransport(
+        PoolStats(),
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+    timeout = httpx.Timeout(connect=connect_timeout, read=read_timeout, write=write_timeout, pool=pool_timeout)
+    return httpx.Client(transport=transport, timeout=timeout, follow_redirects=True), transport
@@ -0,0 +1,314 @@
+"""변환된 Java 코드의 로컬 구문 검사 (순수 Python, 컴파일러 불필요)
+
+AI 가 만든 Java 코드에서 자주 생기는 구조 오류(괄호 불균형, 닫히지 않은 문자열/주석, 잘린 메서드,
+메서드 밖으로 밀려난 문장, 타입 선언 밖의 코드)를 찾고, 오류가 있는 클래스 멤버(메서드/필드/중첩 클래스)의
+줄 범위를 찾아 그 부분만 다시 요청하여 고칠 수 있도록 합니다.
+"""
+import re
+
+# 주석/문자열 (내용을 공백으로 지워 괄호 검사에 방해되지 않도록 함, 줄 바꿈은 유지)
+_LEXER_PATTERN = re.compile(
+    r'''
+      (?P<comment>//[^\n]*|/\*.*?\*/)
+    | (?P<open_comment>/\*)
+    | (?P<text_block>"""(?:\\.|[^\\])*?""")
+    | (?P<open_text_block>""")
+    | (?P<string>"(?:\\.|[^"\\\n])*")
+    | (?P<open_string>")
+    | (?P<char>'(?:\\.|[^'\\\n])+')
+    | (?P<open_char>')
+    ''',
+    re.S | re.X,
+)
+_LEXER_ERRORS = {
+    "open_comment": "주석(/*)이 닫히지 않았습니다",
+    "open_text_block": '텍스트 블록(""")이 닫히지 않았습니다',
+    "open_string": "문자열이 닫히지 않았습니다",
+    "open_char": "문자 리터럴이 올바르지 않습니다",
+}
+_BRACKET_PATTERN = re.compile(r"[{}()\[\];]")
+_PAIRS = {"}": "{", ")": "(", "]": "["}
+
+_TYPE_DECLARATION_PATTERN = re.compile(r"\b(?:class|interface|enum|record)\s+\w+")
+_TOP_LEVEL_STATEMENT_PATTERN = re.compile(r"^\s*(?:package|import)\s")
+# 클래스 본문에 바로 올 수 없는 문장 (닫는 괄호가 하나 더 있어 메서드가 일찍 끝난 경우 등)
+_STATEMENT_PATTERN = re.compile(r"^\s*(?:return|if|else|for|while|do|switch|try|catch|finally|throw|break|continue)\b")
+# 새 멤버 선언으로 보이는 줄 (이전 멤버가 끝나지 않은 채 다음 멤버가 시작된 경우 판단용)
+_DECLARATION_PATTERN = re.compile(
+    r"^(?:@\w+|/\*\*|//|(?:public|protected|private|static|final|abstract|synchronized|default|native)\b)"
+)
+_ANNOTATION_LINE_PATTERN = re.compile(r"^@[\w.]+(?:\(.*\))?$")
+
+
+def _line_of(code, position):
+    return code.count("\n", 0, position) + 1
+
+
+def _clean(code):
+    """(주석/문자열을 공백으로 지운 코드, 어휘 오류 또는 None)"""
+    error = []
+
+    def blank(match):
+        kind = match.lastgroup
+        if kind in _LEXER_ERRORS and not error:
+            error.append({"line": _line_of(code, match.start()), "message": _LEXER_ERRORS[kind]})
+        text = match.group(0)
+        if kind in ("string", "text_block", "char"):
+            # 따옴표는 남겨 빈 문자열 리터럴 구조 유지
+            return text[0] + re.sub(r"[^\n]", " ", text[1:-1]) + text[-1]
+        return re.sub(r"[^\n]", " ", text)
+
+    cleaned = _LEXER_PATTERN.sub(blank, code)
+    return cleaned, (error[0] if error else None)
+
+
+def _scan_brackets(cleaned):
+    """(블록 트리, 괄호 오류 또는 None) — 블록은 {"open", "close", "start", "children"}"""
+    root = {"open": -1, "close": len(cleaned), "start": 0, "children": []}
+    blocks = [root]
+    stack = []  # (괄호, 위치)
+    boundary = [0]
+    for match in _BRACKET_PATTERN.finditer(cleaned):
+        ch = match.group(0)
+        position = match.start()
+        if ch == ";":
+            boundary[-1] = position + 1
+        elif ch in "{([":
+            stack.append((ch, position))
+            if ch == "{":
+                block = {"open": position, "close": None, "start": boundary[-1], "children": []}
+                blocks[-1]["children"].append(block)
+                blocks.append(block)
+                boundary.append(position + 1)
+        else:
+            if not stack:
+                return root, {"line": _line_of(cleaned, position), "message": f"'{ch}' 에 맞는 여는 괄호가 없습니다"}
+            opener, opened_at = stack.pop()
+            if opener != _PAIRS[ch]:
+                return root, {
+                    "line": _line_of(cleaned, position),
+                    "message": f"{_line_of(cleaned, opened_at)}번째 줄의 '{opener}' 가 닫히지 않은 채 '{ch}' 가 나왔습니다",
+                }
+            if ch == "}":
+                blocks.pop()["close"] = position
+                boundary.pop()
+                boundary[-1] = position + 1
+    if stack:
+        opener, opened_at = stack[-1]
+        return root, {
+            "line": _line_of(cleaned, opened_at),
+            "message": f"'{opener}' 가 파일 끝까지 닫히지 않았습니다 (코드가 잘렸을 수 있습니다)",
+        }
+    return root, None
+
+
+def _statements(cleaned, block):
+    """블록 본문 중 하위 블록을 제외한 ';' 단위 문장 [(시작 위치, 문장)]"""
+    statements = []
+    position = block["open"] + 1
+    segments = []
+    for child in block["children"]:
+        segments.append((position, cleaned[position:child["start"]]))
+        position = child["close"] + 1
+    segments.append((position, cleaned[position:block["close"]]))
+    for start, text in segments:
+        offset = 0
+        for statement in text.split(";")[:-1]:
+            if statement.strip():
+                statements.append((start + offset, statement))
+            offset += len(statement) + 1
+    return statements
+
+
+def check_java_syntax(java_code):
+    """구문 오류 목록 [{"line", "message"}] (없으면 빈 리스트)
+
+    컴파일러 수준의 검사는 아니며, 변환 결과가 깨졌을 때 흔히 나타나는 구조 오류만 찾습니다.
+    """
+    cleaned, error = _clean(java_code)
+    if error:
+        return [error]
+    root, error = _scan_brackets(cleaned)
+    if error:
+        return [error]
+
+    errors = []
+    # 최상위: package/import 문과 타입 선언만 허용
+    for position, statement in _statements(cleaned, root):
+        if not _TOP_LEVEL_STATEMENT_PATTERN.match(statement):
+            errors.append({"line": _line_of(cleaned, position + len(statement) - len(statement.lstrip())), "message": "타입 선언 밖에 코드가 있습니다"})
+    type_blocks = [block for block in root["children"] if _TYPE_DECLARATION_PATTERN.search(cleaned[block["start"]:block["open"]])]
+    if not type_blocks:
+        errors.append({"line": 1, "message": "클래스/인터페이스/enum 선언이 없습니다"})
+
+    # 타입 본문: 메서드 밖의 문장
+    for block in type_blocks:
+        for position, statement in _statements(cleaned, block):
+            if _STATEMENT_PATTERN.match(statement):
+                errors.append({"line": _line_of(cleaned, position + len(statement) - len(statement.lstrip())), "message": "메서드 밖에 문장이 있습니다"})
+        for child in block["children"]:
+            if _STATEMENT_PATTERN.match(cleaned[child["start"]:child["open"]]):
+                errors.append({"line": _line_of(cleaned, child["open"]), "message": "메서드 밖에 문장이 있습니다"})
+    return errors
+
+
+def _indent(line):
+    return len(line) - len(line.lstrip())
+
+
+# 멤버 단위 분할 (들여쓰기 기준이므로 괄호가 깨져 있어도 나눌 수 있음)
+class _Member:
+    def __init__(self, start):
+        self.start = start
+        self.end = start
+        self.depth = 0
+        self.has_code = False
+        self.prefix_only = True  # 지금까지 주석/어노테이션만 있음
+        self.last_char = ""
+        self.error = None
+
+    def add(self, line, cleaned_line):
+        self.end += 1
+        code = cleaned_line.strip()
+        if not code:
+            return
+        self.has_code = True
+        if not _ANNOTATION_LINE_PATTERN.match(code):
+            self.prefix_only = False
+        for ch in _BRACKET_PATTERN.findall(cleaned_line):
+            if ch in "{([":
+                self.depth += 1
+            elif ch in "})]":
+                self.depth -= 1
+                if self.depth < 0 and self.error is None:
+                    self.error = "닫는 괄호가 여는 괄호보다 많습니다"
+        self.last_char = code[-1]
+
+    @property
+    def complete(self):
+        return self.has_code and not self.prefix_only and self.depth == 0 and self.last_char in ";}"
+
+
+def _type_members(lines, cleaned_lines, body_start, body_end):
+    members = []
+    member_indent = None
+    current = None
+    for index in range(body_start, body_end):
+        line = lines[index]
+        stripped = line.strip()
+        if not stripped:
+            if current is not None:
+                current.add(line, cleaned_lines[index])
+            continue
+        if member_indent is None:
+            member_indent = _indent(line)
+        starts_member = _indent(line) == member_indent and not stripped.startswith(("}", ")", "]", ".", "+", "&", "|", "?", ":"))
+        if starts_member and current is not None and not current.complete and current.has_code and not current.prefix_only:
+            # 앞 멤버가 끝나지 않았는데 새 선언이 시작됨
+            if _DECLARATION_PATTERN.match(stripped):
+                current.error = current.error or "멤버가 닫히지 않은 채 다음 선언이 시작됩니다"
+            else:
+                starts_member = False
+        if starts_member and (current is None or current.complete or current.error):
+            # 클래스 본문에 바로 온 문장은 앞 메서드가 일찍 닫힌 것이므로 앞 멤버에 합침
+            if current is not None and _STATEMENT_PATTERN.match(cleaned_lines[index]):
+                current.error = current.error or "메서드 밖에 문장이 있습니다"
+            else:
+                current = _Member(index)
+                members.append(current)
+        elif current is None:
+            current = _Member(index)
+            members.append(current)
+        current.add(line, cleaned_lines[index])
+
+    for member in members:
+        # 끝의 빈 줄은 멤버에서 제외
+        while member.end > member.start and not lines[member.end - 1].strip():
+            member.end -= 1
+        if member.error is None and member.depth > 0:
+            member.error = "멤버가 끝나지 않았습니다 (코드가 잘렸을 수 있습니다)"
+    return members, member_indent
+
+
+def find_broken_members(java_code):
+    """구문 오류가 있는 멤버 목록 [{"start", "end", "code", "error", "type_header", "indent"}]
+
+    start/end 는 줄 번호(0부터, end 미포함)이며, 멤버 단위로 찾을 수 없는 오류(import 부분 등)만 있으면 빈 리스트입니다.
+    """
+    cleaned, _ = _clean(java_code)
+    lines = java_code.split("\n")
+    cleaned_lines = cleaned.split("\n")
+
+    broken = []
+    index = 0
+    while index < len(lines):
+        cleaned_line = cleaned_lines[index]
+        if _indent(lines[index]) != 0 or not _TYPE_DECLARATION_PATTERN.search(cleaned_line):
+            index += 1
+            continue
+        type_header = lines[index].strip()
+        body_start = index
+        while body_start < len(lines) and "{" not in cleaned_lines[body_start]:
+            body_start += 1
+        body_start += 1
+        body_end = body_start
+        while body_end < len(lines) and not (_indent(lines[body_end]) == 0 and lines[body_end].strip().startswith("}")):
+            body_end += 1
+
+        members, member_indent = _type_members(lines, cleaned_lines, body_start, body_end)
+        for member in members:
+            if member.error is None:
+                continue
+            broken.append({
+                "start": member.start,
+                "end": member.end,
+                "code": "\n".join(lines[member.start:member.end]),
+                "error": member.error,
+                "type_header": type_header.rstrip("{ "),
+                "indent": " " * (member_indent or 0),
+            })
+        index = body_end + 1
+    return broken
+
+
+def fragment_errors(fragment):
+    """멤버 조각 하나의 괄호/문자열 오류 (없으면 None)"""
+    cleaned, error = _clean(fragment)
+    if error:
+        return error["message"]
+    _, error = _scan_brackets(cleaned)
+    return error["message"] if error else None
+
+
+def replace_members(java_code, replacements):
+    """[(find_broken_members 항목, 수정된 조각)] 를 원래 위치에 넣은 코드 (첫 줄에 들여쓰기가 없으면 멤버 들여쓰기 적용)"""
+    lines = java_code.split("\n")
+    for member, fixed in sorted(replacements, key=lambda item: item[0]["start"], reverse=True):
+        fixed_lines = fixed.strip("\n").split("\n")
+        # 본문 줄만 들여쓴 조각도 첫 줄 기준으로 판단하여 전체를 멤버 위치로 옮김
+        if member["indent"] and not fixed_lines[0][:1].isspace():
+            fixed_lines = [member["indent"] + line if line.strip() else line for line in fixed_lines]
+        lines[member["start"]:member["end"]] = fixed_lines
+    return "\n".join(lines)
+
+
+def close_open_blocks(java_code):
+    """파일 끝까지 닫히지 않은 중괄호만 남은 경우(잘린 타입 선언) 닫는 괄호를 붙인 코드"""
+    cleaned, error = _clean(java_code)
+    if error:
+        return java_code
+    stack = []
+    for match in _BRACKET_PATTERN.finditer(cleaned):
+        ch = match.group(0)
+        if ch in "{([":
+            stack.append((ch, match.start()))
+        elif ch in "})]":
+            if not stack or stack.pop()[0] != _PAIRS[ch]:
+                return java_code
+    if not stack or any(ch != "{" for ch, _ in stack):
+        return java_code
+    closers = []
+    for _, position in reversed(stack):
+        line_start = cleaned.rfind("\n", 0, position) + 1
+        closers.append(" " * _indent(java_code[line_start:position + 1]) + "}")
+    return java_code.rstrip() + "\n" + "\n".join(closers) + "\n"
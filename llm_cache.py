@@ -0,0 +1,228 @@
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def make_cache_key(*parts):
+    """캐시 키 생성 (파트들을 직렬화한 뒤 SHA-256)"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def content_hash(text):
+    """소스 코드 내용 해시"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# 2단계 캐시: 프로세스 내 LRU + 모든 세션/프로세스가 공유하는 SQLite
+class LLMResultCache:
+    def __init__(
+        self,
+        db_path,
+        namespace="default",
+        memory_items=256,
+        max_disk_items=5000,
+        ttl_seconds=7 * 24 * 3600,
+    ):
+        self.db_path = db_path
+        self.namespace = namespace
+        self.memory_items = memory_items
+        self.max_disk_items = max_disk_items
+        self.ttl_seconds = ttl_seconds
+
+        self._memory = OrderedDict()  # key -> (저장 시각, 값)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = 0
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._connect().execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+
+    def _connect(self):
+        # sqlite3 연결은 스레드 간 공유하지 않음 (스레드별 연결)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _expired(self, created_at, now):
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, key):
+        now = time.time()
+
+        # 1단계: 메모리 LRU
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0], now):
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return copy.deepcopy(entry[1])
+                del self._memory[key]
+
+        # 2단계: 공유 디스크 캐시
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is not None and not self._expired(row[1], now):
+                conn.execute(
+                    "UPDATE llm_cache SET last_access = ? WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, key),
+                )
+                value = json.loads(row[0])
+                self._remember(key, row[1], value)
+                with self._lock:
+                    self.stats["disk_hits"] += 1
+                return copy.deepcopy(value)
+        except sqlite3.Error:
+            pass
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def set(self, key, value):
+        now = time.time()
+        self._remember(key, now, copy.deepcopy(value))
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (namespace, key, value, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value, ensure_ascii=False), now, now),
+            )
+            with self._lock:
+                self.stats["writes"] += 1
+                self._writes += 1
+                should_prune = self._writes % 50 == 0
+            if should_prune:
+                self.prune()
+        except sqlite3.Error:
+            pass
+
+    def delete(self, key):
+        with self._lock:
+            self._memory.pop(key, None)
+        try:
+            self._connect().execute(
+                "DELETE FROM llm_cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+        except sqlite3.Error:
+            pass
+
+    def _remember(self, key, created_at, value):
+        with self._lock:
+            self._memory[key] = (created_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def prune(self):
+        """TTL 만료 항목 삭제 후 최대 개수를 넘는 항목을 오래 사용하지 않은 순으로 삭제"""
+        conn = self._connect()
+        if self.ttl_seconds is not None:
+            conn.execute(
+                "DELETE FROM llm_cache WHERE namespace = ? AND created_at < ?",
+                (self.namespace, time.time() - self.ttl_seconds),
+            )
+        conn.execute(
+            """
+            DELETE FROM llm_cache WHERE namespace = ? AND key IN (
+                SELECT key FROM llm_cache WHERE namespace = ?
+                ORDER BY last_access DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.namespace, self.namespace, self.max_disk_items),
+        )
+
+    def hit_rate(self):
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        total = hits + self.stats["misses"]
+        return (hits / total) * 100 if total else 0
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch in "_@$"
+
+
+def normalize_csharp_source(code):
+    """주석/공백/줄바꿈/BOM 차이를 제거한 C# 소스 (분석 캐시 키용)
+
+    문자열/문자 리터럴 내부는 그대로 유지하고, 리터럴 밖의 주석은 제거하며
+    공백은 두 식별자 사이에 필요한 경우에만 한 칸으로 남깁니다.
+    """
+    code = code.lstrip("\ufeff").replace("\r\n", "\n").replace("\r", "\n")
+    out = []
+    pending_space = False
+    i = 0
+    n = len(code)
+
+    def emit(text):
+        nonlocal pending_space
+        if pending_space and out and _is_word_char(out[-1][-1]) and _is_word_char(text[0]):
+            out.append(" ")
+        pending_space = False
+        out.append(text)
+
+    while i < n:
+        ch = code[i]
+        if ch.isspace():
+            pending_space = True
+            i += 1
+        elif code.startswith("//", i):
+            end = code.find("\n", i)
+            i = n if end == -1 else end
+            pending_space = True
+        elif code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            pending_space = True
+        elif ch == '"' or ch == "'" or code.startswith(('@"', '$"', '$@"', '@$"'), i):
+            # 리터럴 시작 위치와 축자(verbatim) 여부 판단
+            start = i
+            while code[i] != '"' and code[i] != "'":
+                i += 1
+            verbatim = "@" in code[start:i]
+            quote = code[i]
+            i += 1
+            while i < n:
+                if verbatim and code.startswith('""', i):
+                    i += 2
+                elif not verbatim and code[i] == "\\":
+                    i += 2
+                elif code[i] == quote:
+                    i += 1
+                    break
+                else:
+                    i += 1
+            emit(code[start:i])
+        else:
+            emit(ch)
+            i += 1
+
+    return "".join(out)
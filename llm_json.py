@@ -0,0 +1,195 @@
+"""LLM 응답 텍스트에서 JSON 객체를 관대하게 추출
+
+모델 응답에는 앞뒤 설명 문장, 닫히지 않은 코드 펜스, java_code 안의 이스케이프되지 않은 따옴표,
+max_tokens 로 잘린 출력 등이 섞일 수 있습니다. 이런 경우에도 원문 전체를 버리지 않고
+균형 잡힌 JSON 객체를 찾아 흔한 오류를 보정한 뒤 파싱합니다.
+"""
+import json
+import re
+
+# 추출 결과 상태
+PARSE_OK = "ok"
+PARSE_REPAIRED = "repaired"  # 이스케이프/따옴표 등을 보정하여 파싱
+PARSE_TRUNCATED = "truncated"  # 잘린 응답의 열린 문자열/괄호를 닫아 파싱 (마지막 값은 불완전할 수 있음)
+PARSE_FAILED = "failed"
+
+_FENCE_PATTERN = re.compile(r"```[A-Za-z]*[ \t]*\n?(.*?)(?:```|$)", re.DOTALL)
+_VALID_ESCAPES = set('"\\/bfnrt')
+_HEX_DIGITS = set("0123456789abcdefABCDEF")
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+# 객체 시작 위치 후보를 너무 많이 시도하지 않도록 제한
+_MAX_START_CANDIDATES = 20
+
+
+def extract_json_object(text):
+    """(dict 또는 None, 상태) 반환"""
+    if not text:
+        return None, PARSE_FAILED
+
+    stripped = text.strip()
+    value = _loads(stripped)
+    if isinstance(value, dict):
+        return value, PARSE_OK
+
+    # 코드 펜스 안쪽을 먼저, 그다음 전체 텍스트에서 객체 탐색
+    candidates = [match.group(1) for match in _FENCE_PATTERN.finditer(stripped) if "{" in match.group(1)]
+    candidates.append(stripped)
+    for candidate in candidates:
+        value, status = _extract_from(candidate)
+        if value is not None:
+            return value, status
+    return None, PARSE_FAILED
+
+
+def _loads(text):
+    try:
+        # strict=False: 문자열 안의 개행/탭 등 제어 문자 허용
+        return json.loads(text, strict=False)
+    except ValueError:
+        return None
+
+
+def _extract_from(text):
+    """앞쪽 '{' 부터 차례로 시도 (잘린 바깥 객체 대신 안쪽 객체만 잡히지 않도록 위치마다 보정까지 시도)"""
+    starts = [index for index, ch in enumerate(text) if ch == "{"][:_MAX_START_CANDIDATES]
+    for start in starts:
+        end = _balanced_end(text, start)
+        if end is not None:
+            value = _loads(text[start:end])
+            if isinstance(value, dict):
+                return value, PARSE_OK
+        # 이스케이프/따옴표/잘림 보정
+        repaired, truncated = _repair(text, start)
+        value = _loads(repaired)
+        if isinstance(value, dict) and value:
+            return value, PARSE_TRUNCATED if truncated else PARSE_REPAIRED
+    return None, PARSE_FAILED
+
+
+def _balanced_end(text, start):
+    """text[start] 의 '{' 와 짝이 맞는 '}' 다음 위치 (문자열 내부 괄호는 무시)"""
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        ch = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return None
+
+
+# 잘린 응답의 마지막 키(닫히지 않았거나 ':' 가 없는 키)도 다음 키로 인정
+_NEXT_KEY_PATTERN = re.compile(r'\s*,\s*"[^"\\\n]{0,64}(?:"\s*(?::|$)|$)')
+_NEXT_ITEM_PATTERN = re.compile(r'\s*,\s*["{\[\-0-9tfn]')
+
+
+def _closes_string(text, index, container, is_key):
+    """text[index] 의 따옴표가 문자열을 닫는 따옴표인지 (뒤에 오는 JSON 구문으로 판단)
+
+    객체의 값이면 '}' 또는 ', "다음키":' 가, 배열 항목이면 ']' 또는 ', 다음 항목' 이 와야 닫는 따옴표로 봅니다.
+    """
+    rest = text[index + 1:].lstrip()
+    if not rest:
+        return True
+    if is_key:
+        return rest[0] == ":"
+    if container == "{":
+        return rest[0] == "}" or _NEXT_KEY_PATTERN.match(text, index + 1) is not None
+    if container == "[":
+        return rest[0] == "]" or _NEXT_ITEM_PATTERN.match(text, index + 1) is not None
+    return True
+
+
+def _repair(text, start):
+    """(보정된 JSON 텍스트, 잘림 여부)
+
+    - 유효하지 않은 이스케이프(\\d, \\s 등)는 역슬래시를 이스케이프
+    - 뒤에 구분자가 오지 않는 따옴표는 문자열 안의 따옴표로 보고 이스케이프
+    - 끝까지 닫히지 않으면 열린 문자열/괄호를 닫고, 값이 없는 키는 null 로 채움
+    """
+    out = []
+    stack = []  # [괄호, 키를 기다리는 중인지]
+    in_string = False
+    string_is_key = False
+    pending_key = False  # 키 문자열이 닫힌 뒤 ':' 를 기다리는 중
+    index = start
+    length = len(text)
+
+    while index < length:
+        ch = text[index]
+        if in_string:
+            if ch == "\\":
+                following = text[index + 1:index + 2]
+                if following in _VALID_ESCAPES and following:
+                    out.append(ch + following)
+                    index += 2
+                    continue
+                if following == "u" and len(text) >= index + 6 and all(c in _HEX_DIGITS for c in text[index + 2:index + 6]):
+                    out.append(text[index:index + 6])
+                    index += 6
+                    continue
+                out.append("\\\\")
+            elif ch == '"':
+                container = stack[-1][0] if stack else None
+                if _closes_string(text, index, container, string_is_key):
+                    in_string = False
+                    pending_key = string_is_key
+                    out.append(ch)
+                else:
+                    out.append('\\"')
+            else:
+                out.append(_CONTROL_ESCAPES.get(ch, ch))
+            index += 1
+            continue
+
+        if ch == '"':
+            in_string = True
+            string_is_key = bool(stack) and stack[-1][0] == "{" and stack[-1][1]
+        elif ch in "{[":
+            stack.append([ch, ch == "{"])
+        elif ch in "}]":
+            if not stack:
+                break
+            stack.pop()
+            out.append(ch)
+            if not stack:
+                return "".join(out), False
+            index += 1
+            continue
+        elif ch == ":" and stack:
+            stack[-1][1] = False
+            pending_key = False
+        elif ch == "," and stack and stack[-1][0] == "{":
+            stack[-1][1] = True
+        out.append(ch)
+        index += 1
+
+    # 잘린 응답: 열린 문자열과 괄호를 닫음
+    if in_string:
+        out.append('"')
+        pending_key = string_is_key
+    repaired = "".join(out).rstrip()
+    if pending_key:
+        # {"a": 1, "b"  처럼 키만 있고 값이 없는 경우
+        repaired += ": null"
+    while repaired.endswith(","):
+        repaired = repaired[:-1].rstrip()
+    if repaired.endswith(":"):
+        repaired += " null"
+    for bracket, _ in reversed(stack):
+        repaired += "}" if bracket == "{" else "]"
+    return repaired, True
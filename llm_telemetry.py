@@ -0,0 +1,115 @@
+"""AI 호출별 토큰/지연 시간 기록 및 집계
+
+call_ai 가 호출마다 한 건씩 기록하며, 세션/작업 단위로 모아 처리량과 지연 시간 분포를 계산합니다.
+기록은 CSV/JSONL 로 내보내 용량 계획에 사용할 수 있습니다.
+"""
+import csv
+import io
+import json
+import threading
+import time
+from collections import deque
+
+# 기록 필드 (CSV 컬럼 순서)
+TELEMETRY_FIELDS = [
+    "timestamp",
+    "operation",
+    "filename",
+    "session_id",
+    "job_id",
+    "deployment",
+    "stream",
+    "outcome",
+    "finish_reason",
+    "prompt_tokens",
+    "completion_tokens",
+    "cached_tokens",
+    "usage_estimated",  # 스트리밍 호출은 usage 가 없어 문자 수로 추정
+    "latency",
+    "time_to_first_token",
+    "error",
+]
+
+
+def _percentile(values, percent):
+    if not values:
+        return None
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(percent / 100 * (len(values) - 1))))
+    return values[index]
+
+
+# 프로세스 공용 호출 기록 (최근 max_records 건만 메모리에 유지, path 를 주면 JSONL 로도 추가 기록)
+class LLMTelemetry:
+    def __init__(self, max_records=10000, path=None):
+        self.path = path
+        self._records = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def record(self, **fields):
+        entry = {field: fields.get(field) for field in TELEMETRY_FIELDS}
+        entry["timestamp"] = entry["timestamp"] or time.time()
+        with self._lock:
+            self._records.append(entry)
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def records(self, session_id=None, job_ids=None):
+        """조건에 맞는 기록 (session_id 또는 job_ids 중 하나라도 맞으면 포함, 둘 다 없으면 전체)"""
+        with self._lock:
+            records = list(self._records)
+        if session_id is None and job_ids is None:
+            return records
+        job_ids = set(job_ids or [])
+        return [
+            record for record in records
+            if (session_id is not None and record["session_id"] == session_id) or record["job_id"] in job_ids
+        ]
+
+    @staticmethod
+    def summarize(records, slowest=5):
+        """토큰 합계, 처리량(tokens/sec), 지연 시간 p50/p95, 가장 오래 걸린 파일"""
+        prompt_tokens = sum(record["prompt_tokens"] or 0 for record in records)
+        completion_tokens = sum(record["completion_tokens"] or 0 for record in records)
+        latencies = [record["latency"] for record in records if record["latency"] is not None]
+        first_token = [record["time_to_first_token"] for record in records if record["time_to_first_token"] is not None]
+
+        # 처리량: 첫 호출 시작부터 마지막 호출 종료까지의 실제 경과 시간 기준
+        tokens_per_second = None
+        if latencies:
+            started = min(record["timestamp"] - (record["latency"] or 0) for record in records)
+            finished = max(record["timestamp"] for record in records)
+            if finished > started:
+                tokens_per_second = (prompt_tokens + completion_tokens) / (finished - started)
+
+        by_file = {}
+        for record in records:
+            if record["filename"] and record["latency"] is not None:
+                by_file[record["filename"]] = by_file.get(record["filename"], 0.0) + record["latency"]
+
+        return {
+            "calls": len(records),
+            "failed_calls": sum(1 for record in records if record["outcome"] != "ok"),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cached_tokens": sum(record["cached_tokens"] or 0 for record in records),
+            "tokens_per_second": tokens_per_second,
+            "latency_p50": _percentile(latencies, 50),
+            "latency_p95": _percentile(latencies, 95),
+            "time_to_first_token_p50": _percentile(first_token, 50),
+            "truncated_calls": sum(1 for record in records if record["finish_reason"] == "length"),
+            "slowest_files": sorted(by_file.items(), key=lambda item: item[1], reverse=True)[:slowest],
+        }
+
+    @staticmethod
+    def to_csv(records):
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=TELEMETRY_FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+        return output.getvalue()
+
+    @staticmethod
+    def to_jsonl(records):
+        return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
@@ -0,0 +1,193 @@
+import copy
+import os
+import shutil
+import struct
+import tempfile
+import time
+import uuid
+import weakref
+import zipfile
+
+# 업로드 ZIP 임시 저장 위치와 보존 시간
+UPLOAD_DIR = os.path.join(tempfile.gettempdir(), "csharp2java_uploads")
+UPLOAD_TTL_SECONDS = 6 * 3600
+
+# 복사할 때 걸러낼 ZIP 플래그/확장 필드
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+_EXTRA_ZIP64 = 0x0001
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+TEXT_EXTENSIONS = (".cs", ".txt", ".md", ".json", ".xml", ".config", ".yml", ".yaml")
+
+# 이 프로세스의 세션/작업이 아직 참조 중인 업로드 (정리 대상에서 제외)
+_live_archives = weakref.WeakSet()
+
+
+def _prune_old_uploads(keep_paths=()):
+    # 세션이 끝나 정리되지 못한 오래된 업로드 파일 삭제
+    # (사용 중인 ZIP 은 열 때마다 수정 시각을 갱신하므로 다른 프로세스가 쓰는 ZIP 도 보존됨,
+    #  keep_paths 는 저장된 작업이 참조하는 ZIP 으로 작업과 함께 삭제됨)
+    if not os.path.isdir(UPLOAD_DIR):
+        return
+    live_paths = {archive.path for archive in list(_live_archives)} | set(keep_paths)
+    cutoff = time.time() - UPLOAD_TTL_SECONDS
+    for name in os.listdir(UPLOAD_DIR):
+        path = os.path.join(UPLOAD_DIR, name)
+        if path in live_paths:
+            continue
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+# 디스크에 한 번 저장한 업로드 ZIP 과 항목 인덱스 (내용은 필요할 때만 읽음)
+class ProjectArchive:
+    def __init__(self, name, path, entries, owned=True):
+        self.name = name
+        self.path = path
+        self.entries = entries  # [{"path", "size", "compress_size", "crc", "header_offset", "is_text"}]
+        self.owned = owned  # 직접 업로드한 ZIP 인지 (작업에서 복원한 ZIP 은 cleanup 에서 삭제하지 않음)
+        _live_archives.add(self)
+
+    @classmethod
+    def from_upload(cls, uploaded_file, keep_paths=()):
+        """업로드 파일을 임시 파일로 복사하고 항목 인덱스만 생성 (keep_paths 는 오래되어도 지우지 않을 ZIP)"""
+        os.makedirs(UPLOAD_DIR, exist_ok=True)
+        _prune_old_uploads(keep_paths)
+
+        path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4().hex}.zip")
+        uploaded_file.seek(0)
+        with open(path, "wb") as f:
+            shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
+
+        entries = []
+        try:
+            with zipfile.ZipFile(path, "r") as zip_ref:
+                for info in zip_ref.infolist():
+                    if info.is_dir():
+                        continue
+                    entries.append({
+                        "path": info.filename,
+                        "size": info.file_size,
+                        "compress_size": info.compress_size,
+                        "crc": info.CRC,
+                        "header_offset": info.header_offset,
+                        "is_text": info.filename.endswith(TEXT_EXTENSIONS),
+                    })
+        except Exception:
+            os.remove(path)
+            raise
+        return cls(uploaded_file.name, path, entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def open(self):
+        """ZIP 열기 (보존 시간이 지나 삭제된 업로드면 FileNotFoundError)"""
+        zip_ref = zipfile.ZipFile(self.path, "r")
+        try:
+            os.utime(self.path)
+        except OSError:
+            pass
+        return zip_ref
+
+    def read(self, entry_path):
+        with self.open() as zip_ref:
+            return zip_ref.read(entry_path)
+
+    def iter_contents(self, predicate=None):
+        """(항목, 내용) 을 하나씩 읽어 반환 (ZIP 은 한 번만 엶)"""
+        with self.open() as zip_ref:
+            for entry in self.entries:
+                if predicate is None or predicate(entry):
+                    yield entry, zip_ref.read(entry["path"])
+
+    def cleanup(self):
+        _live_archives.discard(self)
+        if not self.owned:
+            return
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def _strip_zip64_extra(extra):
+    # ZIP64 확장 필드는 FileHeader 가 크기에 맞춰 다시 작성하므로 제거
+    result = b""
+    i = 0
+    while i + 4 <= len(extra):
+        header_id, size = struct.unpack("<HH", extra[i:i + 4])
+        if header_id != _EXTRA_ZIP64:
+            result += extra[i:i + 4 + size]
+        i += 4 + size
+    return result
+
+
+def copy_raw_entry(src_zip, src_info, dst_zip):
+    """압축을 풀지 않고 원본 항목의 압축 스트림을 그대로 대상 ZIP 에 복사
+
+    zipfile 에는 raw 복사 API 가 없어 로컬 헤더를 직접 작성합니다.
+    암호화된 항목은 복사하지 않고 False 를 반환합니다.
+    """
+    if src_info.flag_bits & _FLAG_ENCRYPTED:
+        return False
+
+    zinfo = copy.copy(src_info)
+    # CRC/크기를 로컬 헤더에 직접 기록하므로 data descriptor 플래그 제거
+    zinfo.flag_bits &= ~_FLAG_DATA_DESCRIPTOR
+    zinfo.extra = _strip_zip64_extra(src_info.extra)
+
+    # 원본 로컬 헤더 뒤의 압축 데이터 시작 위치 계산
+    src_fp = src_zip.fp
+    src_fp.seek(src_info.header_offset)
+    local_header = src_fp.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+    src_fp.seek(src_info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+
+    with dst_zip._lock:
+        dst_fp = dst_zip.fp
+        dst_fp.seek(dst_zip.start_dir)
+        zinfo.header_offset = dst_fp.tell()
+        dst_fp.write(zinfo.FileHeader())
+        remaining = src_info.compress_size
+        while remaining > 0:
+            data = src_fp.read(min(_COPY_BUFFER_SIZE, remaining))
+            if not data:
+                break
+            dst_fp.write(data)
+            remaining -= len(data)
+        dst_zip.start_dir = dst_fp.tell()
+        dst_zip.filelist.append(zinfo)
+        dst_zip.NameToInfo[zinfo.filename] = zinfo
+        dst_zip._didModify = True
+    return True
+
+
+def write_project_zip(output_fp, archives, java_files):
+    """원본 프로젝트 구조를 유지하며 CS 파일만 변환된 Java 파일로 바꾼 ZIP 작성
+
+    archives: ProjectArchive 목록, java_files: 원본 경로 -> (java 경로, java 코드)
+    변환 대상이 아닌 항목은 압축 스트림을 그대로 복사합니다.
+    """
+    with zipfile.ZipFile(output_fp, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for archive in archives:
+            with archive.open() as src_zip:
+                for info in src_zip.infolist():
+                    if info.is_dir():
+                        continue
+                    if info.filename in java_files:
+                        java_path, java_code = java_files[info.filename]
+                        zip_file.writestr(java_path, java_code.encode("utf-8"))
+                    elif not copy_raw_entry(src_zip, info, zip_file):
+                        zip_file.writestr(info, src_zip.read(info))
+
+
+def write_java_only_zip(output_fp, conversion_results):
+    """변환된 Java 파일만 포함한 ZIP 작성"""
+    with zipfile.ZipFile(output_fp, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for result in conversion_results:
+            zip_file.writestr(result["java_filename"], result["java_code"])
@@ -0,0 +1,155 @@
+import math
+import random
+import threading
+import time
+
+
+# 재시도 대상 오류 (429, 타임아웃, 연결 오류, 5xx)
+def _retryable_errors():
+    # openai 는 불러오는 데 오래 걸리므로 모듈 로드 시점이 아닌 예외 처리 시점에 import
+    from openai import APIConnectionError, APITimeoutError, InternalServerError
+
+    return (_rate_limit_error(), APITimeoutError, APIConnectionError, InternalServerError)
+
+
+def _rate_limit_error():
+    from openai import RateLimitError
+
+    return RateLimitError
+
+
+# 동시성을 줄여야 하는 오류 (429, 타임아웃)
+def _throttle_errors():
+    from openai import APITimeoutError
+
+    return (_rate_limit_error(), APITimeoutError)
+
+
+def estimate_request_tokens(messages, max_tokens):
+    """요청 토큰 사용량 추정
+
+    Azure OpenAI 는 TPM 한도 계산 시 프롬프트 토큰 추정치에 max_tokens 를 더해 사용하므로
+    동일하게 계산합니다. 한글/코드가 섞인 텍스트는 대략 3자당 1토큰으로 봅니다.
+    """
+    chars = sum(len(message.get("content") or "") for message in messages)
+    return math.ceil(chars / 3) + len(messages) * 4 + max_tokens
+
+
+# 토큰 버킷 (용량만큼 버스트 허용, 초당 refill_rate 만큼 채워짐)
+class TokenBucket:
+    def __init__(self, capacity, refill_per_second):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    def reserve(self, amount):
+        """amount 만큼 예약하고 사용 가능해질 때까지 기다려야 하는 시간(초)을 반환"""
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_second
+
+    def refund(self, amount):
+        """추정치보다 적게 사용한 만큼 돌려받음 (음수면 추가 차감)"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    def pause(self, seconds):
+        """Retry-After 동안 모든 요청이 대기하도록 버킷을 비움"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.refill_per_second)
+
+
+def _retry_after_seconds(error):
+    """429 응답의 retry-after-ms / retry-after 헤더 값(초). 없으면 None"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        return None
+    return None
+
+
+# 배포(deployment)의 RPM/TPM 한도를 지키는 요청 스케줄러
+class RequestScheduler:
+    def __init__(self, rpm_limit, tpm_limit, max_retries=6, base_delay=1.0, max_delay=60.0):
+        self.requests = TokenBucket(rpm_limit, rpm_limit / 60.0)
+        self.tokens = TokenBucket(tpm_limit, tpm_limit / 60.0)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0, "wait_seconds": 0.0}
+
+    def _wait_for_budget(self, estimated_tokens):
+        delay = max(self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+        if delay > 0:
+            with self._lock:
+                self.stats["wait_seconds"] += delay
+            time.sleep(delay)
+
+    def _backoff(self, attempt):
+        # 지수 백오프 (full jitter)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def execute(self, request_fn, estimated_tokens, on_throttle=None):
+        """예산이 확보되면 request_fn() 을 호출하고, 재시도 가능한 오류는 백오프 후 다시 시도
+
+        on_throttle(started_at) 은 429/타임아웃이 날 때마다 재시도 전에 호출됩니다
+        (started_at 은 그 요청의 time.monotonic() 시작 시각, 병렬 변환의 동시성 제어기에 전달).
+        """
+        attempt = 0
+        while True:
+            self._wait_for_budget(estimated_tokens)
+            with self._lock:
+                self.stats["requests"] += 1
+            started_at = time.monotonic()
+            try:
+                response = request_fn()
+            except _retryable_errors() as e:
+                if on_throttle is not None and isinstance(e, _throttle_errors()):
+                    on_throttle(started_at)
+                retry_after = None
+                if isinstance(e, _rate_limit_error()):
+                    retry_after = _retry_after_seconds(e)
+                    with self._lock:
+                        self.stats["throttled"] += 1
+                if attempt >= self.max_retries:
+                    raise
+                if retry_after is not None:
+                    # 다른 요청들도 Retry-After 동안 대기하도록 버킷을 멈추고 지터만 추가
+                    self.requests.pause(retry_after)
+                    self.tokens.pause(retry_after)
+                    delay = random.uniform(0, self.base_delay)
+                else:
+                    delay = self._backoff(attempt)
+                with self._lock:
+                    self.stats["retries"] += 1
+                    self.stats["wait_seconds"] += delay
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            # 실제 사용량으로 TPM 버킷 보정
+            usage = getattr(response, "usage", None)
+            if usage is not None and getattr(usage, "total_tokens", None):
+                self.tokens.refund(estimated_tokens - usage.total_tokens)
+            return response
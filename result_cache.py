@@ -0,0 +1,118 @@
+"""세션별 변환 결과 메모리 캐시
+
+변환 결과 본문(원본 코드, Java 코드, import, 경고 등)은 작업 저장소(SQLite)에 압축하여 두고,
+화면에 표시 중인 결과만 이 캐시에 올립니다. 전체 크기 한도와 세션별 한도를 넘으면 오래 사용하지 않은
+결과부터 내보내고, 일정 시간 사용이 없는 세션의 결과는 통째로 비워 사용자 수와 무관하게 메모리를 일정하게 유지합니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+_MB = 1024 * 1024
+
+
+def estimate_result_size(result):
+    """결과 dict 의 대략적인 메모리 크기 (문자열 길이 합, bytes)"""
+    size = 0
+    for value in result.values():
+        if isinstance(value, str):
+            size += len(value)
+        elif isinstance(value, (list, tuple)):
+            size += sum(len(str(item)) for item in value)
+        elif isinstance(value, dict):
+            size += sum(len(str(key)) + len(str(item)) for key, item in value.items())
+    return size + 200  # dict 자체 오버헤드
+
+
+# (세션, 키) 단위 LRU (전체/세션별 크기 한도, 유휴 세션 정리)
+class SessionResultCache:
+    def __init__(self, max_bytes=64 * _MB, session_quota_bytes=8 * _MB, idle_seconds=1800):
+        self.max_bytes = max_bytes
+        self.session_quota_bytes = session_quota_bytes
+        self.idle_seconds = idle_seconds
+
+        self._entries = OrderedDict()  # (session_id, key) -> (크기, 값)
+        self._session_bytes = {}
+        self._last_access = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "idle_evictions": 0}
+
+    def get(self, session_id, key, loader):
+        """캐시에 없으면 loader() 로 불러와 저장 (loader 가 None 을 반환하면 저장하지 않음)"""
+        now = time.time()
+        entry_key = (session_id, key)
+        with self._lock:
+            self._last_access[session_id] = now
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                self._entries.move_to_end(entry_key)
+                self.stats["hits"] += 1
+                return entry[1]
+            self.stats["misses"] += 1
+
+        value = loader()
+        if value is None:
+            return None
+        size = estimate_result_size(value)
+
+        with self._lock:
+            if entry_key not in self._entries:
+                self._entries[entry_key] = (size, value)
+                self._total_bytes += size
+                self._session_bytes[session_id] = self._session_bytes.get(session_id, 0) + size
+            self._evict_idle(now)
+            self._evict_over_quota(session_id, keep=entry_key)
+        return value
+
+    def _remove(self, entry_key):
+        size, _ = self._entries.pop(entry_key)
+        session_id = entry_key[0]
+        self._total_bytes -= size
+        self._session_bytes[session_id] -= size
+        if not self._session_bytes[session_id]:
+            del self._session_bytes[session_id]
+
+    def _evict_over_quota(self, session_id, keep):
+        # 세션 한도 초과: 같은 세션에서 오래 사용하지 않은 결과부터
+        if self._session_bytes.get(session_id, 0) > self.session_quota_bytes:
+            for entry_key in [k for k in self._entries if k[0] == session_id and k != keep]:
+                if self._session_bytes.get(session_id, 0) <= self.session_quota_bytes:
+                    break
+                self._remove(entry_key)
+                self.stats["evictions"] += 1
+        # 전체 한도 초과: 모든 세션에서 오래 사용하지 않은 결과부터
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            entry_key = next(iter(self._entries))
+            if entry_key == keep:
+                self._entries.move_to_end(entry_key)
+                continue
+            self._remove(entry_key)
+            self.stats["evictions"] += 1
+
+    def _evict_idle(self, now):
+        idle = [session_id for session_id, last in self._last_access.items() if now - last > self.idle_seconds]
+        for session_id in idle:
+            self._drop(session_id)
+            self.stats["idle_evictions"] += 1
+
+    def _drop(self, session_id):
+        for entry_key in [k for k in self._entries if k[0] == session_id]:
+            self._remove(entry_key)
+        self._last_access.pop(session_id, None)
+
+    def drop_session(self, session_id):
+        """세션의 결과를 모두 비움 (다른 작업 결과를 불러올 때 등)"""
+        with self._lock:
+            self._drop(session_id)
+
+    def usage(self, session_id=None):
+        """사용 중인 크기 (bytes, session_id 를 주면 해당 세션만)와 세션 수"""
+        with self._lock:
+            return {
+                "total_bytes": self._total_bytes,
+                "session_bytes": self._session_bytes.get(session_id, 0) if session_id is not None else None,
+                "entries": len(self._entries),
+                "sessions": len(self._session_bytes),
+                **self.stats,
+            }
@@ -0,0 +1,116 @@
+from csharp_index import build_symbol_index, index_csharp_file, project_context_from_index, select_file_context
+
+REPOSITORY = """using System;
+using System.Collections.Generic;
+using Alias = MyApp.Core.Thing;
+
+namespace MyApp.Data
+{
+    // 주석 안의 { 중괄호
+    public class Repository<T> : BaseRepository<Dictionary<string, List<T>>>, IRepository<T>, IDisposable where T : class
+    {
+        private const string Brace = "}{";
+        private readonly List<T> _items = new();
+        public int Count { get { return _items.Count; } }
+        public string Name => "repo";
+        public Repository(ILogger logger) : base(logger) { }
+        public Dictionary<string, List<T>> Group<TKey>(Func<T, TKey> key) where TKey : notnull { return null; }
+
+        private class Node { public T Value { get; set; } }
+    }
+
+    public record Point(int X, int Y);
+    public delegate void Changed(object sender, EventArgs e);
+    public enum Status { Active = 1, Deleted }
+    public interface IRepository<T> { T Get(int id); void Save(T item); }
+}
+"""
+
+PROJECT = [
+    {"filename": "Models/BaseEntity.cs", "content": "namespace Shop.Models { public abstract class BaseEntity { public int Id { get; set; } } }"},
+    {
+        "filename": "Models/Product.cs",
+        "content": "namespace Shop.Models { public class Product : BaseEntity, IComparable<Product> { public string Name { get; set; } } }",
+    },
+    {"filename": "Data/IRepository.cs", "content": "namespace Shop.Data { public interface IRepository<T> { T Get(int id); void Save(T item); } }"},
+    {
+        "filename": "Data/ProductRepository.cs",
+        "content": "using Shop.Models;\nnamespace Shop.Data { public class ProductRepository : IRepository<Product> "
+        "{ public Product Get(int id) { return null; } public void Save(Product item) { } } }",
+    },
+    {"filename": "Other/Color.cs", "content": "namespace Shop.Other { public enum Color { Red } }"},
+]
+
+
+def types_by_name(index):
+    return {type_info["name"]: type_info for type_info in index["types"]}
+
+
+def test_index_declarations_and_usings():
+    index = index_csharp_file("Repo.cs", REPOSITORY)
+    types = types_by_name(index)
+
+    assert index["namespaces"] == ["MyApp.Data"]
+    assert index["usings"] == ["System", "System.Collections.Generic", "MyApp.Core.Thing"]
+    assert set(types) == {"Repository", "Node", "Point", "Changed", "Status", "IRepository"}
+    assert types["Point"]["kind"] == "record"
+    assert types["Changed"]["kind"] == "delegate"
+    assert types["Status"]["fields"] == ["Active", "Deleted"]
+    assert types["IRepository"]["methods"] == ["T Get(int id)", "void Save(T item)"]
+    assert all(type_info["namespace"] == "MyApp.Data" for type_info in index["types"])
+
+
+def test_nested_generic_bases_and_members():
+    repository = types_by_name(index_csharp_file("Repo.cs", REPOSITORY))["Repository"]
+
+    # 제네릭 인자 안의 ',' 와 where 절은 기반 타입 목록을 나누지 않음
+    assert repository["bases"] == ["BaseRepository", "IRepository", "IDisposable"]
+    assert repository["fields"] == ["private const string Brace", "private readonly List<T> _items"]
+    assert repository["properties"] == ["public int Count", "public string Name"]
+    assert repository["methods"] == [
+        "public Repository(ILogger logger) : base(logger)",
+        "public Dictionary<string, List<T>> Group<TKey>(Func<T, TKey> key) where TKey : notnull",
+    ]
+    assert {"ILogger", "Dictionary", "Func"} <= repository["references"]
+
+
+def test_braces_in_comments_and_strings_do_not_break_blocks():
+    # 문자열/주석의 중괄호를 세면 Node 가 Repository 밖으로 밀려나거나 Status 가 빠짐
+    types = types_by_name(index_csharp_file("Repo.cs", REPOSITORY))
+
+    assert types["Node"]["properties"] == ["public T Value"]
+    assert "Status" in types
+
+
+def test_file_scoped_namespace():
+    index = index_csharp_file("C.cs", "namespace A.B;\npublic class C : D { }\n")
+
+    assert index["namespaces"] == ["A.B"]
+    assert index["types"][0]["namespace"] == "A.B"
+    assert index["types"][0]["bases"] == ["D"]
+
+
+def test_project_context_relations():
+    context = project_context_from_index(build_symbol_index(PROJECT))
+
+    assert context["namespaces"] == ["Shop.Data", "Shop.Models", "Shop.Other"]
+    assert context["custom_types"] == ["BaseEntity", "Color", "IRepository", "Product", "ProductRepository"]
+    assert context["interfaces"] == [{"name": "IRepository", "methods": ["T Get(int id)", "void Save(T item)"]}]
+    assert context["base_classes"] == [{"name": "BaseEntity", "properties": ["public int Id"]}]
+    assert context["dependencies"] == [
+        {"from": "Product", "to": "BaseEntity", "type": "상속"},
+        {"from": "Product", "to": "IComparable", "type": "구현"},
+        {"from": "ProductRepository", "to": "IRepository", "type": "구현"},
+        {"from": "ProductRepository", "to": "Product", "type": "의존"},
+    ]
+
+
+def test_select_file_context_keeps_only_referenced_entries():
+    context = project_context_from_index(build_symbol_index(PROJECT))
+
+    selected = select_file_context(context, PROJECT[3]["content"])
+    assert selected["namespaces"] == ["Shop.Data", "Shop.Models"]
+    assert selected["custom_types"] == ["IRepository", "Product", "ProductRepository"]
+    assert [d["to"] for d in selected["dependencies"]] == ["IRepository", "Product"]
+    assert "base_classes" not in selected
+    assert select_file_context(context, "class X { }") == {}
@@ -0,0 +1,166 @@
+from csharp_rules import convert_simple_csharp
+
+POCO = """using System;
+using System.Collections.Generic;
+
+namespace MyApp.Models
+{
+    /// <summary>
+    /// 영화 정보
+    /// </summary>
+    public class Movie
+    {
+        public const int MaxTitleLength = 200;
+        private readonly List<string> _tags = new List<string>();
+
+        public int Id { get; set; } // 기본 키
+        public string Title { get; set; } = string.Empty;
+        public decimal Price { get; private set; } = 9.99m;
+        public DateTime? ReleaseDate { get; set; }
+        public bool IsActive { get; set; }
+    }
+}
+"""
+
+
+def convert(code, **options):
+    return convert_simple_csharp(code, **options)
+
+
+def string_constant(literal):
+    """문자열 상수 하나만 있는 static 클래스의 변환 결과에서 상수 값 부분"""
+    result = convert(f"public static class Texts {{ public const string Value = {literal}; }}")
+    if result is None:
+        return None
+    line = next(line for line in result["java_code"].splitlines() if "VALUE =" in line)
+    return line.split(" = ", 1)[1].rstrip(";")
+
+
+def test_poco_properties_become_fields_and_accessors():
+    result = convert(POCO)
+    java = result["java_code"]
+
+    assert result["package_declaration"] == "package myapp.models;"
+    assert "public class Movie {" in java
+    assert "public static final int MAX_TITLE_LENGTH = 200;" in java
+    assert "private final List<String> tags = new ArrayList<>();" in java
+    assert "private int id; // 기본 키" in java
+    assert 'private String title = "";' in java
+    assert 'private BigDecimal price = new BigDecimal("9.99");' in java
+    assert "private void setPrice(BigDecimal price) {" in java
+    assert "public LocalDateTime getReleaseDate() {" in java
+    assert "public boolean isActive() {" in java
+    assert "public void setActive(boolean isActive) {" in java
+    assert "import java.math.BigDecimal;" in result["imports"]
+    assert "import java.time.LocalDateTime;" in result["imports"]
+
+
+def test_poco_without_getters_setters_or_java_conventions():
+    result = convert(POCO, generate_getters_setters=False, use_java_conventions=False)
+    java = result["java_code"]
+
+    assert result["package_declaration"] == "package MyApp.Models;"
+    assert "public int Id;" in java
+    assert "public boolean IsActive;" in java
+    assert "getId" not in java
+
+
+def test_enum_with_explicit_values_gets_value_constructor():
+    result = convert("public enum MovieStatus { Draft = 1, Published, Archived = 10 }")
+    java = result["java_code"]
+
+    assert "DRAFT(1)," in java
+    assert "PUBLISHED(2)," in java
+    assert "ARCHIVED(10);" in java
+    assert "public int getValue() {" in java
+
+
+def test_plain_enum():
+    result = convert("public enum Color { Red, Green, Blue }")
+
+    assert result["java_code"] == "public enum Color {\n    RED,\n    GREEN,\n    BLUE\n}\n"
+
+
+def test_interface_methods_properties_and_generics():
+    result = convert(
+        """using System.Threading.Tasks;
+using System.Collections.Generic;
+
+public interface IRepository<T>
+{
+    Task<T> GetByIdAsync(int id);
+    Task<IEnumerable<T>> GetAllAsync();
+    int Count { get; }
+    TResult Map<TResult>(T item);
+}
+"""
+    )
+    java = result["java_code"]
+
+    assert "public interface IRepository<T> {" in java
+    assert "CompletableFuture<T> getByIdAsync(int id);" in java
+    assert "CompletableFuture<List<T>> getAllAsync();" in java
+    assert "int getCount();" in java
+    assert "<TResult> TResult map(T item);" in java
+
+
+def test_static_class_becomes_final_class_with_private_constructor():
+    result = convert(
+        """public static class Roles
+{
+    public const string Admin = "Admin";
+    public static readonly int MaxUsers = 100;
+}"""
+    )
+    java = result["java_code"]
+
+    assert "public final class Roles {" in java
+    assert 'public static final String ADMIN = "Admin";' in java
+    assert "public static final int MAX_USERS = 100;" in java
+    assert "private Roles() {" in java
+
+
+def test_unsupported_syntax_falls_back_to_llm():
+    # 메서드 본문, 특성, 생성자, 알 수 없는 타입은 AI 변환 대상
+    assert convert("public class A { public int Get() { return 1; } }") is None
+    assert convert("public class A { [Required] public string Name { get; set; } }") is None
+    assert convert("public class A { public A() { } }") is None
+    assert convert("public class A { public Unknown Value { get; set; } }") is None
+
+
+def test_accessor_collisions_fall_back_to_llm():
+    # IsOpen 속성의 isOpen() 과 Open 속성의 getter 가 같은 이름이 되는 경우
+    assert convert("public class A { public bool IsOpen { get; set; } public bool Open { get; set; } }") is None
+    # 인터페이스 속성 getter 와 같은 시그니처의 메서드
+    assert convert("public interface IA { int Count { get; } int GetCount(); }") is None
+    # 제네릭 인자만 다른 오버로드는 Java 에서 같은 시그니처
+    assert convert("using System.Collections.Generic;\npublic interface IA { void Add(List<int> a); void Add(List<string> a); }") is None
+
+
+def test_plain_string_escapes_are_kept():
+    assert string_constant(r'"a\tb\n\"c\"\\"') == r'"a\tb\n\"c\"\\"'
+
+
+def test_escapes_missing_in_java_are_translated():
+    assert string_constant(r'"\a\v\e"') == r'"\007\013\033"'
+    # \0 뒤의 숫자가 8진수로 이어지지 않도록 3자리로 변환
+    assert string_constant(r'"\01"') == r'"\0001"'
+    assert string_constant(r'"\x41\x7F"') == r'"\101\177"'
+    assert string_constant(r'"\u00e9\u4e2d"') == r'"\351\u4e2d"'
+    assert string_constant(r'"\U0001F600"') == r'"\ud83d\ude00"'
+    # Java 가 소스를 읽기 전에 푸는 \u000a 같은 줄바꿈 이스케이프는 만들지 않음
+    assert string_constant(r'"\u000a\x0D"') == r'"\012\015"'
+
+
+def test_char_literal_escapes():
+    result = convert(r"public static class Chars { public const char Bell = '\a'; public const char Tab = '\t'; }")
+
+    assert r"public static final char BELL = '\007';" in result["java_code"]
+    assert r"public static final char TAB = '\t';" in result["java_code"]
+
+
+def test_unsupported_literals_fall_back_to_llm():
+    assert string_constant(r'"\q"') is None
+    assert string_constant('@"C:\\temp"') is None
+    assert string_constant('$"{1}"') is None
+    assert convert(r"public static class Chars { public const char Smile = '\U0001F600'; }") is None
@@ -0,0 +1,141 @@
+from java_syntax import check_java_syntax, close_open_blocks, find_broken_members, fragment_errors, replace_members
+
+VALID = '''package com.example;
+
+import java.util.*;
+
+public class Repo<T extends Comparable<? super T>> {
+    private final Map<String, List<Map<Integer, T>>> groups = new HashMap<>();
+
+    public <K> Map<K, List<T>> group(Function<T, K> key) {
+        String brace = "}{";
+        char open = '{';
+        // }
+        return null;
+    }
+}
+'''
+
+# 메서드가 일찍 닫혀 return 문이 클래스 본문으로 밀려난 코드
+EARLY_CLOSE = '''public class A {
+    public void f() {
+        int x = 1;
+        }
+        return;
+    }
+
+    public void g() {
+    }
+}
+'''
+
+# 잘린 메서드 뒤에 다음 메서드가 이어지는 코드
+UNFINISHED = '''public class A {
+    public void f() {
+    }
+
+    public void g() {
+        int y = 2;
+
+    public void h() {
+    }
+}
+'''
+
+
+def test_nested_generics_strings_and_comments_are_valid():
+    # '>>' 나 문자열/문자/주석 안의 괄호를 구조 오류로 보지 않음
+    assert check_java_syntax(VALID) == []
+
+
+def test_unclosed_brace():
+    errors = check_java_syntax("public class A {\n    void f() {\n        int x = 1;\n")
+
+    assert errors == [{"line": 2, "message": "'{' 가 파일 끝까지 닫히지 않았습니다 (코드가 잘렸을 수 있습니다)"}]
+
+
+def test_extra_closing_brace():
+    errors = check_java_syntax("public class A {\n    void f() {\n    }\n}\n}\n")
+
+    assert errors == [{"line": 5, "message": "'}' 에 맞는 여는 괄호가 없습니다"}]
+
+
+def test_mismatched_brackets():
+    errors = check_java_syntax("public class A {\n    void f() { g(; }\n}\n")
+
+    assert errors == [{"line": 2, "message": "2번째 줄의 '(' 가 닫히지 않은 채 '}' 가 나왔습니다"}]
+
+
+def test_unclosed_string_and_comment():
+    assert check_java_syntax('public class A {\n    String s = "abc;\n}\n') == [
+        {"line": 2, "message": "문자열이 닫히지 않았습니다"}
+    ]
+    assert check_java_syntax("public class A {\n    /* open\n}\n") == [
+        {"line": 2, "message": "주석(/*)이 닫히지 않았습니다"}
+    ]
+
+
+def test_code_outside_type_declaration():
+    messages = [error["message"] for error in check_java_syntax("int x = 1;\n")]
+
+    assert messages == ["타입 선언 밖에 코드가 있습니다", "클래스/인터페이스/enum 선언이 없습니다"]
+
+
+def test_statement_outside_method():
+    errors = check_java_syntax("public class A {\n    void f() {\n    }\n    return;\n}\n")
+
+    assert errors == [{"line": 4, "message": "메서드 밖에 문장이 있습니다"}]
+
+
+def test_find_broken_members_early_close():
+    members = find_broken_members(EARLY_CLOSE)
+
+    assert len(members) == 1
+    member = members[0]
+    assert (member["start"], member["end"]) == (1, 6)
+    assert member["error"] == "닫는 괄호가 여는 괄호보다 많습니다"
+    assert member["type_header"] == "public class A"
+    assert member["indent"] == "    "
+
+
+def test_find_broken_members_unfinished_member():
+    members = find_broken_members(UNFINISHED)
+
+    assert [(member["start"], member["end"], member["error"]) for member in members] == [
+        (4, 6, "멤버가 닫히지 않은 채 다음 선언이 시작됩니다")
+    ]
+
+
+def test_find_broken_members_valid_code():
+    assert find_broken_members(VALID) == []
+
+
+def test_replace_members_indents_dedented_fragment():
+    member = find_broken_members(EARLY_CLOSE)[0]
+    fixed = replace_members(EARLY_CLOSE, [(member, "public void f() {\n    int x = 1;\n    return;\n}")])
+
+    assert check_java_syntax(fixed) == []
+    assert fixed.split("\n")[1:5] == ["    public void f() {", "        int x = 1;", "        return;", "    }"]
+
+
+def test_replace_members_keeps_indented_fragment():
+    member = find_broken_members(UNFINISHED)[0]
+    fixed = replace_members(UNFINISHED, [(member, "    public void g() {\n        int y = 2;\n    }\n")])
+
+    assert check_java_syntax(fixed) == []
+    assert "    public void g() {\n        int y = 2;\n    }\n\n    public void h() {" in fixed
+
+
+def test_close_open_blocks():
+    truncated = "public class A {\n    void f() {\n        x();\n    }\n"
+
+    assert close_open_blocks(truncated) == truncated + "}\n"
+    # 괄호/소괄호가 열린 채 잘린 코드는 그대로 둠
+    assert close_open_blocks("public class A {\n    void f(\n") == "public class A {\n    void f(\n"
+    assert close_open_blocks(VALID) == VALID
+
+
+def test_fragment_errors():
+    assert fragment_errors("void f() {\n}\n") is None
+    assert fragment_errors("void f() {\n") == "'{' 가 파일 끝까지 닫히지 않았습니다 (코드가 잘렸을 수 있습니다)"
+    assert fragment_errors('String s = "x;') == "문자열이 닫히지 않았습니다"
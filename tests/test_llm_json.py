@@ -0,0 +1,81 @@
+from conversion_core import TRUNCATED_WARNING, parse_json_response
+from llm_json import PARSE_FAILED, PARSE_OK, PARSE_REPAIRED, PARSE_TRUNCATED, extract_json_object
+
+DEFAULT_RESPONSE = {"java_code": "", "warnings": ["파싱 실패"], "notes": ""}
+
+
+def test_plain_and_fenced_objects():
+    assert extract_json_object('{"java_code": "class A {}", "warnings": []}') == (
+        {"java_code": "class A {}", "warnings": []},
+        PARSE_OK,
+    )
+    text = 'Here you go:\n```json\n{"java_code": "x", "warnings": ["w"]}\n```\nThanks'
+    assert extract_json_object(text) == ({"java_code": "x", "warnings": ["w"]}, PARSE_OK)
+
+
+def test_first_balanced_object_wins():
+    assert extract_json_object('{"a": 1} trailing {"b": 2}') == ({"a": 1}, PARSE_OK)
+
+
+def test_braces_and_escaped_quotes_inside_strings():
+    text = '{"java_code": "System.out.println(\\"{\\");", "warnings": []}'
+    assert extract_json_object(text) == ({"java_code": 'System.out.println("{");', "warnings": []}, PARSE_OK)
+
+
+def test_raw_newline_in_string():
+    assert extract_json_object('{"java_code": "line1\nline2"}') == ({"java_code": "line1\nline2"}, PARSE_OK)
+
+
+def test_unescaped_quotes_are_repaired():
+    text = '{"java_code": "String s = "hi";", "warnings": []}'
+    assert extract_json_object(text) == ({"java_code": 'String s = "hi";', "warnings": []}, PARSE_REPAIRED)
+
+
+def test_invalid_escape_is_repaired():
+    assert extract_json_object('{"java_code": "a\\d+b"}') == ({"java_code": "a\\d+b"}, PARSE_REPAIRED)
+
+
+def test_unterminated_string_is_closed():
+    # max_tokens 로 문자열 중간에서 잘린 응답
+    assert extract_json_object('{"java_code": "class A { void f() {') == (
+        {"java_code": "class A { void f() {"},
+        PARSE_TRUNCATED,
+    )
+
+
+def test_truncated_inside_array():
+    text = '{"java_code": "class A {}", "warnings": ["a", "b'
+    assert extract_json_object(text) == ({"java_code": "class A {}", "warnings": ["a", "b"]}, PARSE_TRUNCATED)
+
+
+def test_truncated_after_key():
+    assert extract_json_object('{"java_code": "x", "notes"') == ({"java_code": "x", "notes": None}, PARSE_TRUNCATED)
+    assert extract_json_object('{"java_code": "x", "notes":') == ({"java_code": "x", "notes": None}, PARSE_TRUNCATED)
+
+
+def test_unclosed_fence_with_truncated_object():
+    assert extract_json_object('```json\n{"java_code": "x"') == ({"java_code": "x"}, PARSE_TRUNCATED)
+
+
+def test_no_object():
+    assert extract_json_object("no json here") == (None, PARSE_FAILED)
+    assert extract_json_object("") == (None, PARSE_FAILED)
+    assert extract_json_object(None) == (None, PARSE_FAILED)
+
+
+def test_parse_json_response_fills_missing_fields():
+    result = parse_json_response('{"java_code": "x"}', DEFAULT_RESPONSE)
+
+    # 파싱 실패 안내 경고는 성공한 응답에 넣지 않음
+    assert result == {"java_code": "x", "warnings": [], "notes": ""}
+
+
+def test_parse_json_response_marks_truncated():
+    result = parse_json_response('{"java_code": "x", "warnings": ["w"', DEFAULT_RESPONSE)
+
+    assert result["java_code"] == "x"
+    assert result["warnings"] == ["w", TRUNCATED_WARNING]
+
+
+def test_parse_json_response_returns_default_on_failure():
+    assert parse_json_response("garbage", DEFAULT_RESPONSE) is DEFAULT_RESPONSE